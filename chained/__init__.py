@@ -1,5 +1,12 @@
-from collections import deque
-from itertools import islice, chain, zip_longest, starmap, count
+from array import array
+from collections import abc, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from heapq import nlargest, nsmallest
+from itertools import islice, chain, zip_longest
+from numbers import Number
+from os import PathLike
+from random import Random
 from types import GeneratorType, TracebackType, CodeType, FrameType
 from typing import (
 
@@ -11,18 +18,24 @@ from typing import (
 
     # Abstract base classes
     Type,
+    Awaitable,
+    AsyncIterable,
+    AsyncIterator,
     Callable,
     Iterable,
     Iterator,
     Generator,
     Reversible,
     Sequence,
+    Mapping,
+    AbstractSet,
 
     # Abstract generic types
     Generic,
 
     # Concrete generic types
     Dict,
+    List,
     Tuple,
 
     # Decorators and functions
@@ -30,7 +43,53 @@ from typing import (
 
 )
 
-from chained.functions import flat, filter_map, compose_map, compose_filter, cleandoc_deco
+from chained.abc_solver import TypeCache, resolve_abstract_bases
+from chained.functions import flat, compose_map, compose_filter, cleandoc_deco
+from chained.functions.aggregates import STATISTICS, aggregate
+from chained.functions.asynchronous import (
+    AsyncIterableWrapper,
+    achunks,
+    aclose,
+    aenumerate,
+    afilter,
+    aislice,
+    amap,
+    as_async_iterator,
+    azip
+)
+from chained.functions.batches import ARRAY, NUMPY, array_batches, filter_batch, numpy_batches, reduce_batches
+from chained.functions.files import MappedRecords, StructRecords
+from chained.functions.digests import TDIGEST, KLLSketch, TDigest, make_digest
+from chained.functions.fused import MAP, STARMAP, FILTER, FILTER_MAP, INSPECT, SLICE, apply_stages, set_fusion
+from chained.functions.grouping import NO_INITIAL, check_max_keys, count_by, group_by, reduce_by_key
+from chained.functions.parallel import (
+    check_workers,
+    chunked,
+    default_thread_workers,
+    default_workers,
+    filter_chunk,
+    map_chunk,
+    pool_map,
+    starmap_chunk
+)
+from chained.functions.plan import LogicalPlan, normalize_slice
+from chained.functions.progression import ArithmeticProgression, GeometricProgression, Recurrence
+from chained.functions.ranges import (
+    affine_coefficients,
+    filter_range,
+    map_range,
+    modulo_condition,
+    solve_congruence
+)
+from chained.functions.sampling import reservoir_sample, sample_by, weighted_sample
+from chained.functions.selection import batch_top_k, running_top_k
+from chained.functions.sketches import HyperLogLog, SpaceSaving, capacity_for
+from chained.functions.sorting import external_sort
+from chained.functions.spill import ReplayCache
+from chained.functions.textfiles import BUFFER_SIZE, WRITE_BATCH, CsvRecords, JsonLinesRecords, write_csv, write_jsonl
+from chained.functions.vectorized import can_vectorize, vectorized_map
+from chained.functions.views import SequenceView, compose_ranges
+from chained.functions.windows import rolling, rolling_batches, sliding_windows
 from chained.type_utils import *
 from chained.type_utils.meta import ChainedMeta
 from chained.type_utils.protocol import varArgCallable
@@ -40,20 +99,55 @@ __all__: Final = (
     # Classes
     'ChainIterable',
     'ChainIterator',
+    'ChainBatches',
     'ChainGenerator',
+    'ChainSequence',
+    'ChainMapping',
+    'ChainSet',
     'ChainRange',
+    'ChainCount',
+    'ChainRecords',
+    'ChainStructRecords',
+    'ChainLazySequence',
+    'ChainPlan',
+    'ChainAsyncIterable',
+    'ChainAsyncIterator',
     'Range',
 
     # Functions and decorators
     'make_chain',
     'seq',
+    'set_fusion',
     'c'
 )
 
 
-def resolve_appropriate_container(cls):
-    # TODO
-    return ChainIterable
+def resolve_appropriate_container(cls: type) -> Type['ChainIterable']:
+    """
+    Finds the chain class that provides the most efficient methods for instances of the 'cls'.
+    Results are cached in '_resolved_chain_classes' until the next ABC registration.
+
+    >>> resolve_appropriate_container(list)
+    <class 'chained.ChainSequence'>
+
+    >>> resolve_appropriate_container(frozenset)
+    <class 'chained.ChainSet'>
+
+    Args:
+        cls:  type of the iterable to wrap
+    Returns:
+        chain class
+    """
+    chain_class = _registered_chain_classes.get(cls) or _resolved_chain_classes.get(cls)
+    if chain_class is None:
+        matched_abcs = resolve_abstract_bases(cls)
+        for abc_cls, chain_class in _abc_chain_classes:
+            if any(issubclass(matched_abc, abc_cls) for matched_abc in matched_abcs):
+                break
+        else:
+            chain_class = ChainIterable
+        _resolved_chain_classes[cls] = chain_class
+    return chain_class
 
 
 class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
@@ -124,10 +218,10 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         in case of single value selection is replaced by returning ``None``.
 
         >>> ChainIterable(range(0, 20, 2))[3:].collect(tuple)
-        ChainIterable of (6, 8, 10, 12, 14, 16, 18)
+        ChainSequence of (6, 8, 10, 12, 14, 16, 18)
 
         >>> ChainIterable(range(0, 20, 2))[3::2].collect(tuple)
-        ChainIterable of (6, 10, 14, 18)
+        ChainSequence of (6, 10, 14, 18)
 
         Args:
             item:  `int` or `slice`
@@ -180,6 +274,139 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         instance._core = iterable  # type: ignore
         return instance
 
+    @staticmethod
+    def from_mmap(path: Union[str, bytes, PathLike],
+                  sep: bytes = b'\n',
+                  decode: Optional[str] = None) -> 'ChainRecords':
+        """
+        Memory-maps the file and iterates over its records separated by 'sep'.
+        Records are `bytes` split from the mapping in large blocks, or `str` if the 'decode' encoding is specified.
+        The result can be iterated several times. ``skip``, ``take`` and ``nth`` find the records
+        by scanning the mapping for separators without creating the records skipped.
+
+        >>> import os, tempfile
+        >>> with tempfile.NamedTemporaryFile('wb', delete=False) as file:
+        ...     _ = file.write(b'alpha\\nbeta\\ngamma\\n')
+        >>> ChainIterable.from_mmap(file.name, decode='ascii').skip(1).collect(list)
+        ChainSequence of ['beta', 'gamma']
+
+        >>> ChainIterable.from_mmap(file.name).nth(2)
+        b'gamma'
+
+        >>> os.remove(file.name)
+
+        Args:
+            path:    path to the file
+            sep:     record separator
+            decode:  encoding to decode the records with
+        Returns:
+            chain over the records
+        """
+        return ChainRecords._make_with_no_checks(MappedRecords(path, sep, decode))
+
+    @staticmethod
+    def from_struct(source: Any,
+                    fmt: str,
+                    batch: Optional[int] = None,
+                    *,
+                    backend: str = ARRAY) -> Union['ChainStructRecords', 'ChainIterator[Tuple]']:
+        """
+        Unpacks fixed-width binary records of a file or a buffer by the ``struct`` format 'fmt'.
+        Files are memory-mapped. ``nth``, ``skip``, ``take`` and ``slice`` compute the record offsets,
+        so they take constant time, and contiguous records are unpacked by ``Struct.iter_unpack``.
+        The records of a file own its mapping: close them by ``close`` or by the ``with`` statement,
+        see ``StructRecords.from_file``. Otherwise the mapping is closed when they are garbage-collected.
+        Buffers are owned by the caller.
+
+        >>> from struct import pack
+        >>> buffer = b''.join(pack('<qd', i, i * 0.25) for i in range(1000))
+        >>> ChainIterable.from_struct(buffer, '<qd').nth(999)
+        (999, 249.75)
+
+        >>> ChainIterable.from_struct(buffer, '<qd', batch=400).map(lambda columns: len(columns[0])).collect(list)
+        ChainSequence of [400, 400, 200]
+
+        Args:
+            source:   path to the file or C-contiguous object supporting the buffer protocol
+            fmt:      ``struct`` format of a record
+            batch:    if specified, batches of this number of records are transposed into tuples of columns
+            backend:  type of the columns: 'array' (``array.array``) or 'numpy'
+        Returns:
+            chain over the records or over the tuples of columns
+        """
+        if isinstance(source, (str, PathLike)):
+            core = StructRecords.from_file(source, fmt)
+        else:
+            core = StructRecords(source, fmt)
+        records = ChainStructRecords._make_with_no_checks(core)
+        return records if batch is None else records.columns(batch, backend=backend)
+
+    @staticmethod
+    def read_csv(path: Union[str, bytes, PathLike],
+                 columns: Optional[Sequence[Union[int, str]]] = None,
+                 types: Optional[Sequence[Callable[[str], Any]]] = None,
+                 *,
+                 header: bool = False,
+                 encoding: str = 'utf-8',
+                 buffer_size: int = BUFFER_SIZE,
+                 **fmtparams: Any) -> 'ChainIterable[Union[List[str], Tuple]]':
+        """
+        Streams the rows of a CSV file through a large read buffer. The result can be iterated several times.
+        Rows are lists of strings. If 'columns' are specified, rows are tuples of the selected fields,
+        and only these fields are passed to the 'types' converters.
+
+        >>> import os, tempfile
+        >>> with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as file:
+        ...     _ = file.write('id,name,score\\n1,alpha,0.5\\n2,beta,1.5\\n')
+        >>> ChainIterable.read_csv(file.name, ['score', 'id'], [float, int], header=True).collect(list)
+        ChainSequence of [(0.5, 1), (1.5, 2)]
+
+        >>> os.remove(file.name)
+
+        Args:
+            path:         path to the file
+            columns:      positions or, if 'header' is set, names of the columns to select
+            types:        functions converting the fields of the selected columns (of all the columns if not selected).
+                          If no columns are selected, rows with another number of fields raise ``ValueError``
+            header:       whether the first row contains column names. It is not yielded
+            encoding:     file encoding
+            buffer_size:  size of the read buffer in bytes
+            **fmtparams:  ``csv.reader`` formatting parameters: 'delimiter', 'quotechar', 'dialect', etc.
+        Returns:
+            chain over the rows
+        """
+        return ChainIterable._make_with_no_checks(
+            CsvRecords(path, columns, types, header, encoding, buffer_size, **fmtparams)
+        )
+
+    @staticmethod
+    def read_jsonl(path: Union[str, bytes, PathLike],
+                   fields: Optional[Sequence[str]] = None,
+                   *,
+                   encoding: str = 'utf-8',
+                   buffer_size: int = BUFFER_SIZE) -> 'ChainIterable[Any]':
+        """
+        Streams the values of a JSON Lines file through a large read buffer. The result can be iterated several times.
+        If 'fields' are specified, each value should be an object, and the selected fields are yielded as tuples.
+
+        >>> import os, tempfile
+        >>> with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as file:
+        ...     _ = file.write('{"id": 1, "tags": ["a"]}\\n\\n{"id": 2, "tags": []}\\n')
+        >>> ChainIterable.read_jsonl(file.name, ['id']).collect(list)
+        ChainSequence of [(1,), (2,)]
+
+        >>> os.remove(file.name)
+
+        Args:
+            path:         path to the file
+            fields:       names of the fields to select
+            encoding:     file encoding
+            buffer_size:  size of the read buffer in bytes
+        Returns:
+            chain over the values
+        """
+        return ChainIterable._make_with_no_checks(JsonLinesRecords(path, fields, encoding, buffer_size))
+
     @property
     def core(self) -> Iterable[T_co]:
         """
@@ -193,6 +420,84 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         """
         return self._core
 
+    def _par_chunks(self,
+                    chunk_function: Callable[[Callable, Iterable], Iterable],
+                    function: Callable,
+                    workers: Optional[int],
+                    chunk_size: int,
+                    ordered: bool,
+                    max_in_flight: Optional[int]) -> 'ChainIterator':
+        """Applies the 'chunk_function' to chunks of the 'self' on a process pool, flattening the results."""
+        if workers is None:
+            workers = default_workers()
+        check_workers(workers)
+        if max_in_flight is None:
+            max_in_flight = 2 * workers
+        return ChainIterator._make_with_no_checks(
+            chain.from_iterable(
+                pool_map(
+                    partial(ProcessPoolExecutor, workers),
+                    partial(chunk_function, function),
+                    chunked(self._core, chunk_size),
+                    max_in_flight,
+                    ordered,
+                    yield_preceding=True
+                )
+            )
+        )
+
+    def _thread_pool_map(self,
+                         function: Callable,
+                         workers: Optional[int],
+                         prefetch: Optional[int],
+                         ordered: bool) -> Iterator:
+        """Applies the 'function' to each element of the 'self' on a thread pool."""
+        if workers is None:
+            workers = default_thread_workers()
+        check_workers(workers)
+        if prefetch is None:
+            prefetch = 2 * workers
+        return pool_map(partial(ThreadPoolExecutor, workers), function, self._core, prefetch, ordered)
+
+    def aggregate(self,
+                  *,
+                  count: bool = False,
+                  sum: bool = False,
+                  mean: bool = False,
+                  var: bool = False,
+                  std: bool = False,
+                  min: bool = False,
+                  max: bool = False,
+                  ddof: int = 0,
+                  default: Any = None) -> Dict[str, Any]:
+        """
+        Computes several statistics of the real numbers of the 'self' in a single pass.
+        Chunks of elements are summarized in C, chunk sums are exactly rounded and compensated,
+        and chunk variances are merged by the pairwise formulas, so the results are numerically stable.
+
+        >>> ChainIterable(range(1, 11)).map(lambda v: v / 10).aggregate(sum=True, mean=True, var=True, max=True)
+        {'sum': 5.5, 'mean': 0.55, 'var': 0.0825, 'max': 1.0}
+
+        >>> ChainIterable(()).aggregate(count=True, mean=True, default=0)
+        {'count': 0, 'mean': 0}
+
+        Args:
+            count:    whether to count the elements
+            sum:      whether to compute the sum
+            mean:     whether to compute the mean
+            var:      whether to compute the variance
+            std:      whether to compute the standard deviation
+            min:      whether to find the minimum
+            max:      whether to find the maximum
+            ddof:     delta degrees of freedom: the variance is divided by ``count - ddof``
+            default:  value of the statistics that are not defined for the number of elements
+        Returns:
+            dictionary of the statistics selected (of all of them if none is selected)
+        """
+        flags = {'count': count, 'sum': sum, 'mean': mean, 'var': var, 'std': std, 'min': min, 'max': max}
+        statistics = tuple(name for name in STATISTICS if flags[name]) or STATISTICS
+        return aggregate(self._core, statistics, ddof, default)
+
     def all(self) -> bool:
         """
         Chained analogue of the built-in ``all`` function.
@@ -229,13 +534,109 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         """
         return any(self._core)
 
+    def approx_distinct(self, precision: int = 14, *, sketch: bool = False) -> Union[int, HyperLogLog]:
+        """
+        Estimates the number of distinct elements of the 'self' with a HyperLogLog sketch of ``2 ** precision`` bytes.
+        The relative standard error is about ``1.04 / sqrt(2 ** precision)``: 0.8% for the default precision.
+        Elements are hashed by their values (see ``stable_hash``), so equal numbers are counted once,
+        and sketches of strings, bytes, numbers and their tuples made in different processes can be merged.
+
+        >>> ChainIterable(range(1000)).map(lambda i: i % 100).approx_distinct()
+        100
+
+        Args:
+            precision:  number of hash bits selecting a register, from 4 to 18
+            sketch:     whether to return the mergeable sketch instead of the estimate
+        Returns:
+            estimated number of distinct elements or, if 'sketch' is set, ``HyperLogLog`` sketch
+        """
+        hyper_log_log = HyperLogLog(precision)
+        hyper_log_log.update(self._core)
+        return hyper_log_log if sketch else hyper_log_log.estimate()
+
+    def batches(self, size: int, dtype: Any = 'd', *, backend: str = ARRAY) -> 'ChainBatches':
+        """
+        Splits the numeric values of 'self' into typed columnar batches of length `size`. The last batch may be shorter.
+        Batches are ``array.array`` instances with type code 'dtype' or, if 'backend' is 'numpy',
+        NumPy arrays of data type 'dtype'.
+        Ranges and NumPy arrays are converted to NumPy batches without iterating them in Python.
+
+        >>> ChainIterable(range(5)).batches(2, 'l').collect(tuple)
+        ChainSequence of (array('l', [0, 1]), array('l', [2, 3]), array('l', [4]))
+
+        Args:
+            size:     batch size
+            dtype:    ``array.array`` type code or NumPy data type
+            backend:  'array' or 'numpy'
+        Returns:
+            iterator over the batches
+        """
+        if backend == ARRAY:
+            return ChainBatches._make_with_no_checks(array_batches(self._core, size, dtype))
+        if backend == NUMPY:
+            return ChainBatches._make_with_no_checks(numpy_batches(self._core, size, dtype))
+        raise ValueError(f"Backend should be either '{ARRAY}' or '{NUMPY}'. Got: {backend!r}")
+
+    def bottom_k(self, k: int, *, key: Optional[Callable[[T_co], Any]] = None) -> 'ChainSequence[T_co]':
+        """
+        Selects the `k` smallest elements of the 'self' with a heap of `k` elements,
+        taking O(n log k) time and O(k) memory. Of the elements with equal keys, the earlier ones are preferred.
+
+        >>> ChainIterable((5, 1, 4, 2, 3)).bottom_k(2)
+        ChainSequence of [1, 2]
+
+        Args:
+            k:    number of elements to select
+            key:  function computing the comparison key
+        Returns:
+            selected elements in the ascending order
+        """
+        return ChainSequence._make_with_no_checks(nsmallest(k, self._core, key=key))
+
+    def cache(self,
+              max_memory: Optional[int] = None,
+              spill_dir: Optional[str] = None,
+              *,
+              read_ahead: int = 1) -> 'ChainIterable[T_co]':
+        """
+        Makes a re-iterable chain recording the elements of the 'self' as they are consumed.
+        Each iteration replays the recorded elements before consuming new ones, and any number of iterations
+        (also in different threads) can be in progress at once. The elements of the 'self' are evaluated only once.
+        If 'read_ahead' exceeds 1, they are evaluated in batches, which is faster for cheap elements,
+        but makes the readers wait for a whole batch.
+
+        When the recorded elements take more than 'max_memory' bytes (estimated shallowly),
+        the oldest segments are pickled to an anonymous temporary file in the 'spill_dir'.
+
+        >>> cached = ChainIterable(range(5)).map(lambda x: print(x) or x * 2).cache()
+        >>> cached.take(2).collect(list)
+        0
+        1
+        ChainSequence of [0, 2]
+        >>> cached.len_eval()
+        2
+        3
+        4
+        5
+        >>> cached.collect(tuple)
+        ChainSequence of (0, 2, 4, 6, 8)
+
+        Args:
+            max_memory:  approximate memory budget in bytes. ``None`` means "never spill"
+            spill_dir:   directory for the spill file. ``None`` means the default temporary directory
+            read_ahead:  maximum number of elements of the 'self' evaluated at once
+        Returns:
+            re-iterable chain
+        """
+        return ChainIterable._make_with_no_checks(ReplayCache(iter(self._core), max_memory, spill_dir, read_ahead))
+
     def chain(self: 'ChainIterable[M_co]', *iterables: Iterable[M_co]) -> 'ChainIterator[M_co]':
         """
         Takes an arbitrary number of 'iterables' and creates a new iterator over the 'self'
         and over each input iterable.
 
         >>> ChainIterable((3, 4, 5)).chain((6, 7, 8), [10, 13, 14]).collect(tuple)
-        ChainIterable of (3, 4, 5, 6, 7, 8, 10, 13, 14)
+        ChainSequence of (3, 4, 5, 6, 7, 8, 10, 13, 14)
 
         Args:
             *iterables:  iterables to "extend"
@@ -254,10 +655,10 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Splits the 'self' into ``tuples`` of length `chunk_size`. Fills with 'pad_value' if necessary.
 
         >>> ChainIterable(range(10)).chunks(3).collect(tuple)
-        ChainIterable of ((0, 1, 2), (3, 4, 5), (6, 7, 8), (9,))
+        ChainSequence of ((0, 1, 2), (3, 4, 5), (6, 7, 8), (9,))
 
         >>> ChainIterable(range(10)).chunks(3, list).collect(tuple)
-        ChainIterable of ([0, 1, 2], [3, 4, 5], [6, 7, 8], [9])
+        ChainSequence of ([0, 1, 2], [3, 4, 5], [6, 7, 8], [9])
 
         Args:
             chunk_size:  size of eq_chunks
@@ -276,12 +677,16 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
     def collect(self, collector: Callable[[Iterable[T_co]], Iterable[M]]) -> 'ChainIterable[M]':
         """
         Passes 'self' to 'collector'.
+        The result is wrapped into the chain class that fits its type best, see ``make_chain``.
 
         >>> ChainIterable(range(5)).collect(list)
-        ChainIterable of [0, 1, 2, 3, 4]
+        ChainSequence of [0, 1, 2, 3, 4]
 
         >>> ChainIterable(range(0, 10, 2)).collect(tuple)
-        ChainIterable of (0, 2, 4, 6, 8)
+        ChainSequence of (0, 2, 4, 6, 8)
+
+        >>> ChainIterable('abca').collect(set).len_eval()
+        3
 
         Args:
             collector:  any callable with signature (Iterable) -> Iterable
@@ -289,8 +694,30 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             Result of this consumption wrapped in the instance of 'ChainIterable'
         """
 
-        wrapper = resolve_appropriate_container(collector) if isinstance(collector, type) else ChainIterable  # TODO
-        return wrapper(collector(self._core))
+        return make_chain(collector(self._core))
+
+    def count_by(self,
+                 key: Optional[Callable[[T_co], T]] = None,
+                 *,
+                 max_keys: Optional[int] = None,
+                 spill_dir: Optional[str] = None) -> 'ChainIterator[Tuple[T, int]]':
+        """
+        Counts the elements of the 'self' by key in a hash table. The table is built on the first iteration.
+        If 'max_keys' is specified, only that many keys are kept in memory at once,
+        the elements with new keys are spilled to disk partitioned by hash and counted afterwards.
+
+        >>> ChainIterable(('apple', 'avocado', 'banana')).count_by(lambda word: word[0]).collect(dict)
+        ChainMapping of {'a': 2, 'b': 1}
+
+        Args:
+            key:        function computing the key of an element. ``None`` means the element itself
+            max_keys:   maximum number of keys kept in memory at once. ``None`` means "unlimited"
+            spill_dir:  directory for the spill files. ``None`` means the default temporary directory
+        Returns:
+            iterator over the (key, number of elements) pairs
+        """
+        check_max_keys(max_keys)
+        return ChainIterator._make_with_no_checks(count_by(self._core, key, max_keys, spill_dir))
 
     def enumerate(self,
                   init_value: int = 0) -> 'ChainIterator[Tuple[int, T_co]]':
@@ -298,7 +725,7 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Creates an iterator which gives the current iteration count as well as the next value.
 
         >>> ChainIterable(range(3, 6)).enumerate(1).collect(tuple)
-        ChainIterable of ((1, 3), (2, 4), (3, 5))
+        ChainSequence of ((1, 3), (2, 4), (3, 5))
 
         Args:
             init_value:  initial value to count from
@@ -312,7 +739,7 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Splits the 'self' into tuples of length `chunk_size`.
 
         >>> ChainIterable(range(10)).eq_chunks(3).collect(tuple)
-        ChainIterable of ((0, 1, 2), (3, 4, 5), (6, 7, 8))
+        ChainSequence of ((0, 1, 2), (3, 4, 5), (6, 7, 8))
 
         Args:
             chunk_size:  size of chunk
@@ -328,7 +755,7 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Splits the 'self' into ``tuples`` of length `chunk_size`. Fills with 'pad_value' if necessary.
 
         >>> ChainIterable(range(10)).eq_chunks_with_pad(3, 'pad').collect(tuple)
-        ChainIterable of ((0, 1, 2), (3, 4, 5), (6, 7, 8), (9, 'pad', 'pad'))
+        ChainSequence of ((0, 1, 2), (3, 4, 5), (6, 7, 8), (9, 'pad', 'pad'))
 
         Args:
             chunk_size:  size of eq_chunks
@@ -346,19 +773,19 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
     def filter(self, *predicates: Callable[[T_co], bool]) -> 'ChainIterator[T_co]':
         """
         Filters values of 'self', applying 'predicates' from left to right in a lazy manner.
+        Several predicates are fused into a single generator, see ``set_fusion``.
 
         >>> ChainIterable(range(10)).filter(lambda x: x > 3, lambda x: x < 8).collect(tuple)
-        ChainIterable of (4, 5, 6, 7)
+        ChainSequence of (4, 5, 6, 7)
 
         Args:
             *predicates:  predicates to apply
         Returns:
              resulting iterator
         """
-        iterator = iter(self._core)
-        for pred in predicates:
-            iterator = filter(pred, iterator)
-        return ChainIterator._make_with_no_checks(iterator)
+        return ChainIterator._make_with_no_checks(
+            apply_stages(self._core, [(FILTER, pred) for pred in predicates])
+        )
 
     def filter_map(self,
                    function: Callable[[T_co], M_co],
@@ -369,12 +796,12 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         the iterator will yield the result.
 
         >>> ChainIterable((1, 3, 4, 0, 0, 2)).filter_map(lambda x: round(1 / x, 3), ZeroDivisionError).collect(tuple)
-        ChainIterable of (1.0, 0.333, 0.25, 0.5)
+        ChainSequence of (1.0, 0.333, 0.25, 0.5)
 
         >>> ChainIterable(('1', '0', '0', '2', 'ef'))                                         \
                 .filter_map(lambda x: round(1 / int(x), 3), (ValueError, ZeroDivisionError))  \
                 .collect(tuple)
-        ChainIterable of (1.0, 0.5)
+        ChainSequence of (1.0, 0.5)
 
         Args:
             function:     function to map
@@ -382,7 +809,7 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Returns:
             resulting iterator
         """
-        return ChainIterator._make_with_no_checks(filter_map(function, self._core, exceptions))
+        return ChainIterator._make_with_no_checks(apply_stages(self._core, ((FILTER_MAP, function, exceptions),)))
 
     def first(self, default: Any = None) -> Optional[T_co]:
         """
@@ -405,10 +832,10 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Does not flatten ``str``, ``bytes`` and ``bytearray``.
 
         >>> ChainIterable([3, 4, 5, (6, 7, 8, [9, 10, [11], 12], 13)]).flat().collect(tuple)
-        ChainIterable of (3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13)
+        ChainSequence of (3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13)
 
         >>> ChainIterable([3, 4, 5, (6, 7, 8, [9, '10', [11], '12'], 13)]).flat().collect(tuple)
-        ChainIterable of (3, 4, 5, 6, 7, 8, 9, '10', 11, '12', 13)
+        ChainSequence of (3, 4, 5, 6, 7, 8, 9, '10', 11, '12', 13)
 
         Returns:
             resulting iterator
@@ -431,6 +858,55 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         """
         deque(map(function, self._core), 0)
 
+    def group_by(self,
+                 key: Callable[[T_co], T],
+                 *,
+                 max_keys: Optional[int] = None,
+                 spill_dir: Optional[str] = None) -> 'ChainIterator[Tuple[T, List[T_co]]]':
+        """
+        Groups the elements of the 'self' into lists by key in a hash table. The input does not have to be sorted.
+        The table is built on the first iteration. If 'max_keys' is specified, only that many groups
+        are kept in memory at once, the elements with new keys are spilled to disk partitioned by hash
+        and grouped afterwards.
+
+        >>> ChainIterable(range(6)).group_by(lambda x: x % 2).collect(dict)
+        ChainMapping of {0: [0, 2, 4], 1: [1, 3, 5]}
+
+        Args:
+            key:        function computing the key of an element
+            max_keys:   maximum number of keys kept in memory at once. ``None`` means "unlimited"
+            spill_dir:  directory for the spill files. ``None`` means the default temporary directory
+        Returns:
+            iterator over the (key, group) pairs
+        """
+        check_max_keys(max_keys)
+        return ChainIterator._make_with_no_checks(group_by(self._core, key, max_keys, spill_dir))
+
+    def heavy_hitters(self,
+                      k: int,
+                      epsilon: float = 0.001,
+                      *,
+                      sketch: bool = False) -> Union['ChainSequence[Tuple[T_co, int]]', SpaceSaving]:
+        """
+        Finds the most frequent elements of the 'self' with a Space-Saving summary of ``ceil(1 / epsilon)`` counters.
+        Every element occurring more than ``epsilon * n`` times is counted,
+        and the counts are overestimated by at most ``epsilon * n``, where 'n' is the number of elements.
+
+        >>> ChainIterable('mississippi').heavy_hitters(2, epsilon=0.25)
+        ChainSequence of [('i', 4), ('s', 4)]
+
+        Args:
+            k:        number of elements to select
+            epsilon:  maximum overestimation of the counts relative to the number of elements
+            sketch:   whether to return the mergeable summary instead of the selected elements
+        Returns:
+            (element, estimated count) pairs in the descending order of the counts or,
+            if 'sketch' is set, ``SpaceSaving`` summary
+        """
+        summary = SpaceSaving(capacity_for(epsilon))
+        summary.update(self._core)
+        return summary if sketch else ChainSequence._make_with_no_checks(summary.top(k))
+
     def inspect(self, callback: Callable[[T_co], Any]) -> 'ChainIterator[T_co]':
         """
         Does something with each element of the 'self', passing the values on.
@@ -439,19 +915,14 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         0
         1
         2
-        ChainIterable of (1, 2, 3)
+        ChainSequence of (1, 2, 3)
 
         Args:
             callback:  function to call
         Returns:
             resulting iterator
         """
-
-        def inspector(x):
-            callback(x)
-            return x
-
-        return ChainIterator._make_with_no_checks(map(inspector, self._core))
+        return ChainIterator._make_with_no_checks(apply_stages(self._core, ((INSPECT, callback),)))
 
     def iter(self) -> 'ChainIterator[T_co]':
         """
@@ -496,6 +967,23 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         """
         return ChainIterable._make_with_no_checks(deque(self._core, n))
 
+    def lazy(self) -> 'ChainPlan[T_co]':
+        """
+        Switches the chain into the deferred plan mode.
+        Subsequent stages are recorded instead of being applied immediately
+        and are rewritten before the execution: ``skip``, ``take``, ``slice``, ``step_by`` and indexing
+        are pushed below ``map`` and ``starmap`` into ``range`` and ``Sequence`` sources.
+
+        Be careful: functions passed to ``map`` and ``starmap`` are not called for the elements sliced away.
+
+        >>> ChainRange(10 ** 9).lazy().map(lambda x: x * 2).skip(10 ** 8).take(3).collect(tuple)
+        ChainSequence of (200000000, 200000002, 200000004)
+
+        Returns:
+            `ChainPlan` over the 'self'
+        """
+        return ChainPlan._make_with_no_checks(LogicalPlan(self._core))
+
     def len_eval(self) -> int:
         """
         Evaluates the 'self', counting the number of iterations.
@@ -512,14 +1000,16 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         return 0
 
     @overload
-    def map(self, func: Callable[[T_co], T], /) -> 'ChainIterator[T]':
+    def map(self, func: Callable[[T_co], T], /, *, batch_size: Optional[int] = None) -> 'ChainIterator[T]':
         pass
 
     @overload
     def map(self,
             func: Callable[[T_co], T],
             f0: Callable[[T], T1],
-            /) -> 'ChainIterator[T1]':
+            /,
+            *,
+            batch_size: Optional[int] = None) -> 'ChainIterator[T1]':
         pass
 
     @overload
@@ -527,7 +1017,9 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             func: Callable[[T_co], T],
             f0: Callable[[T], T1],
             f1: Callable[[T1], T2],
-            /) -> 'ChainIterator[T2]':
+            /,
+            *,
+            batch_size: Optional[int] = None) -> 'ChainIterator[T2]':
         pass
 
     @overload
@@ -536,7 +1028,9 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             f0: Callable[[T], T1],
             f1: Callable[[T1], T2],
             f2: Callable[[T2], T3],
-            /) -> 'ChainIterator[T3]':
+            /,
+            *,
+            batch_size: Optional[int] = None) -> 'ChainIterator[T3]':
         pass
 
     @overload
@@ -546,7 +1040,9 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             f1: Callable[[T1], T2],
             f2: Callable[[T2], T3],
             f3: Callable[[T3], T4],
-            /) -> 'ChainIterator[T4]':
+            /,
+            *,
+            batch_size: Optional[int] = None) -> 'ChainIterator[T4]':
         pass
 
     @overload
@@ -557,7 +1053,9 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             f2: Callable[[T2], T3],
             f3: Callable[[T3], T4],
             f4: Callable[[T4], T5],
-            /) -> 'ChainIterator[T5]':
+            /,
+            *,
+            batch_size: Optional[int] = None) -> 'ChainIterator[T5]':
         pass
 
     @overload
@@ -569,7 +1067,9 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             f3: Callable[[T3], T4],
             f4: Callable[[T4], T5],
             f5: Callable[[T5], T6],
-            /) -> 'ChainIterator[T6]':
+            /,
+            *,
+            batch_size: Optional[int] = None) -> 'ChainIterator[T6]':
         pass
 
     @overload
@@ -582,7 +1082,9 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             f4: Callable[[T4], T5],
             f5: Callable[[T5], T6],
             f6: Callable[[T6], T7],
-            /) -> 'ChainIterator[T7]':
+            /,
+            *,
+            batch_size: Optional[int] = None) -> 'ChainIterator[T7]':
         pass
 
     @overload
@@ -596,7 +1098,9 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             f5: Callable[[T5], T6],
             f6: Callable[[T6], T7],
             f7: Callable[[T7], T8],
-            /) -> 'ChainIterator[T8]':
+            /,
+            *,
+            batch_size: Optional[int] = None) -> 'ChainIterator[T8]':
         pass
 
     @overload
@@ -611,7 +1115,9 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             f6: Callable[[T6], T7],
             f7: Callable[[T7], T8],
             f8: Callable[[T8], T9],
-            /) -> 'ChainIterator[T9]':
+            /,
+            *,
+            batch_size: Optional[int] = None) -> 'ChainIterator[T9]':
         pass
 
     @overload
@@ -628,30 +1134,116 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             f8: Callable[[T8], T9],
             f9: Callable[[T9], Any],
             /,
-            *f: Callable[[Any], Any]) -> 'ChainIterator':
+            *f: Callable[[Any], Any],
+            batch_size: Optional[int] = None) -> 'ChainIterator':
         pass
 
     def map(self,
             func: Callable[[T_co], T],
             /,
-            *funcs: Callable[[Any], Any]) -> 'ChainIterator':
+            *funcs: Callable[[Any], Any],
+            batch_size: Optional[int] = None) -> 'ChainIterator':
         """
         Maps functions to the values of the iterable.
         Functions are called sequentially in the the same order as they passed to the arguments.
+        Several functions are fused into a single generator and ``LambdaExpr`` bodies are inlined,
+        see ``set_fusion``.
+
+        If 'batch_size' is specified, NumPy is installed and all the functions are vectorizable ``LambdaExpr`` instances
+        (see ``LambdaExpr.vectorize``), numeric input is evaluated over arrays of 'batch_size' elements at once.
+        The results are the same as without batching: a batch is evaluated by NumPy only if no int64 overflow
+        or boolean arithmetic is possible for the magnitudes of its elements, and it is re-evaluated element by element
+        if NumPy reports an error (e.g. an overflow of floats, a division by zero or a negative integer power).
 
         >>> ChainIterable(range(10)).map(lambda x: x - 1, str).collect(tuple)
-        ChainIterable of ('-1', '0', '1', '2', '3', '4', '5', '6', '7', '8')
+        ChainSequence of ('-1', '0', '1', '2', '3', '4', '5', '6', '7', '8')
 
         Args:
-            func:    first function to map
-            *funcs:  remaining functions to map
+            func:        first function to map
+            *funcs:      remaining functions to map
+            batch_size:  number of elements to evaluate at once by NumPy
         Returns:
             resulting iterator
         """
-        iterator = map(func, self._core)
-        for func in funcs:
-            iterator = map(func, iterator)
-        return ChainIterator._make_with_no_checks(iterator)
+        funcs = (func, *funcs)
+        if batch_size is not None and can_vectorize(funcs):
+            return ChainIterator._make_with_no_checks(vectorized_map(self._core, funcs, batch_size))
+        return ChainIterator._make_with_no_checks(
+            apply_stages(self._core, [(MAP, func) for func in funcs])
+        )
+
+    def max(self, *, key: Optional[Callable[[T_co], Any]] = None, default: Any = None) -> Optional[T_co]:
+        """
+        >>> ChainIterable(['a', 'bbb', 'cc']).max(key=len)
+        'bbb'
+
+        Args:
+            key:      function computing the comparison key
+            default:  value to return if the 'self' is empty
+        Returns:
+            the largest element
+        """
+        return max(self._core, key=key, default=default)
+
+    def max_by(self, key: Callable[[T_co], Any], default: Any = None) -> Optional[T_co]:
+        """
+        >>> ChainIterable([('a', 3), ('b', 7), ('c', 5)]).max_by(lambda pair: pair[1])
+        ('b', 7)
+
+        Args:
+            key:      function computing the comparison key
+            default:  value to return if the 'self' is empty
+        Returns:
+            the first element with the largest key
+        """
+        return max(self._core, key=key, default=default)
+
+    def mean(self, default: Any = None) -> Any:
+        """
+        Computes the arithmetic mean in a single pass without storing the elements.
+
+        >>> ChainIterable(range(1, 5)).mean()
+        2.5
+
+        Args:
+            default:  value to return if the 'self' is empty
+        Returns:
+            arithmetic mean
+        """
+        total = 0
+        n = 0
+        for n, value in enumerate(self._core, 1):
+            total += value
+        return total / n if n else default
+
+    def min(self, *, key: Optional[Callable[[T_co], Any]] = None, default: Any = None) -> Optional[T_co]:
+        """
+        >>> ChainIterable((3, -1, 2)).min()
+        -1
+
+        >>> ChainIterable(()).min(default=0)
+        0
+
+        Args:
+            key:      function computing the comparison key
+            default:  value to return if the 'self' is empty
+        Returns:
+            the smallest element
+        """
+        return min(self._core, key=key, default=default)
+
+    def min_by(self, key: Callable[[T_co], Any], default: Any = None) -> Optional[T_co]:
+        """
+        >>> ChainIterable([('a', 3), ('b', 7), ('c', 5)]).min_by(lambda pair: pair[1])
+        ('a', 3)
+
+        Args:
+            key:      function computing the comparison key
+            default:  value to return if the 'self' is empty
+        Returns:
+            the first element with the smallest key
+        """
+        return min(self._core, key=key, default=default)
 
     def nth(self: 'ChainIterable[M_co]', n: int, default: Optional[M_co] = None) -> Optional[M_co]:
         """
@@ -672,6 +1264,162 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         """
         return next(islice(self._core, n, None), default)
 
+    def par_filter(self,
+                   predicate: Callable[[T_co], bool],
+                   *,
+                   workers: Optional[int] = None,
+                   chunk_size: int = 256,
+                   ordered: bool = True,
+                   max_in_flight: Optional[int] = None) -> 'ChainIterator[T_co]':
+        """
+        Parallel analogue of ``filter`` backed by a process pool. See ``par_map`` for the details.
+
+        >>> ChainIterable(('1', '', 'abc', '')).par_filter(len, workers=2).collect(tuple)
+        ChainSequence of ('1', 'abc')
+
+        Args:
+            predicate:      picklable predicate to apply
+            workers:        number of processes. Defaults to the number of CPUs
+            chunk_size:     number of elements sent to a process at once
+            ordered:        whether to preserve the order of the elements
+            max_in_flight:  maximum number of chunks being processed or waiting to be yielded. Defaults to 2 * workers
+        Returns:
+            resulting iterator
+        """
+        return self._par_chunks(filter_chunk, predicate, workers, chunk_size, ordered, max_in_flight)
+
+    def par_map(self,
+                func: Callable[[T_co], T],
+                *,
+                workers: Optional[int] = None,
+                chunk_size: int = 256,
+                ordered: bool = True,
+                max_in_flight: Optional[int] = None) -> 'ChainIterator[T]':
+        """
+        Parallel analogue of ``map`` backed by a process pool.
+        Elements are sent to the processes in chunks of 'chunk_size' and at most 'max_in_flight' chunks
+        are held in memory at once. The pool is started at the first iteration.
+        When the consumer stops iterating (e.g. after ``take``, ``first`` or ``nth``) and the iterator is discarded,
+        outstanding chunks are cancelled. If 'ordered', the results preceding a failed chunk are yielded
+        before its exception is raised. Arguments are validated eagerly.
+
+        >>> ChainIterable(range(-3, 3)).par_map(abs, workers=2, chunk_size=2).collect(tuple)
+        ChainSequence of (3, 2, 1, 0, 1, 2)
+
+        Args:
+            func:           picklable function to apply
+            workers:        number of processes. Defaults to the number of CPUs
+            chunk_size:     number of elements sent to a process at once
+            ordered:        whether to preserve the order of the elements or to yield chunks as soon as they are ready
+            max_in_flight:  maximum number of chunks being processed or waiting to be yielded. Defaults to 2 * workers
+        Returns:
+            resulting iterator
+        """
+        return self._par_chunks(map_chunk, func, workers, chunk_size, ordered, max_in_flight)
+
+    def par_starmap(self: 'ChainIterable[Iterable[M_co]]',
+                    func: Callable[..., T],
+                    *,
+                    workers: Optional[int] = None,
+                    chunk_size: int = 256,
+                    ordered: bool = True,
+                    max_in_flight: Optional[int] = None) -> 'ChainIterator[T]':
+        """
+        Parallel analogue of ``starmap`` backed by a process pool. See ``par_map`` for the details.
+
+        >>> ChainIterable(((2, 3), (3, 2), (10, 0))).par_starmap(pow, workers=2).collect(tuple)
+        ChainSequence of (8, 9, 1)
+
+        Args:
+            func:           picklable function to apply
+            workers:        number of processes. Defaults to the number of CPUs
+            chunk_size:     number of elements sent to a process at once
+            ordered:        whether to preserve the order of the elements
+            max_in_flight:  maximum number of chunks being processed or waiting to be yielded. Defaults to 2 * workers
+        Returns:
+            resulting iterator
+        """
+        return self._par_chunks(starmap_chunk, func, workers, chunk_size, ordered, max_in_flight)
+
+    def quantiles(self,
+                  qs: Sequence[float],
+                  method: str = TDIGEST,
+                  *,
+                  size: Optional[int] = None,
+                  sketch: bool = False) -> Union['ChainSequence[Any]', TDigest, KLLSketch]:
+        """
+        Estimates the quantiles of the elements of the 'self' in a single pass with bounded memory.
+        The 'tdigest' method keeps about 'size' (200 by default) centroids and is the most precise near the tails.
+        The 'kll' method keeps about ``3 * size`` (600 by default) elements, is faster
+        and bounds the rank error by about ``1.7 / size`` whatever the distribution.
+        Quantiles 0 and 1 are the exact minimum and maximum.
+
+        >>> ChainIterable(range(10_001)).quantiles((0, 0.5, 0.95, 1)).map(round).collect(list)
+        ChainSequence of [0, 5000, 9500, 10000]
+
+        Args:
+            qs:      quantiles from 0 to 1
+            method:  'tdigest' or 'kll'
+            size:    compression of the t-digest or 'k' of the KLL sketch. ``None`` means the default one
+            sketch:  whether to return the mergeable (and picklable) digest instead of the estimates
+        Returns:
+            estimates of the quantiles or, if 'sketch' is set, ``TDigest`` or ``KLLSketch`` instance
+        """
+        digest = make_digest(method, size)
+        digest.update(self._core)
+        return digest if sketch else ChainSequence._make_with_no_checks(digest.quantiles(qs))
+
+    def reduce_by_key(self,
+                      key: Callable[[T_co], T],
+                      reducer: Callable[[Any, T_co], Any],
+                      initial: Any = NO_INITIAL,
+                      *,
+                      max_keys: Optional[int] = None,
+                      spill_dir: Optional[str] = None) -> 'ChainIterator[Tuple[T, Any]]':
+        """
+        Reduces the elements of the 'self' by key in a hash table, keeping a single aggregate per key.
+        The table is built on the first iteration. If 'max_keys' is specified, only that many aggregates
+        are kept in memory at once, the elements with new keys are spilled to disk partitioned by hash
+        and reduced afterwards.
+
+        >>> ChainIterable(range(10)).reduce_by_key(lambda x: x % 3, lambda total, x: total + x, 0).collect(dict)
+        ChainMapping of {0: 18, 1: 12, 2: 15}
+
+        Args:
+            key:        function computing the key of an element
+            reducer:    function of the aggregate of a key and its next element
+            initial:    initial aggregate of every key. If omitted, the first element of a key is its initial aggregate
+            max_keys:   maximum number of keys kept in memory at once. ``None`` means "unlimited"
+            spill_dir:  directory for the spill files. ``None`` means the default temporary directory
+        Returns:
+            iterator over the (key, aggregate) pairs
+        """
+        check_max_keys(max_keys)
+        return ChainIterator._make_with_no_checks(reduce_by_key(self._core, key, reducer, initial, max_keys, spill_dir))
+
+    def rolling(self, size: int, agg: str = 'sum', *, ddof: int = 0) -> 'ChainIterator[Any]':
+        """
+        Creates an iterator over the aggregates of the sliding windows of `size` consecutive elements of the 'self',
+        updating them incrementally in O(1) per element instead of re-aggregating every window:
+        sums, means and variances are updated by the entering and the leaving elements
+        and recomputed exactly every `size` windows to discard the accumulated rounding,
+        minima and maxima are tracked in a monotonic deque.
+
+        >>> ChainIterable((4, 8, 6, -1, -2, -3, -1, 3, 4, 5)).rolling(3, 'mean').collect(list)
+        ChainSequence of [6.0, 4.333333333333333, 1.0, -2.0, -2.0, -0.3333333333333333, 2.0, 4.0]
+
+        >>> ChainIterable((4, 8, 6, -1, -2, -3, -1, 3, 4, 5)).rolling(3, 'min').collect(list)
+        ChainSequence of [4, -1, -2, -3, -3, -3, -1, 3]
+
+        Args:
+            size:  number of elements in a window
+            agg:   'sum', 'mean', 'var', 'std', 'min' or 'max'
+            ddof:  delta degrees of freedom: the variance is divided by ``size - ddof``
+        Returns:
+            iterator over the aggregates of the windows
+        """
+        return ChainIterator._make_with_no_checks(rolling(self._core, size, agg, ddof))
+
     def run(self) -> None:
         """
         Evaluates the entire 'self' and forgets about it.
@@ -688,15 +1436,94 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         # https://docs.python.org/3/library/itertools.html#itertools-recipes
         deque(self._core, 0)
 
+    def running_top_k(self, k: int, *, key: Optional[Callable[[T_co], Any]] = None) -> 'ChainIterator[List[T_co]]':
+        """
+        Keeps the `k` largest elements seen so far in a heap of `k` elements
+        and yields them in the descending order each time they change.
+
+        >>> ChainIterable((2, 9, 1, 4, 7)).running_top_k(2).collect(list)
+        ChainSequence of [[2], [9, 2], [9, 4], [9, 7]]
+
+        Args:
+            k:    number of elements to keep
+            key:  function computing the comparison key
+        Returns:
+            iterator over the updated top lists
+        """
+        return ChainIterator._make_with_no_checks(running_top_k(self._core, k, key))
+
+    def sample(self, n: int, *, seed: Optional[int] = None) -> 'ChainSequence[T_co]':
+        """
+        Selects a uniform random sample of `n` elements of the 'self' in a single pass, keeping only `n` of them.
+        Sequences (including ranges) are sampled by index without iteration. Other iterables are sampled
+        by the reservoir Algorithm L, which skips the elements between the replacements with ``itertools.islice``,
+        so that the cost of the elements that are not sampled is close to the cost of their iteration.
+
+        >>> ChainRange(10 ** 12).sample(3, seed=0)
+        ChainSequence of [44756014165, 424533559245, 978212965548]
+
+        >>> ChainIterable(iter('abc')).sample(5)
+        ChainSequence of ['a', 'b', 'c']
+
+        Args:
+            n:     sample size
+            seed:  seed of the random choices. ``None`` means an unseeded random generator
+        Returns:
+            sampled elements in their original order
+        """
+        return ChainSequence._make_with_no_checks(reservoir_sample(self._core, n, Random(seed)))
+
+    def sample_by(self,
+                  key: Callable[[T_co], T],
+                  n_per_key: int,
+                  *,
+                  seed: Optional[int] = None) -> 'ChainIterator[Tuple[T, List[T_co]]]':
+        """
+        Selects a uniform random sample of `n_per_key` elements of each key, keeping a reservoir per key.
+        The reservoirs are filled on the first iteration.
+
+        >>> ChainIterable(range(10)).sample_by(lambda x: x % 2, 5).collect(dict)
+        ChainMapping of {0: [0, 2, 4, 6, 8], 1: [1, 3, 5, 7, 9]}
+
+        Args:
+            key:        function computing the key of an element
+            n_per_key:  sample size of each key
+            seed:       seed of the random choices. ``None`` means an unseeded random generator
+        Returns:
+            iterator over the (key, sampled elements in their original order) pairs
+        """
+        return ChainIterator._make_with_no_checks(sample_by(self._core, key, n_per_key, Random(seed)))
+
+    def sample_weighted(self,
+                        n: int,
+                        weight: Callable[[T_co], float],
+                        *,
+                        seed: Optional[int] = None) -> 'ChainSequence[T_co]':
+        """
+        Selects a random sample of `n` elements of the 'self' without replacement,
+        the probabilities being proportional to the weights. Takes a single pass and keeps only `n` elements.
+
+        >>> ChainIterable(('rare', 'never', 'often')).sample_weighted(2, lambda word: 0 if word == 'never' else 1)
+        ChainSequence of ['rare', 'often']
+
+        Args:
+            n:       sample size
+            weight:  function computing the non-negative weight of an element
+            seed:    seed of the random choices. ``None`` means an unseeded random generator
+        Returns:
+            sampled elements in their original order
+        """
+        return ChainSequence._make_with_no_checks(weighted_sample(self._core, n, weight, Random(seed)))
+
     def skip(self, n: int) -> 'ChainIterator[T_co]':
         """
         Creates an iterator that skips the first `n` elements of the 'self'.
 
         >>> ChainIterable(range(10)).skip(5).collect(tuple)
-        ChainIterable of (5, 6, 7, 8, 9)
+        ChainSequence of (5, 6, 7, 8, 9)
 
         >>> ChainIterable(range(10)).skip(50).collect(tuple)
-        ChainIterable of ()
+        ChainSequence of ()
 
         Args:
             n:    number of items to skip
@@ -734,7 +1561,7 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Makes slice iterator over the 'self'.
 
         >>> ChainIterable(range(1_000))[100:200:20].collect(tuple)
-        ChainIterable of (100, 120, 140, 160, 180)
+        ChainSequence of (100, 120, 140, 160, 180)
 
         Args:
             *args:  slicing parameters: ([start,] stop[, step])
@@ -758,7 +1585,7 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Arguments (functions) of ``starmap`` are called sequentially in the the same order as they passed.
 
         >>> seq(1, ..., 10).chunks(3).starmap(lambda x, y, z: x * (y - z)).collect(tuple)
-        ChainIterable of (-1, -4, -7)
+        ChainSequence of (-1, -4, -7)
 
         Args:
             func:    first function to map
@@ -766,10 +1593,40 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Returns:
             resulting iterator
         """
-        iterator = starmap(func, self._core)
-        for func in funcs:
-            iterator = starmap(func, iterator)
-        return ChainIterator._make_with_no_checks(iterator)
+        return ChainIterator._make_with_no_checks(
+            apply_stages(self._core, [(STARMAP, func) for func in (func, *funcs)])
+        )
+
+    def sort(self,
+             *,
+             key: Optional[Callable[[T_co], Any]] = None,
+             reverse: bool = False,
+             memory_limit: Optional[int] = None,
+             spill_dir: Optional[str] = None) -> Union['ChainSequence[T_co]', 'ChainIterator[T_co]']:
+        """
+        Stably sorts the elements of the 'self'.
+        If 'memory_limit' is specified, runs of elements taking about 'memory_limit' bytes are sorted in memory
+        and spilled to an anonymous temporary file in the 'spill_dir'. The runs are k-way merged lazily.
+        If everything fits into the 'memory_limit', nothing is spilled and the result is a sorted list.
+
+        >>> ChainIterable(('bb', 'a', 'ccc', 'd')).sort(key=len, reverse=True)
+        ChainSequence of ['ccc', 'bb', 'a', 'd']
+
+        >>> ChainIterable(range(100_000, 0, -1)).sort(memory_limit=1 << 20).take(3).collect(list)
+        ChainSequence of [1, 2, 3]
+
+        Args:
+            key:           function computing the comparison key
+            reverse:       whether to sort in the descending order
+            memory_limit:  approximate memory budget in bytes (estimated shallowly). ``None`` means "unlimited"
+            spill_dir:     directory for the spill file. ``None`` means the default temporary directory
+        Returns:
+            `ChainSequence` of the sorted elements if they fit into the 'memory_limit'. Resulting iterator - otherwise
+        """
+        result = external_sort(self._core, key, reverse, memory_limit, spill_dir)
+        if isinstance(result, list):
+            return ChainSequence._make_with_no_checks(result)
+        return ChainIterator._make_with_no_checks(result)
 
     def split(self,
               n: int,
@@ -779,10 +1636,10 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         If not, the first few pieces will be 1 longer than the last few.
 
         >>> seq(1, ..., 12).split(5).collect(tuple)
-        ChainIterable of ((1, 2, 3), (4, 5), (6, 7), (8, 9), (10, 11))
+        ChainSequence of ((1, 2, 3), (4, 5), (6, 7), (8, 9), (10, 11))
 
         >>> seq(1, ..., 10).split(3).collect(tuple)
-        ChainIterable of ((1, 2, 3), (4, 5, 6), (7, 8, 9))
+        ChainSequence of ((1, 2, 3), (4, 5, 6), (7, 8, 9))
 
         >>> split_1, split_2, split_3 = seq(1, ..., 12).split(3)
 
@@ -814,7 +1671,7 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         Returns every `step`-th item of the 'self' as an iterator.
 
         >>> ChainIterable(range(10_000)).step_by(2343).collect(tuple)
-        ChainIterable of (0, 2343, 4686, 7029, 9372)
+        ChainSequence of (0, 2343, 4686, 7029, 9372)
 
         Args:
             step:  number of iterations to skip
@@ -825,12 +1682,24 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             islice(self._core, None, None, step)
         )
 
+    def sum(self, start: Any = 0) -> Any:
+        """
+        >>> ChainIterable(range(5)).sum()
+        10
+
+        Args:
+            start:  initial value
+        Returns:
+            sum of the 'start' and all the elements
+        """
+        return sum(self._core, start)
+
     def take(self, n: int) -> 'ChainIterator[T_co]':
         """
         Returns an iterator over the first `n` items of the 'self'.
 
         >>> ChainIterable(range(1_000)).take(5).collect(tuple)
-        ChainIterable of (0, 1, 2, 3, 4)
+        ChainSequence of (0, 1, 2, 3, 4)
 
         Args:
             n:    number of items
@@ -841,13 +1710,139 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
             islice(self._core, n)
         )
 
+    def thread_foreach(self,
+                       function: Callable[[T_co], Any],
+                       *,
+                       workers: Optional[int] = None,
+                       prefetch: Optional[int] = None) -> None:
+        """
+        Parallel analogue of ``foreach`` backed by a thread pool. See ``thread_map`` for the details.
+
+        >>> seen = set()
+        >>> ChainIterable(range(100)).thread_foreach(seen.add, workers=8)
+        >>> len(seen)
+        100
+
+        Args:
+            function:  function to call
+            workers:   number of threads. Defaults to min(32, number of CPUs + 4)
+            prefetch:  maximum number of calls in flight. Defaults to 2 * workers
+        Returns:
+            None
+        """
+        deque(self._thread_pool_map(function, workers, prefetch, False), 0)
+
+    def thread_map(self,
+                   func: Callable[[T_co], T],
+                   *,
+                   workers: Optional[int] = None,
+                   prefetch: Optional[int] = None,
+                   ordered: bool = True) -> 'ChainIterator[T]':
+        """
+        Parallel analogue of ``map`` backed by a thread pool. Suits I/O-bound functions that release the GIL.
+        Keeps up to 'prefetch' calls in flight. The first exception raised by any call is propagated
+        as soon as it is noticed and the calls not started yet are cancelled.
+
+        >>> ChainIterable(range(-3, 3)).thread_map(abs, workers=4).chunks(2).collect(tuple)
+        ChainSequence of ((3, 2), (1, 0), (1, 2))
+
+        Args:
+            func:      function to apply
+            workers:   number of threads. Defaults to min(32, number of CPUs + 4)
+            prefetch:  maximum number of calls being performed or waiting to be yielded. Defaults to 2 * workers
+            ordered:   whether to preserve the order of the elements or to yield results as soon as they are ready
+        Returns:
+            resulting iterator
+        """
+        return ChainIterator._make_with_no_checks(self._thread_pool_map(func, workers, prefetch, ordered))
+
+    def to_csv(self: 'ChainIterable[Iterable[Any]]',
+               path: Union[str, bytes, PathLike],
+               header: Optional[Sequence[str]] = None,
+               *,
+               encoding: str = 'utf-8',
+               buffer_size: int = BUFFER_SIZE,
+               batch_size: int = WRITE_BATCH,
+               **fmtparams: Any) -> int:
+        """
+        Evaluates the 'self' writing each element to a CSV file as a row.
+        Rows are passed to the writer in batches of `batch_size`, so memory usage does not depend on the length.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'squares.csv')
+        >>> ChainIterable(range(3)).map(lambda x: (x, x * x)).to_csv(path, ['x', 'square'])
+        3
+        >>> ChainIterable.read_csv(path, header=True).collect(list)
+        ChainSequence of [['0', '0'], ['1', '1'], ['2', '4']]
+
+        >>> os.remove(path)
+
+        Args:
+            path:         path to the file
+            header:       if specified, column names to write first
+            encoding:     file encoding
+            buffer_size:  size of the write buffer in bytes
+            batch_size:   number of rows passed to the writer at once
+            **fmtparams:  ``csv.writer`` formatting parameters
+        Returns:
+            number of rows written (excluding the header)
+        """
+        return write_csv(self._core, path, header, encoding, buffer_size, batch_size, **fmtparams)
+
+    def to_jsonl(self,
+                 path: Union[str, bytes, PathLike],
+                 *,
+                 encoding: str = 'utf-8',
+                 buffer_size: int = BUFFER_SIZE,
+                 batch_size: int = WRITE_BATCH,
+                 **dumps_kwargs: Any) -> int:
+        """
+        Evaluates the 'self' writing each element to a JSON Lines file.
+        `batch_size` encoded lines are joined into a single write, so memory usage does not depend on the length.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'values.jsonl')
+        >>> ChainIterable(range(3)).map(lambda x: {'x': x}).to_jsonl(path)
+        3
+        >>> ChainIterable.read_jsonl(path).collect(list)
+        ChainSequence of [{'x': 0}, {'x': 1}, {'x': 2}]
+
+        >>> os.remove(path)
+
+        Args:
+            path:            path to the file
+            encoding:        file encoding
+            buffer_size:     size of the write buffer in bytes
+            batch_size:      number of lines joined before a write
+            **dumps_kwargs:  ``json.JSONEncoder`` parameters. Compact separators are used by default
+        Returns:
+            number of lines written
+        """
+        return write_jsonl(self._core, path, encoding, buffer_size, batch_size, **dumps_kwargs)
+
+    def top_k(self, k: int, *, key: Optional[Callable[[T_co], Any]] = None) -> 'ChainSequence[T_co]':
+        """
+        Selects the `k` largest elements of the 'self' with a heap of `k` elements,
+        taking O(n log k) time and O(k) memory. Of the elements with equal keys, the earlier ones are preferred.
+
+        >>> ChainIterable(('kiwi', 'fig', 'banana', 'plum')).top_k(2, key=len)
+        ChainSequence of ['banana', 'kiwi']
+
+        Args:
+            k:    number of elements to select
+            key:  function computing the comparison key
+        Returns:
+            selected elements in the descending order
+        """
+        return ChainSequence._make_with_no_checks(nlargest(k, self._core, key=key))
+
     def transpose(self: 'ChainIterable[Iterable[M_co]]') -> 'ChainIterator[Tuple[M_co, ...]]':
         """
         Transposes the 'self' if it iterates over other iterables.
         Be careful: The first-order iterable will be evaluated.
 
         >>> ChainIterable([(1, 2), (3, 4), (5, 6)]).transpose().collect(tuple)
-        ChainIterable of ((1, 3, 5), (2, 4, 6))
+        ChainSequence of ((1, 3, 5), (2, 4, 6))
 
         Returns:
             zip iterator
@@ -868,13 +1863,35 @@ class ChainIterable(Generic[T_co], metaclass=ChainedMeta):
         """
         return receiver(*self._core)
 
+    def windows(self, size: int, step: int = 1) -> 'ChainIterator[Sequence[T_co]]':
+        """
+        Creates an iterator over the sliding windows of `size` consecutive elements of the 'self',
+        starting every `step` elements. With ``step == size`` the windows are tumbling (non-overlapping).
+        Incomplete windows at the end are dropped.
+        Windows are zero-copy read-only views: of the sequence itself if the 'self' is a sequence,
+        otherwise of an append-only buffer, which is replaced when full, so the earlier windows stay valid.
+
+        >>> ChainIterable(iter(range(6))).windows(3).map(list).collect(list)
+        ChainSequence of [[0, 1, 2], [1, 2, 3], [2, 3, 4], [3, 4, 5]]
+
+        >>> ChainRange(10).windows(4, 4).collect(list)
+        ChainSequence of [SequenceView([0, 1, 2, 3]), SequenceView([4, 5, 6, 7])]
+
+        Args:
+            size:  number of elements in a window
+            step:  distance between the starts of consecutive windows
+        Returns:
+            iterator over the windows
+        """
+        return ChainIterator._make_with_no_checks(sliding_windows(self._core, size, step))
+
     def zip(self: 'ChainIterable[M_co]',
             *iterables: Iterable[M_co]) -> 'ChainIterator[Tuple[M_co, ...]]':
         """
         Takes an arbitrary number of iterables and "zips up" the 'self' with them into a single iterator of tuples.
 
         >>> ChainIterable(1, 2, 3).zip((4, 5, 6), (7, 8)).collect(tuple)
-        ChainIterable of ((1, 4, 7), (2, 5, 8))
+        ChainSequence of ((1, 4, 7), (2, 5, 8))
 
         Args:
             *iterables:  iterables to "zip up"
@@ -944,6 +1961,251 @@ class ChainIterator(ChainIterable[T_co]):
         return self
 
 
+class ChainBatches(ChainIterator[Any]):
+    """Iterator over numeric batches: ``array.array`` or NumPy arrays. See ``ChainIterable.batches``"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f'ChainBatches wrapper of {self._core}'
+
+    @staticmethod
+    def _make_with_no_checks(iterator: Iterator[Any]) -> 'ChainBatches':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            iterator:  iterator over the batches to wrap around
+        Returns:
+            `ChainBatches` wrapper of the iterator
+        """
+        instance = ChainBatches.__new__(ChainBatches)
+        instance._core = iterator  # type: ignore
+        return instance
+
+    def aggregate(self,
+                  *,
+                  count: bool = False,
+                  sum: bool = False,
+                  mean: bool = False,
+                  var: bool = False,
+                  std: bool = False,
+                  min: bool = False,
+                  max: bool = False,
+                  ddof: int = 0,
+                  default: Any = None) -> Dict[str, Any]:
+        """
+        Computes several statistics of the elements of all the batches in a single pass.
+        Each batch is summarized at once (NumPy arrays are summarized by NumPy), and the summaries are merged.
+
+        >>> ChainIterable(range(10)).batches(4).aggregate(count=True, mean=True, std=True, min=True)
+        {'count': 10, 'mean': 4.5, 'std': 2.8722813232690143, 'min': 0.0}
+
+        Args:
+            count:    whether to count the elements
+            sum:      whether to compute the sum
+            mean:     whether to compute the mean
+            var:      whether to compute the variance
+            std:      whether to compute the standard deviation
+            min:      whether to find the minimum
+            max:      whether to find the maximum
+            ddof:     delta degrees of freedom: the variance is divided by ``count - ddof``
+            default:  value of the statistics that are not defined for the number of elements
+        Returns:
+            dictionary of the statistics selected (of all of them if none is selected)
+        """
+        flags = {'count': count, 'sum': sum, 'mean': mean, 'var': var, 'std': std, 'min': min, 'max': max}
+        statistics = tuple(name for name in STATISTICS if flags[name]) or STATISTICS
+        return aggregate(self._core, statistics, ddof, default, batched=True)
+
+    def bottom_k(self, k: int, *, key: Optional[Callable[[Any], Any]] = None) -> 'ChainSequence[Any]':
+        """
+        Selects the `k` smallest elements of all the batches.
+        NumPy batches are reduced to `k` candidates at a time by ``np.argpartition``.
+
+        >>> ChainIterable((5, 1, 4, 2, 3)).batches(2).bottom_k(2)
+        ChainSequence of [1.0, 2.0]
+
+        Args:
+            k:    number of elements to select
+            key:  function computing the comparison key. If specified, the elements are compared one by one
+        Returns:
+            selected elements in the ascending order
+        """
+        if key is not None:
+            return self.unbatch().bottom_k(k, key=key)
+        return ChainSequence._make_with_no_checks(batch_top_k(self._core, k, largest=False))
+
+    def filter_batches(self, *predicates: Callable[[Any], Any]) -> 'ChainBatches':
+        """
+        Filters the elements of each batch. NumPy arrays are passed to the 'predicates' at once,
+        and they should return boolean masks. ``array.array`` elements are checked one by one.
+
+        >>> ChainIterable(range(10)).batches(4, 'l').filter_batches(lambda v: v % 3 == 0).collect(list)
+        ChainSequence of [array('l', [0, 3]), array('l', [6]), array('l', [9])]
+
+        Args:
+            *predicates:  predicates to apply
+        Returns:
+            iterator over the filtered batches
+        """
+        batches = self._core
+        for pred in predicates:
+            batches = map(partial(filter_batch, pred), batches)
+        return ChainBatches._make_with_no_checks(batches)
+
+    def map_batches(self, func: Callable[[Any], Any], /, *funcs: Callable[[Any], Any]) -> 'ChainBatches':
+        """
+        Maps functions to whole batches. Note that arithmetic operators of ``array.array`` act on sequences:
+        ``batch * 2`` repeats the batch, so element-wise functions should build a new batch (or use NumPy batches).
+
+        >>> double = lambda batch: array(batch.typecode, (v * 2 for v in batch))
+        >>> ChainIterable(range(4)).batches(2, 'l').map_batches(double).collect(list)
+        ChainSequence of [array('l', [0, 2]), array('l', [4, 6])]
+
+        Args:
+            func:    first function to map
+            *funcs:  remaining functions to map
+        Returns:
+            iterator over the resulting batches
+        """
+        return ChainBatches._make_with_no_checks(compose_map(self._core, func, *funcs))
+
+    def max(self, *, key: Optional[Callable[[Any], Any]] = None, default: Any = None) -> Any:  # type: ignore
+        """
+        >>> ChainIterable((3, -1, 2)).batches(2).max()
+        3.0
+
+        Args:
+            key:      function computing the comparison key. Disables batch-wise evaluation
+            default:  value to return if there are no elements
+        Returns:
+            the largest element of all the batches
+        """
+        if key is not None:
+            return self.unbatch().max(key=key, default=default)
+        return reduce_batches(self._core, 'max', default)
+
+    def mean(self, default: Any = None) -> Any:
+        """
+        >>> ChainIterable(range(1, 5)).batches(3).mean()
+        2.5
+
+        Args:
+            default:  value to return if there are no elements
+        Returns:
+            arithmetic mean of the elements of all the batches
+        """
+        total = 0
+        n = 0
+        for batch in self._core:
+            total += reduce_batches((batch,), 'sum')
+            n += len(batch)
+        return total / n if n else default
+
+    def min(self, *, key: Optional[Callable[[Any], Any]] = None, default: Any = None) -> Any:  # type: ignore
+        """
+        >>> ChainIterable(()).batches(2).min() is None
+        True
+
+        Args:
+            key:      function computing the comparison key. Disables batch-wise evaluation
+            default:  value to return if there are no elements
+        Returns:
+            the smallest element of all the batches
+        """
+        if key is not None:
+            return self.unbatch().min(key=key, default=default)
+        return reduce_batches(self._core, 'min', default)
+
+    def quantiles(self,
+                  qs: Sequence[float],
+                  method: str = TDIGEST,
+                  *,
+                  size: Optional[int] = None,
+                  sketch: bool = False) -> Union['ChainSequence[Any]', TDigest, KLLSketch]:
+        """
+        Estimates the quantiles of the elements of all the batches in a single pass with bounded memory.
+        See ``ChainIterable.quantiles``.
+
+        >>> ChainIterable(range(101)).batches(10).quantiles((0.1, 0.5), 'kll')
+        ChainSequence of [10.0, 50.0]
+
+        Args:
+            qs:      quantiles from 0 to 1
+            method:  'tdigest' or 'kll'
+            size:    compression of the t-digest or 'k' of the KLL sketch. ``None`` means the default one
+            sketch:  whether to return the mergeable (and picklable) digest instead of the estimates
+        Returns:
+            estimates of the quantiles or, if 'sketch' is set, ``TDigest`` or ``KLLSketch`` instance
+        """
+        digest = make_digest(method, size)
+        for batch in self._core:
+            digest.update(batch)
+        return digest if sketch else ChainSequence._make_with_no_checks(digest.quantiles(qs))
+
+    def rolling(self, size: int, agg: str = 'sum', *, ddof: int = 0) -> 'ChainBatches':  # type: ignore
+        """
+        Computes the aggregates of the sliding windows of the elements of all the batches, yielding them in batches.
+        NumPy batches are aggregated by NumPy, carrying the last ``size - 1`` elements of a batch over to the next one:
+        sums, means and extrema in O(1) per element, variances window by window in O(`size`) per element.
+        Other batches are aggregated as by ``ChainIterable.rolling``.
+
+        >>> ChainIterable(range(6)).batches(3).rolling(2, 'max').collect(list)
+        ChainSequence of [array('d', [1.0, 2.0, 3.0]), array('d', [4.0, 5.0])]
+
+        Args:
+            size:  number of elements in a window
+            agg:   'sum', 'mean', 'var', 'std', 'min' or 'max'
+            ddof:  delta degrees of freedom: the variance is divided by ``size - ddof``
+        Returns:
+            iterator over the batches of the aggregates
+        """
+        return ChainBatches._make_with_no_checks(rolling_batches(self._core, size, agg, ddof))
+
+    def sum(self, start: Any = 0) -> Any:
+        """
+        >>> ChainIterable(range(5)).batches(2, 'l').sum()
+        10
+
+        Args:
+            start:  initial value
+        Returns:
+            sum of the 'start' and the elements of all the batches
+        """
+        return start + reduce_batches(self._core, 'sum')
+
+    def top_k(self, k: int, *, key: Optional[Callable[[Any], Any]] = None) -> 'ChainSequence[Any]':
+        """
+        Selects the `k` largest elements of all the batches.
+        NumPy batches are reduced to `k` candidates at a time by ``np.argpartition``.
+
+        >>> ChainIterable((5, 1, 4, 2, 3)).batches(2).top_k(2)
+        ChainSequence of [5.0, 4.0]
+
+        Args:
+            k:    number of elements to select
+            key:  function computing the comparison key. If specified, the elements are compared one by one
+        Returns:
+            selected elements in the descending order
+        """
+        if key is not None:
+            return self.unbatch().top_k(k, key=key)
+        return ChainSequence._make_with_no_checks(batch_top_k(self._core, k))
+
+    def unbatch(self) -> ChainIterator[Any]:
+        """
+        >>> ChainIterable(range(3)).batches(2, 'l').unbatch().collect(list)
+        ChainSequence of [0, 1, 2]
+
+        Returns:
+            iterator over the elements of all the batches as Python scalars
+        """
+        return ChainIterator._make_with_no_checks(
+            chain.from_iterable(batch if isinstance(batch, array) else batch.tolist() for batch in self._core)
+        )
+
+
 class ChainReversible(ChainIterable[T_co]):
     __slots__ = ()
 
@@ -1012,7 +2274,7 @@ class ChainReversible(ChainIterable[T_co]):
     def reverse(self) -> ChainIterator[T_co]:
         """
         >>> ChainReversible(2, 3, 4).reverse().collect(tuple)
-        ChainIterable of (4, 3, 2)
+        ChainSequence of (4, 3, 2)
 
         Returns:
             reversed iterator
@@ -1020,83 +2282,582 @@ class ChainReversible(ChainIterable[T_co]):
         return ChainIterator._make_with_no_checks(reversed(self._core))
 
 
-class ChainGenerator(ChainIterator[T_co], Generic[T_co, T_contra, M_co]):
-    """Wrapper object that provides convenient chain-like methods for any ``generator``."""
+class ChainSequence(ChainReversible[T_co]):
+    """Wrapper object that provides random-access chain-like methods for any sequence."""
+
     __slots__ = ()
 
-    def __init__(self, generator: Generator[T_co, T_contra, M_co]) -> None:
+    @overload
+    def __init__(self, sequence: Sequence[T_co], /) -> None:
+        pass
+
+    @overload
+    def __init__(self, sequence: T_co, /, *values: T_co) -> None:
+        pass
+
+    def __init__(self, arg1: Union[Sequence[T_co], T_co], /, *args: T_co) -> None:
         """
-        ``ChainGenerator`` is a chained analogue of the built-in ``generator`` object.
+        Wrapper object that provides random-access chain-like methods for any sequence.
+        Indexing, ``nth``, ``last``, ``len_eval`` take constant time,
+        slicing-like methods return zero-copy views of the sequence. The views are invalidated
+        by resizing the sequence, see ``SequenceView``.
+
+        Possible __init__ signatures:
+
+        (Sequence[T] | *T) -> None
+
+        >>> ChainSequence(3, 4, 5)
+        ChainSequence of (3, 4, 5)
+
+        >>> ChainSequence([3, 4, 5])
+        ChainSequence of [3, 4, 5]
 
         Args:
-            generator:  stack frame to store
+            arg1:   sequence if 'args' are not specified. Otherwise - the first value to iterate over
+            *args:  any values to iterate over
         """
-
-        if not isinstance(generator, GeneratorType):
-            if isinstance(generator, ChainGenerator):
-                generator = generator._core
-            else:
+        if not args:
+            if not isinstance(arg1, abc.Sequence):
                 raise TypeError(
-                    f'{self.__class__.__name__} does not accept non-generator instances of {type(generator)}'
+                    'Cannot initialize an instance of `ChainSequence` '
+                    f'from the instance of a non-sequence class {type(arg1)}'
                 )
+            self._core: Final[Sequence[T_co]] = arg1  # type: ignore
+        else:
+            self._core: Final[Tuple[T_co, ...]] = (arg1, *args)  # type: ignore
 
-        self._core: Final[Generator[T_co, T_contra, M_co]] = generator  # type: ignore
+    def __contains__(self, item: Any) -> bool:
+        return item in self._core
 
-    def __iter__(self) -> Iterator[T_co]:
-        return iter(self._core)
+    @overload  # type: ignore
+    def __getitem__(self, item: int) -> Optional[T_co]:
+        pass
 
-    def __next__(self) -> T_co:
-        return next(self._core)
+    @overload
+    def __getitem__(self, item: slice) -> 'ChainSequence[T_co]':
+        pass
+
+    def __getitem__(self, item: Union[int, slice]) -> Optional[Union[T_co, 'ChainSequence[T_co]']]:
+        """
+        Allows to access elements of 'self' by square brace indexing. Negative indices are supported.
+        Common use-case of throwing ``IndexError`` as a negative result of bound checking
+        in case of single value selection is replaced by returning ``None``.
+
+        >>> ChainSequence([0, 2, 4, 6, 8, 10])[-2]
+        8
+
+        >>> ChainSequence([0, 2, 4, 6, 8, 10])[10] is None
+        True
+
+        >>> ChainSequence([0, 2, 4, 6, 8, 10])[::-2]
+        ChainSequence of SequenceView([10, 6, 2])
+
+        Args:
+            item:  `int` or `slice`
+        Returns:
+            if 'item' is `slice`, zero-copy `ChainSequence` over the values selected.
+            Otherwise, single value at the position
+        """
+        if isinstance(item, slice):
+            return self._view(range(len(self._core))[item])
+        try:
+            return self._core[item]
+        except IndexError:
+            return None
+
+    def __len__(self) -> int:
+        return len(self._core)
 
     def __repr__(self) -> str:
-        return f'<ChainGenerator at {hex(id(self))}>'
+        return f'ChainSequence of {self._core}'
 
     @staticmethod
-    def _make_with_no_checks(  # type: ignore
-            generator: Generator[T_co, T_contra, M_co]) -> 'ChainGenerator[T_co, T_contra, M_co]':
+    def _make_with_no_checks(sequence: Sequence[T_co]) -> 'ChainSequence[T_co]':  # type: ignore
         """
         Makes class instance with no safety checks.
 
+        >>> ChainSequence._make_with_no_checks((2, 3, 11))
+        ChainSequence of (2, 3, 11)
+
         Args:
-            generator:  generator to wrap around
+            sequence:  sequence to wrap around
         Returns:
-            `ChainGenerator` wrapper of the generator
+            `ChainSequence` wrapper of the sequence
         """
-        instance = ChainGenerator.__new__(ChainGenerator)
-        instance._core = generator  # type: ignore
+        instance = ChainSequence.__new__(ChainSequence)
+        instance._core = sequence  # type: ignore
         return instance
 
     @property
-    def core(self) -> Generator[T_co, T_contra, M_co]:
+    def core(self) -> Sequence[T_co]:
         """
-        Internal generator access handler.
+        Internal sequence access handler.
 
         Returns:
-            Raw generator inside the 'self' instance
+            Raw sequence inside the 'self' instance
         """
         return self._core
 
-    @property
-    def gi_code(self) -> CodeType:
-        return self._core.gi_code
+    def _view(self, indices: range) -> 'ChainSequence[T_co]':
+        """Makes a zero-copy chain over the elements at the 'indices'."""
+        return ChainSequence._make_with_no_checks(SequenceView(self._core, indices))
 
-    @property
-    def gi_frame(self) -> FrameType:
-        return self._core.gi_frame
+    def last(self, *, default: Any = None) -> Optional[T_co]:
+        """
+        >>> ChainSequence(list(range(10_000))).last()
+        9999
 
-    @property
-    def gi_running(self) -> bool:
-        return self._core.gi_running
+        Args:
+            default:  default value to return
+        Returns:
+            The last element if 'self' contains anything. 'default' - otherwise
+        """
+        core = self._core
+        return core[-1] if len(core) else default
 
-    @property
-    def gi_yieldfrom(self) -> Optional[Generator]:
-        return self._core.gi_yieldfrom
+    def last_n(self, n: int) -> 'ChainSequence[T_co]':
+        """
+        >>> ChainSequence(list(range(10_000))).last_n(3)
+        ChainSequence of SequenceView([9997, 9998, 9999])
 
-    def close(self) -> None:
-        self._core.close()
+        Args:
+            n:    number of last elements
+        Returns:
+            zero-copy view of the last n elements
+        """
+        length = len(self._core)
+        return self._view(range(max(length - n, 0), length))
 
-    def send(self, value: T_contra) -> T_co:
-        return self._core.send(value)
+    def len(self) -> int:
+        """
+        Returns the length of the sequence. Does not iterate anything.
+
+        >>> ChainSequence('abc').len()
+        3
+
+        Returns:
+            sequence length
+        """
+        return len(self._core)
+
+    def len_eval(self) -> int:
+        return len(self._core)
+
+    def nth(self: 'ChainSequence[M_co]', n: int, default: Optional[M_co] = None) -> Optional[M_co]:
+        """
+        >>> ChainSequence(list(range(2, 12))).nth(5)
+        7
+
+        >>> ChainSequence(list(range(2, 12))).nth(500, 'Default')
+        'Default'
+
+        Args:
+            n:        order number
+            default:  default value to return
+        Returns:
+            The n-th element if the sequence contains it. 'default' - otherwise
+        """
+        if n < 0:
+            # Keeps the behaviour of `ChainIterable.nth`
+            return ChainIterable.nth(self, n, default)
+        core = self._core
+        return core[n] if n < len(core) else default
+
+    def reverse(self) -> 'ChainSequence[T_co]':  # type: ignore
+        """
+        >>> ChainSequence([2, 3, 4]).reverse()
+        ChainSequence of SequenceView([4, 3, 2])
+
+        Returns:
+            zero-copy reversed view
+        """
+        return self._view(range(len(self._core))[::-1])
+
+    def skip(self, n: int) -> 'ChainSequence[T_co]':  # type: ignore
+        """
+        >>> ChainSequence((1, 2, 3, 4)).skip(2)
+        ChainSequence of SequenceView([3, 4])
+
+        Args:
+            n:    number of items to skip
+        Returns:
+            zero-copy view
+        """
+        return self.slice(n, None)
+
+    def slice(self, *args: Optional[int]) -> 'ChainSequence[T_co]':  # type: ignore
+        """
+        >>> ChainSequence(list(range(1_000))).slice(100, 200, 20)
+        ChainSequence of SequenceView([100, 120, 140, 160, 180])
+
+        Args:
+            *args:  slicing parameters: ([start,] stop[, step]). Negative values are not allowed as in ``islice``
+        Returns:
+            zero-copy view
+        """
+        start, stop, step = normalize_slice(*args)
+        return self._view(range(len(self._core))[start:stop:step])
+
+    def split(self,
+              n: int,
+              collector: Optional[Callable[[Iterable[T_co]], Sequence]] = tuple) -> 'ChainIterator[Sequence[T_co]]':
+        """
+        Splits the 'self' into 'n' equal pieces, if possible.
+        If not, the first few pieces will be 1 longer than the last few.
+        Unlike ``ChainIterable.split``, does not copy the whole sequence in advance.
+
+        >>> ChainSequence([1, 2, 3, 4, 5]).split(2).collect(list)
+        ChainSequence of [(1, 2, 3), (4, 5)]
+
+        >>> ChainSequence([1, 2, 3, 4, 5]).split(2, None).collect(list)
+        ChainSequence of [SequenceView([1, 2, 3]), SequenceView([4, 5])]
+
+        Args:
+            n:          number of pieces
+            collector:  split holder. If ``None``, pieces are zero-copy views of the sequence
+        Returns:
+            split iterator
+        """
+        split_size, remainder = divmod(len(self._core), n)
+
+        def split_generator() -> Generator[Sequence[T_co], None, None]:
+            first = 0
+            for i in range(n):
+                last = first + split_size + (i < remainder)
+                piece = SequenceView(self._core, range(first, last))
+                yield piece if collector is None else collector(piece)
+                first = last
+
+        return ChainIterator._make_with_no_checks(split_generator())
+
+    def step_by(self, step: int) -> 'ChainSequence[T_co]':  # type: ignore
+        """
+        >>> ChainSequence(list(range(10_000))).step_by(2343)
+        ChainSequence of SequenceView([0, 2343, 4686, 7029, 9372])
+
+        Args:
+            step:  number of iterations to skip
+        Returns:
+            zero-copy view
+        """
+        return self.slice(None, None, step)
+
+    def take(self, n: int) -> 'ChainSequence[T_co]':  # type: ignore
+        """
+        >>> ChainSequence(list(range(1_000))).take(5)
+        ChainSequence of SequenceView([0, 1, 2, 3, 4])
+
+        Args:
+            n:    number of items
+        Returns:
+            zero-copy view
+        """
+        return self.slice(n)
+
+
+class ChainMapping(ChainIterable[T_co]):
+    """Wrapper object that provides convenient chain-like methods for any mapping. Iterates over its keys."""
+
+    __slots__ = ()
+
+    def __init__(self, mapping: Mapping[T_co, Any], /) -> None:
+        """
+        Wrapper object that provides convenient chain-like methods for any mapping.
+
+        >>> ChainMapping({'a': 1, 'b': 2})
+        ChainMapping of {'a': 1, 'b': 2}
+
+        Args:
+            mapping:  mapping to wrap around
+        """
+        if not isinstance(mapping, abc.Mapping):
+            raise TypeError(
+                'Cannot initialize an instance of `ChainMapping` '
+                f'from the instance of a non-mapping class {type(mapping)}'
+            )
+        self._core: Final[Mapping[T_co, Any]] = mapping  # type: ignore
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._core
+
+    def __len__(self) -> int:
+        return len(self._core)
+
+    def __repr__(self) -> str:
+        return f'ChainMapping of {self._core}'
+
+    def __reversed__(self) -> Iterator[T_co]:
+        core = self._core
+        return reversed(core) if isinstance(core, abc.Reversible) else reversed(tuple(core))  # type: ignore
+
+    @staticmethod
+    def _make_with_no_checks(mapping: Mapping[T_co, Any]) -> 'ChainMapping[T_co]':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            mapping:  mapping to wrap around
+        Returns:
+            `ChainMapping` wrapper of the mapping
+        """
+        instance = ChainMapping.__new__(ChainMapping)
+        instance._core = mapping  # type: ignore
+        return instance
+
+    @property
+    def core(self) -> Mapping[T_co, Any]:
+        """
+        Internal mapping access handler.
+
+        Returns:
+            Raw mapping inside the 'self' instance
+        """
+        return self._core
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        >>> ChainMapping({'a': 1}).get('b', 0)
+        0
+
+        Args:
+            key:      key to look up
+            default:  value to return if the 'key' is missing
+        Returns:
+            value corresponding to the 'key'
+        """
+        return self._core.get(key, default)
+
+    def items(self) -> 'ChainSet[Tuple[T_co, Any]]':
+        """
+        >>> ChainMapping({'a': 1, 'b': 2}).items().collect(list)
+        ChainSequence of [('a', 1), ('b', 2)]
+
+        Returns:
+            chain over the items view of the mapping
+        """
+        return ChainSet._make_with_no_checks(self._core.items())
+
+    def keys(self) -> 'ChainSet[T_co]':
+        """
+        Returns:
+            chain over the keys view of the mapping
+        """
+        return ChainSet._make_with_no_checks(self._core.keys())
+
+    def last(self, *, default: Any = None) -> Optional[T_co]:
+        """
+        >>> ChainMapping({'a': 1, 'b': 2}).last()
+        'b'
+
+        Args:
+            default:  default value to return
+        Returns:
+            The last key if 'self' contains anything. 'default' - otherwise
+        """
+        return next(reversed(self), default)
+
+    def last_n(self, n: int) -> 'ChainSequence[T_co]':  # type: ignore
+        """
+        >>> ChainMapping(dict.fromkeys(range(10_000))).last_n(3)
+        ChainSequence of (9997, 9998, 9999)
+
+        Args:
+            n:    number of last keys
+        Returns:
+            Last n keys container
+        """
+        return ChainSequence._make_with_no_checks(tuple(islice(reversed(self), n))[::-1])
+
+    def len(self) -> int:
+        """
+        Returns the number of keys. Does not iterate anything.
+
+        Returns:
+            mapping length
+        """
+        return len(self._core)
+
+    def len_eval(self) -> int:
+        return len(self._core)
+
+    def reverse(self) -> ChainIterator[T_co]:
+        """
+        >>> ChainMapping({'a': 1, 'b': 2}).reverse().collect(tuple)
+        ChainSequence of ('b', 'a')
+
+        Returns:
+            reversed iterator over the keys
+        """
+        return ChainIterator._make_with_no_checks(reversed(self))
+
+    def values(self) -> 'ChainIterable[Any]':
+        """
+        >>> ChainMapping({'a': 1, 'b': 2}).values().collect(tuple)
+        ChainSequence of (1, 2)
+
+        Returns:
+            chain over the values view of the mapping
+        """
+        return ChainIterable._make_with_no_checks(self._core.values())
+
+
+class ChainSet(ChainIterable[T_co]):
+    """Wrapper object that provides convenient chain-like methods for any set."""
+
+    __slots__ = ()
+
+    def __init__(self, set_: AbstractSet[T_co], /) -> None:
+        """
+        Wrapper object that provides convenient chain-like methods for any set.
+
+        >>> ChainSet(frozenset((1, 2)))
+        ChainSet of frozenset({1, 2})
+
+        Args:
+            set_:  set to wrap around
+        """
+        if not isinstance(set_, abc.Set):
+            raise TypeError(
+                'Cannot initialize an instance of `ChainSet` '
+                f'from the instance of a non-set class {type(set_)}'
+            )
+        self._core: Final[AbstractSet[T_co]] = set_  # type: ignore
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._core
+
+    def __len__(self) -> int:
+        return len(self._core)
+
+    def __repr__(self) -> str:
+        return f'ChainSet of {self._core}'
+
+    @staticmethod
+    def _make_with_no_checks(set_: AbstractSet[T_co]) -> 'ChainSet[T_co]':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            set_:  set to wrap around
+        Returns:
+            `ChainSet` wrapper of the set
+        """
+        instance = ChainSet.__new__(ChainSet)
+        instance._core = set_  # type: ignore
+        return instance
+
+    @property
+    def core(self) -> AbstractSet[T_co]:
+        """
+        Internal set access handler.
+
+        Returns:
+            Raw set inside the 'self' instance
+        """
+        return self._core
+
+    def isdisjoint(self, other: Iterable[Any]) -> bool:
+        """
+        >>> ChainSet({1, 2}).isdisjoint((3, 4))
+        True
+
+        Args:
+            other:  iterable to compare with
+        Returns:
+            whether the 'self' has no elements in common with the 'other'
+        """
+        return self._core.isdisjoint(other)
+
+    def len(self) -> int:
+        """
+        Returns the number of elements. Does not iterate anything.
+
+        Returns:
+            set length
+        """
+        return len(self._core)
+
+    def len_eval(self) -> int:
+        return len(self._core)
+
+
+class ChainGenerator(ChainIterator[T_co], Generic[T_co, T_contra, M_co]):
+    """Wrapper object that provides convenient chain-like methods for any ``generator``."""
+    __slots__ = ()
+
+    def __init__(self, generator: Generator[T_co, T_contra, M_co]) -> None:
+        """
+        ``ChainGenerator`` is a chained analogue of the built-in ``generator`` object.
+
+        Args:
+            generator:  stack frame to store
+        """
+
+        if not isinstance(generator, GeneratorType):
+            if isinstance(generator, ChainGenerator):
+                generator = generator._core
+            else:
+                raise TypeError(
+                    f'{self.__class__.__name__} does not accept non-generator instances of {type(generator)}'
+                )
+
+        self._core: Final[Generator[T_co, T_contra, M_co]] = generator  # type: ignore
+
+    def __iter__(self) -> Iterator[T_co]:
+        return iter(self._core)
+
+    def __next__(self) -> T_co:
+        return next(self._core)
+
+    def __repr__(self) -> str:
+        return f'<ChainGenerator at {hex(id(self))}>'
+
+    @staticmethod
+    def _make_with_no_checks(  # type: ignore
+            generator: Generator[T_co, T_contra, M_co]) -> 'ChainGenerator[T_co, T_contra, M_co]':
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            generator:  generator to wrap around
+        Returns:
+            `ChainGenerator` wrapper of the generator
+        """
+        instance = ChainGenerator.__new__(ChainGenerator)
+        instance._core = generator  # type: ignore
+        return instance
+
+    @property
+    def core(self) -> Generator[T_co, T_contra, M_co]:
+        """
+        Internal generator access handler.
+
+        Returns:
+            Raw generator inside the 'self' instance
+        """
+        return self._core
+
+    @property
+    def gi_code(self) -> CodeType:
+        return self._core.gi_code
+
+    @property
+    def gi_frame(self) -> FrameType:
+        return self._core.gi_frame
+
+    @property
+    def gi_running(self) -> bool:
+        return self._core.gi_running
+
+    @property
+    def gi_yieldfrom(self) -> Optional[Generator]:
+        return self._core.gi_yieldfrom
+
+    def close(self) -> None:
+        self._core.close()
+
+    def send(self, value: T_contra) -> T_co:
+        return self._core.send(value)
 
     def throw(self,
               exception: Type[BaseException],
@@ -1105,141 +2866,1216 @@ class ChainGenerator(ChainIterator[T_co], Generic[T_co, T_contra, M_co]):
         return self._core.throw(exception, value, traceback)
 
 
-class ChainRange(ChainIterable[int]):
-    """Chained analogue of the built-in ``range`` object."""
+class ChainStructRecords(ChainSequence[Tuple]):
+    """Chain over fixed-width binary records. See ``ChainIterable.from_struct``"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> 'ChainStructRecords':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._core.close()
+
+    def __repr__(self) -> str:
+        return f'ChainStructRecords of {self._core}'
+
+    @staticmethod
+    def _make_with_no_checks(records: StructRecords) -> 'ChainStructRecords':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            records:  records to wrap around
+        Returns:
+            `ChainStructRecords` wrapper of the records
+        """
+        instance = ChainStructRecords.__new__(ChainStructRecords)
+        instance._core = records  # type: ignore
+        return instance
+
+    @property
+    def core(self) -> StructRecords:
+        """
+        Internal records access handler.
+
+        Returns:
+            Raw records inside the 'self' instance
+        """
+        return self._core
+
+    def _view(self, indices: range) -> ChainSequence[Tuple]:
+        """
+        Contiguous selections of records stay zero-copy records, so that they are unpacked by ``Struct.iter_unpack``.
+
+        >>> ChainIterable.from_struct(bytes(range(6)), 'BB').skip(1)
+        ChainStructRecords of StructRecords('BB', [(2, 3), (4, 5)])
+        """
+        if indices.step == 1:
+            return ChainStructRecords._make_with_no_checks(self._core[indices.start:indices.stop])
+        return ChainSequence._view(self, indices)
+
+    def close(self) -> None:
+        """
+        Closes the records, see ``StructRecords.close``.
+
+        >>> import os, tempfile
+        >>> with tempfile.NamedTemporaryFile(delete=False) as file:
+        ...     _ = file.write(bytes(range(4)))
+        >>> with ChainIterable.from_struct(file.name, '<H') as records:
+        ...     records.collect(list)
+        ChainSequence of [(256,), (770,)]
+        >>> os.remove(file.name)
+        """
+        self._core.close()
+
+    def columns(self, batch_size: int, *, backend: str = ARRAY) -> ChainIterator[Tuple]:
+        """
+        Splits the records into batches and transposes each batch into columns, see ``StructRecords.columns``.
+
+        >>> ChainIterable.from_struct(bytes(range(6)), 'BB').columns(2).collect(list)
+        ChainSequence of [(array('B', [0, 2]), array('B', [1, 3])), (array('B', [4]), array('B', [5]))]
+
+        Args:
+            batch_size:  number of records in a batch
+            backend:     'array' or 'numpy'
+        Returns:
+            iterator over the tuples of columns
+        """
+        return ChainIterator._make_with_no_checks(self._core.columns(batch_size, backend))
+
+
+class ChainRange(ChainSequence[int]):
+    """Chained analogue of the built-in ``range`` object."""
+
+    __slots__ = ()
+
+    @overload
+    def __init__(self, rng: range, /) -> None:
+        pass
+
+    @overload
+    def __init__(self, stop: int, /) -> None:
+        pass
+
+    @overload
+    def __init__(self, start: int, stop: int, /) -> None:
+        pass
+
+    @overload
+    def __init__(self, start: int, stop: int, step: int, /) -> None:
+        pass
+
+    def __init__(self, *args) -> None:
+        """
+        ``ChainRange`` is a chained analogue of the built-in ``range`` object.
+
+        Args:
+            *args:  single `range` or `range` init parameters: [start,] stop[, step]
+        """
+        try:
+            self._core: Final[range] = range(*args)  # type: ignore
+        except TypeError:
+            if len(args) == 1 and isinstance(range_candidate := args[0], range):
+                self._core: Final[range] = range_candidate  # type: ignore
+            else:
+                raise
+
+    def __contains__(self, item: int) -> bool:
+        return item in self._core
+
+    @overload  # type: ignore
+    def __getitem__(self, key: int) -> int:
+        pass
+
+    @overload
+    def __getitem__(self, key: slice) -> 'ChainRange':
+        pass
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[int, 'ChainRange']:
+        """
+        Allows to access elements of 'self' by square brace indexing.
+        Common use-case of throwing ``IndexError`` as a negative result of bound checking
+        in case of single value selection is replaced by returning ``None``.
+
+        >>> ChainRange(0, 20, 2)[3:].collect(tuple)
+        ChainSequence of (6, 8, 10, 12, 14, 16, 18)
+
+        >>> ChainRange(0, 20, 2)[3::2].collect(tuple)
+        ChainSequence of (6, 10, 14, 18)
+
+        Args:
+            key:  `int` or `slice`
+        Returns:
+            if 'item' is `slice`, `ChainRange` over the values selected. Otherwise, single value at the position
+        """
+        if isinstance(key, slice):
+            return ChainRange._make_with_no_checks(self._core[key])
+        return self._core[key]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._core)
+
+    def __len__(self) -> int:
+        return len(self._core)
+
+    def __repr__(self) -> str:
+        return f'ChainRange({self._core.__repr__()[6:-1]})'
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self._core)
+
+    @staticmethod
+    def _make_with_no_checks(rng: range) -> 'ChainRange':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            rng:  `range` object to wrap around
+        Returns:
+            `ChainRange` wrapper of the range
+        """
+        instance = ChainRange.__new__(ChainRange)
+        instance._core = rng  # type: ignore
+        return instance
+
+    @property
+    def core(self) -> range:
+        """
+        Internal iterable access handler.
+
+        >>> ChainRange(1, 232, 3).core
+        range(1, 232, 3)
+
+        Returns:
+            Raw `range` object inside the 'self' instance
+        """
+        return self._core
+
+    def _view(self, indices: range) -> 'ChainRange':  # type: ignore
+        """
+        Selected elements of a range form a range too.
+
+        >>> ChainRange(10, 20).take(3)
+        ChainRange(10, 13)
+
+        >>> ChainRange(10, 20).reverse()
+        ChainRange(19, 9, -1)
+        """
+        return ChainRange._make_with_no_checks(compose_ranges(self._core, indices))
+
+    def count(self, value: int) -> int:
+        return self._core.count(value)
+
+    def filter(self, *predicates: Callable[[int], bool]) -> ChainIterable[int]:  # type: ignore
+        """
+        Predicates of the form ``x % m == r`` (see ``LambdaExpr``) leading the 'predicates' keep the result a range.
+
+        >>> from chained.functions.lambded import x
+        >>> ChainRange(10 ** 12).filter(x % 7 == 3).take(3)
+        ChainRange(3, 18, 7)
+
+        >>> ChainRange(10).filter(x % 2 == 0, lambda v: v > 4).collect(tuple)
+        ChainSequence of (6, 8)
+
+        Args:
+            *predicates:  predicates to apply
+        Returns:
+            `ChainRange` if all the predicates are modulo conditions. Resulting iterator - otherwise
+        """
+        rng = self._core
+        for i, pred in enumerate(predicates):
+            condition = modulo_condition(pred)
+            if condition is None:
+                return ChainIterable.filter(ChainRange._make_with_no_checks(rng), *predicates[i:])
+            rng = filter_range(rng, *condition)
+        return ChainRange._make_with_no_checks(rng)
+
+    def index(self, value: int) -> int:
+        return self._core.index(value)
+
+    def len(self) -> int:
+        """
+        Returns the length of the range. Does not iterate anything.
+
+        >>> ChainRange(1, 232, 3).len()
+        77
+
+        Returns:
+            range length
+        """
+        return len(self._core)
+
+    def map(self,  # type: ignore
+            func: Callable[[int], T],
+            /,
+            *funcs: Callable[[Any], Any],
+            batch_size: Optional[int] = None) -> ChainIterable:
+        """
+        Affine ``LambdaExpr`` functions (``x * a + b`` with integer non-zero 'a' and integer 'b')
+        leading the 'funcs' keep the result a range.
+
+        >>> from chained.functions.lambded import x
+        >>> ChainRange(10 ** 9).map(x * 3 + 1)[10 ** 8]
+        300000001
+
+        >>> ChainRange(3).map(x * -1 + 1, str).collect(tuple)
+        ChainSequence of ('1', '0', '-1')
+
+        Args:
+            func:        first function to map
+            *funcs:      remaining functions to map
+            batch_size:  number of elements to evaluate at once by NumPy, see ``ChainIterable.map``
+        Returns:
+            `ChainRange` if all the functions are affine. Resulting iterator - otherwise
+        """
+        funcs = (func, *funcs)
+        rng = self._core
+        for i, func in enumerate(funcs):
+            coefficients = affine_coefficients(func)
+            if coefficients is None or not coefficients[0]:
+                return ChainIterable.map(ChainRange._make_with_no_checks(rng), *funcs[i:], batch_size=batch_size)
+            rng = map_range(rng, *coefficients)
+        return ChainRange._make_with_no_checks(rng)
+
+    def max(self, *, key: Optional[Callable[[int], Any]] = None, default: Any = None) -> Optional[int]:
+        """
+        >>> ChainRange(10 ** 12, 0, -3).max()
+        1000000000000
+
+        Args:
+            key:      function computing the comparison key. Disables the closed-form evaluation
+            default:  value to return if the range is empty
+        Returns:
+            the largest element
+        """
+        rng = self._core
+        if key is not None:
+            return ChainIterable.max(self, key=key, default=default)
+        if not rng:
+            return default
+        return rng[-1] if rng.step > 0 else rng[0]
+
+    def mean(self, default: Any = None) -> Optional[float]:
+        """
+        >>> ChainRange(1, 10 ** 12).mean()
+        500000000000.0
+
+        Args:
+            default:  value to return if the range is empty
+        Returns:
+            arithmetic mean
+        """
+        rng = self._core
+        return (rng[0] + rng[-1]) / 2 if rng else default
+
+    def min(self, *, key: Optional[Callable[[int], Any]] = None, default: Any = None) -> Optional[int]:
+        """
+        >>> ChainRange(10 ** 12, 0, -3).min()
+        1
+
+        Args:
+            key:      function computing the comparison key. Disables the closed-form evaluation
+            default:  value to return if the range is empty
+        Returns:
+            the smallest element
+        """
+        rng = self._core
+        if key is not None:
+            return ChainIterable.min(self, key=key, default=default)
+        if not rng:
+            return default
+        return rng[0] if rng.step > 0 else rng[-1]
+
+    def sum(self, start: Any = 0) -> Any:
+        """
+        >>> ChainRange(10 ** 12).sum()
+        499999999999500000000000
+
+        Args:
+            start:  initial value
+        Returns:
+            sum of the 'start' and all the elements
+        """
+        rng = self._core
+        if not rng:
+            return start
+        return start + len(rng) * (rng[0] + rng[-1]) // 2
+
+
+class ChainCount(ChainIterable[int]):
+    """Chained infinite arithmetic progression: a re-iterable analogue of ``itertools.count`` with random access."""
+
+    __slots__ = ()
+
+    def __init__(self, start: int = 0, step: int = 1) -> None:
+        """
+        Chained infinite arithmetic progression. Iterates lazily as ``itertools.count`` does,
+        but can be iterated several times and computes any term, membership and position in constant time.
+
+        >>> ChainCount(0, 7)[10 ** 9]
+        7000000000
+
+        >>> ChainCount(3)[2:5]
+        ChainRange(5, 8)
+
+        Args:
+            start:  first term
+            step:   difference between the consecutive terms
+        """
+        self._core: Final[ArithmeticProgression] = ArithmeticProgression(start, step)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._core
+
+    @overload  # type: ignore
+    def __getitem__(self, item: int) -> Optional[int]:
+        pass
+
+    @overload
+    def __getitem__(self, item: slice) -> ChainIterable[int]:
+        pass
+
+    def __getitem__(self, item: Union[int, slice]) -> Optional[Union[int, ChainIterable[int]]]:
+        """
+        Allows to access terms of 'self' by square brace indexing.
+        Common use-case of throwing ``IndexError`` as a negative result of bound checking
+        in case of single value selection is replaced by returning ``None``.
+
+        >>> ChainCount(2, 3)[5:]
+        ChainCount(17, 3)
+
+        >>> ChainCount(2, 3)[-1] is None
+        True
+
+        Args:
+            item:  `int` or `slice` with non-negative parameters
+        Returns:
+            if 'item' is `slice`, `ChainCount` or (if the slice has a stop) `ChainRange` over the terms selected.
+            Otherwise, single term at the position
+        """
+        if isinstance(item, slice):
+            return make_chain(self._core[item])
+        try:
+            return self._core[item]
+        except IndexError:
+            return None
+
+    def __repr__(self) -> str:
+        core = self._core
+        return f'ChainCount({core.start})' if core.step == 1 else f'ChainCount({core.start}, {core.step})'
+
+    @staticmethod
+    def _make_with_no_checks(progression: ArithmeticProgression) -> 'ChainCount':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        >>> ChainCount._make_with_no_checks(ArithmeticProgression(3, 2))
+        ChainCount(3, 2)
+
+        Args:
+            progression:  progression to wrap around
+        Returns:
+            `ChainCount` wrapper of the progression
+        """
+        instance = ChainCount.__new__(ChainCount)
+        instance._core = progression  # type: ignore
+        return instance
+
+    @property
+    def core(self) -> ArithmeticProgression:
+        """
+        Internal progression access handler.
+
+        Returns:
+            Raw progression inside the 'self' instance
+        """
+        return self._core
+
+    def filter(self, *predicates: Callable[[int], bool]) -> ChainIterable[int]:  # type: ignore
+        """
+        Predicates of the form ``x % m == r`` (see ``LambdaExpr``) leading the 'predicates' keep the result a progression.
+
+        >>> from chained.functions.lambded import x
+        >>> ChainCount(1, 2).filter(x % 3 == 0)
+        ChainCount(3, 6)
+
+        Args:
+            *predicates:  predicates to apply
+        Returns:
+            `ChainCount` if all the predicates are modulo conditions. Resulting iterator - otherwise
+        """
+        progression = self._core
+        for i, pred in enumerate(predicates):
+            condition = modulo_condition(pred)
+            if condition is None or type(progression.start) is not int or type(progression.step) is not int:
+                return ChainIterable.filter(ChainCount._make_with_no_checks(progression), *predicates[i:])
+            solution = solve_congruence(progression.start, progression.step, *condition)
+            if solution is None:
+                return ChainRange._make_with_no_checks(range(0))
+            progression = progression[solution[0]::solution[1]]
+        return ChainCount._make_with_no_checks(progression)
+
+    def index(self, value: int) -> int:
+        """
+        >>> ChainCount(2, 5).index(10 ** 12 + 2)
+        200000000000
+
+        Args:
+            value:  term to look for
+        Returns:
+            position of the 'value'. Raises ``ValueError`` if there is no such term
+        """
+        return self._core.index(value)
+
+    def map(self,  # type: ignore
+            func: Callable[[int], T],
+            /,
+            *funcs: Callable[[Any], Any],
+            batch_size: Optional[int] = None) -> ChainIterable:
+        """
+        Affine ``LambdaExpr`` functions (``x * a + b`` with integer 'a' and 'b')
+        leading the 'funcs' keep the result a progression.
+
+        >>> from chained.functions.lambded import x
+        >>> ChainCount(1).map(x * 10 - 1)
+        ChainCount(9, 10)
+
+        Args:
+            func:        first function to map
+            *funcs:      remaining functions to map
+            batch_size:  number of elements to evaluate at once by NumPy, see ``ChainIterable.map``
+        Returns:
+            `ChainCount` if all the functions are affine. Resulting iterator - otherwise
+        """
+        funcs = (func, *funcs)
+        progression = self._core
+        for i, func in enumerate(funcs):
+            coefficients = affine_coefficients(func)
+            if coefficients is None:
+                return ChainIterable.map(
+                    ChainCount._make_with_no_checks(progression), *funcs[i:], batch_size=batch_size
+                )
+            a, b = coefficients
+            progression = ArithmeticProgression(progression.start * a + b, progression.step * a)
+        return ChainCount._make_with_no_checks(progression)
+
+    def nth(self, n: int, default: Optional[int] = None) -> Optional[int]:  # type: ignore
+        """
+        >>> ChainCount(5, -1).nth(10 ** 10)
+        -9999999995
+
+        Args:
+            n:        order number
+            default:  default value to return. Only negative 'n' raises ``ValueError`` as in ``ChainIterable.nth``
+        Returns:
+            The n-th term
+        """
+        if n < 0:
+            return ChainIterable.nth(self, n, default)
+        return self._core[n]
+
+    def skip(self, n: int) -> 'ChainCount':  # type: ignore
+        """
+        >>> ChainCount(3).skip(10)
+        ChainCount(13)
+
+        Args:
+            n:    number of terms to skip
+        Returns:
+            progression without the first 'n' terms
+        """
+        return self.slice(n, None)
+
+    def slice(self, *args: Optional[int]) -> ChainIterable[int]:  # type: ignore
+        """
+        >>> ChainCount(0, 5).slice(2, 10, 3)
+        ChainRange(10, 50, 15)
+
+        Args:
+            *args:  slicing parameters: ([start,] stop[, step]). Negative values are not allowed as in ``islice``
+        Returns:
+            `ChainRange` if the stop is specified. `ChainCount` - otherwise
+        """
+        return self[slice(*normalize_slice(*args))]
+
+    def step_by(self, step: int) -> 'ChainCount':  # type: ignore
+        """
+        >>> ChainCount(1).step_by(4)
+        ChainCount(1, 4)
+
+        Args:
+            step:  number of iterations to skip
+        Returns:
+            progression of every 'step'-th term
+        """
+        return self.slice(0, None, step)
+
+    def take(self, n: int) -> ChainIterable[int]:  # type: ignore
+        """
+        >>> ChainCount(7, 7).take(3)
+        ChainRange(7, 28, 7)
+
+        Args:
+            n:    number of terms
+        Returns:
+            the first 'n' terms
+        """
+        return self.slice(n)
+
+
+class ChainLazySequence(ChainIterable[T_co]):
+    """Chained infinite sequence with lazy random access: geometric progression or recurrence."""
+
+    __slots__ = ()
+
+    def __init__(self, sequence: Union[GeometricProgression, Recurrence], /) -> None:
+        """
+        Chained infinite sequence with lazy random access.
+
+        >>> ChainLazySequence(GeometricProgression(1, 10))[6]
+        1000000
+
+        Args:
+            sequence:  `GeometricProgression` or `Recurrence` to wrap around
+        """
+        if not isinstance(sequence, (GeometricProgression, Recurrence)):
+            raise TypeError(
+                'Cannot initialize an instance of `ChainLazySequence` '
+                f'from the instance of a non-lazy-sequence class {type(sequence)}'
+            )
+        self._core: Final[Union[GeometricProgression, Recurrence]] = sequence  # type: ignore
+
+    @overload  # type: ignore
+    def __getitem__(self, item: int) -> Optional[T_co]:
+        pass
+
+    @overload
+    def __getitem__(self, item: slice) -> ChainIterable[T_co]:
+        pass
+
+    def __getitem__(self, item: Union[int, slice]) -> Optional[Union[T_co, ChainIterable[T_co]]]:
+        """
+        Allows to access terms of 'self' by square brace indexing.
+        Common use-case of throwing ``IndexError`` as a negative result of bound checking
+        in case of single value selection is replaced by returning ``None``.
+
+        >>> seq(1, 2, 4, ...)[3:6]
+        ChainSequence of SequenceView([8, 16, 32])
+
+        Args:
+            item:  `int` or `slice` with non-negative parameters
+        Returns:
+            if 'item' is `slice`, chain over the terms selected. Otherwise, single term at the position
+        """
+        if isinstance(item, slice):
+            return make_chain(self._core[item])
+        try:
+            return self._core[item]
+        except IndexError:
+            return None
+
+    def __repr__(self) -> str:
+        return f'ChainLazySequence of {self._core}'
+
+    @staticmethod
+    def _make_with_no_checks(sequence: Union[GeometricProgression, Recurrence]) -> 'ChainLazySequence':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            sequence:  `GeometricProgression` or `Recurrence` to wrap around
+        Returns:
+            `ChainLazySequence` wrapper of the sequence
+        """
+        instance = ChainLazySequence.__new__(ChainLazySequence)
+        instance._core = sequence  # type: ignore
+        return instance
+
+    @property
+    def core(self) -> Union[GeometricProgression, Recurrence]:
+        """
+        Internal sequence access handler.
+
+        Returns:
+            Raw sequence inside the 'self' instance
+        """
+        return self._core
+
+    def nth(self: 'ChainLazySequence[M_co]', n: int, default: Optional[M_co] = None) -> Optional[M_co]:
+        """
+        >>> seq(1, 1, ..., rule=lambda a, b: a + b).nth(100)
+        573147844013817084101
+
+        Args:
+            n:        order number
+            default:  default value to return. Only negative 'n' raises ``ValueError`` as in ``ChainIterable.nth``
+        Returns:
+            The n-th term
+        """
+        if n < 0:
+            return ChainIterable.nth(self, n, default)
+        return self._core[n]
+
+    def skip(self, n: int) -> ChainIterable[T_co]:  # type: ignore
+        return self.slice(n, None)
+
+    def slice(self, *args: Optional[int]) -> ChainIterable[T_co]:  # type: ignore
+        """
+        >>> seq(2, 6, 18, ...).slice(1, None, 2)
+        ChainLazySequence of GeometricProgression(6, 9)
+
+        Args:
+            *args:  slicing parameters: ([start,] stop[, step]). Negative values are not allowed as in ``islice``
+        Returns:
+            chain over the terms selected
+        """
+        return self[slice(*normalize_slice(*args))]
+
+    def step_by(self, step: int) -> ChainIterable[T_co]:  # type: ignore
+        return self.slice(0, None, step)
+
+    def take(self, n: int) -> ChainSequence[T_co]:  # type: ignore
+        """
+        >>> seq(1, 1, ..., rule=lambda a, b: a + b).take(8)
+        ChainSequence of SequenceView([1, 1, 2, 3, 5, 8, 13, 21])
+
+        Args:
+            n:    number of terms
+        Returns:
+            zero-copy view of the first 'n' terms
+        """
+        return self.slice(n)  # type: ignore
+
+
+class ChainRecords(ChainIterable[Union[bytes, str]]):
+    """Chain over the records of a memory-mapped file. See ``ChainIterable.from_mmap``"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f'ChainRecords of {self._core}'
+
+    @staticmethod
+    def _make_with_no_checks(records: MappedRecords) -> 'ChainRecords':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            records:  records to wrap around
+        Returns:
+            `ChainRecords` wrapper of the records
+        """
+        instance = ChainRecords.__new__(ChainRecords)
+        instance._core = records  # type: ignore
+        return instance
+
+    @property
+    def core(self) -> MappedRecords:
+        """
+        Internal records access handler.
+
+        Returns:
+            Raw records inside the 'self' instance
+        """
+        return self._core
+
+    def nth(self, n: int, default: Any = None) -> Any:  # type: ignore
+        """
+        Scans the mapping until the `n`-th record without creating the preceding ones.
+
+        Args:
+            n:        order number
+            default:  default value to return
+        Returns:
+            The n-th record if the file contains it. 'default' - otherwise
+        """
+        if n < 0:
+            return ChainIterable.nth(self, n, default)
+        record = self._core.nth(n)
+        return default if record is None else record
+
+    def skip(self, n: int) -> 'ChainRecords':  # type: ignore
+        return self.slice(n, None)
+
+    def slice(self, *args: Optional[int]) -> ChainIterable[Union[bytes, str]]:  # type: ignore
+        """
+        Args:
+            *args:  slicing parameters: ([start,] stop[, step]). Negative values are not allowed as in ``islice``
+        Returns:
+            `ChainRecords` if the step is 1. Resulting iterator - otherwise
+        """
+        start, stop, step = normalize_slice(*args)
+        if step != 1:
+            return ChainIterable.slice(self, start, stop, step)
+        return ChainRecords._make_with_no_checks(self._core.slice(start, stop))
+
+    def take(self, n: int) -> 'ChainRecords':  # type: ignore
+        return self.slice(n)
+
+
+class ChainPlan(ChainIterable[T_co]):
+    """Deferred chain that records its stages and optimizes them before the execution."""
+
+    __slots__ = ()
+
+    def __init__(self, iterable: Iterable[T_co]) -> None:
+        """
+        Deferred chain that records its stages and optimizes them before the execution.
+
+        >>> ChainPlan([3, 4, 5]).map(str).skip(1)
+        ChainPlan of LogicalPlan([3, 4, 5] | map(str) | slice(1, None, 1))
+
+        Args:
+            iterable:  iterable to start from
+        """
+        if not hasattr(iterable, '__iter__'):
+            raise TypeError(
+                'Cannot initialize an instance of `ChainPlan` '
+                f'from the instance of a non-iterable class {type(iterable)}'
+            )
+        self._core: Final[LogicalPlan] = LogicalPlan(iterable)  # type: ignore
+
+    @overload
+    def __getitem__(self, item: int) -> Optional[T_co]:
+        pass
+
+    @overload
+    def __getitem__(self, item: slice) -> 'ChainPlan[T_co]':
+        pass
+
+    def __getitem__(self, item: Union[int, slice]) -> Optional[Union[T_co, 'ChainPlan[T_co]']]:
+        """
+        >>> ChainRange(10 ** 12).lazy().map(str)[10 ** 11]
+        '100000000000'
+
+        >>> ChainRange(0, 20, 2).lazy()[3::2].collect(tuple)
+        ChainSequence of (6, 10, 14, 18)
+
+        Args:
+            item:  `int` or `slice`
+        Returns:
+            if 'item' is `slice`, `ChainPlan` over the values selected. Otherwise, single value at the position
+        """
+        if isinstance(item, int):
+            return self.nth(item)
+        return self._append(SLICE, *normalize_slice(item.start, item.stop, item.step))
+
+    def __repr__(self) -> str:
+        return f'ChainPlan of {self._core}'
+
+    @staticmethod
+    def _make_with_no_checks(plan: LogicalPlan) -> 'ChainPlan[T_co]':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            plan:  logical plan to wrap around
+        Returns:
+            `ChainPlan` wrapper of the plan
+        """
+        instance = ChainPlan.__new__(ChainPlan)
+        instance._core = plan  # type: ignore
+        return instance
+
+    @property
+    def core(self) -> LogicalPlan:
+        """
+        Internal logical plan access handler.
+
+        Returns:
+            Raw `LogicalPlan` inside the 'self' instance
+        """
+        return self._core
+
+    def _append(self, kind: str, *args: Any) -> 'ChainPlan':
+        """Records one more stage."""
+        return ChainPlan._make_with_no_checks(self._core.append(kind, *args))
 
-    __slots__ = ()
+    def explain(self) -> str:
+        """
+        Describes the optimized plan that will be executed.
 
-    @overload
-    def __init__(self, rng: range, /) -> None:
-        pass
+        >>> ChainRange(100).lazy().map(str).skip(10).take(5).explain()
+        'range(10, 15) | map(str)'
 
-    @overload
-    def __init__(self, stop: int, /) -> None:
-        pass
+        Returns:
+            plan description
+        """
+        return self._core.optimize().explain()
 
-    @overload
-    def __init__(self, start: int, stop: int, /) -> None:
-        pass
+    def filter(self, *predicates: Callable[[T_co], bool]) -> 'ChainPlan[T_co]':
+        plan = self
+        for pred in predicates:
+            plan = plan._append(FILTER, pred)
+        return plan
 
-    @overload
-    def __init__(self, start: int, stop: int, step: int, /) -> None:
-        pass
+    def filter_map(self,
+                   function: Callable[[T_co], M_co],
+                   exceptions: Union[Type[BaseException], Tuple[Type[BaseException], ...]]) -> 'ChainPlan[M_co]':
+        return self._append(FILTER_MAP, function, exceptions)
 
-    def __init__(self, *args) -> None:
+    def first(self, default: Any = None) -> Optional[T_co]:
+        return self.nth(0, default)
+
+    def inspect(self, callback: Callable[[T_co], Any]) -> 'ChainPlan[T_co]':
+        return self._append(INSPECT, callback)
+
+    def lazy(self) -> 'ChainPlan[T_co]':
+        return self
+
+    def map(self,  # type: ignore
+            func: Callable[[T_co], T],
+            /,
+            *funcs: Callable[[Any], Any],
+            batch_size: Optional[int] = None) -> 'ChainIterable':
+        if batch_size is not None:
+            return ChainIterable.map(self, func, *funcs, batch_size=batch_size)
+        plan = self._append(MAP, func)
+        for func in funcs:
+            plan = plan._append(MAP, func)
+        return plan
+
+    def nth(self: 'ChainPlan[M_co]', n: int, default: Optional[M_co] = None) -> Optional[M_co]:
         """
-        ``ChainRange`` is a chained analogue of the built-in ``range`` object.
+        >>> ChainRange(10 ** 12).lazy().map(lambda x: -x).nth(10 ** 11)
+        -100000000000
 
         Args:
-            *args:  single `range` or `range` init parameters: [start,] stop[, step]
+            n:        order number
+            default:  default value to return
+        Returns:
+            The n-th element if the plan yields it. 'default' - otherwise
         """
-        try:
-            self._core: Final[range] = range(*args)  # type: ignore
-        except TypeError:
-            if len(args) == 1 and isinstance(range_candidate := args[0], range):
-                self._core: Final[range] = range_candidate  # type: ignore
-            else:
-                raise
+        return next(iter(self._append(SLICE, *normalize_slice(n, n + 1))._core), default)
 
-    def __contains__(self, item: int) -> bool:
-        return item in self._core
+    def skip(self, n: int) -> 'ChainPlan[T_co]':
+        return self._append(SLICE, *normalize_slice(n, None))
 
-    @overload  # type: ignore
-    def __getitem__(self, key: int) -> int:
-        pass
+    def slice(self, *args: Optional[int]) -> 'ChainPlan[T_co]':  # type: ignore
+        return self._append(SLICE, *normalize_slice(*args))
 
-    @overload
-    def __getitem__(self, key: slice) -> 'ChainRange':
-        pass
+    def starmap(self: 'ChainPlan[Iterable[M_co]]',  # type: ignore
+                func: Callable,
+                /,
+                *funcs: Callable) -> 'ChainPlan':
+        plan = self._append(STARMAP, func)
+        for func in funcs:
+            plan = plan._append(STARMAP, func)
+        return plan
 
-    def __getitem__(self, key: Union[int, slice]) -> Union[int, 'ChainRange']:
-        """
-        Allows to access elements of 'self' by square brace indexing.
-        Common use-case of throwing ``IndexError`` as a negative result of bound checking
-        in case of single value selection is replaced by returning ``None``.
+    def step_by(self, step: int) -> 'ChainPlan[T_co]':
+        return self._append(SLICE, *normalize_slice(None, None, step))
 
-        >>> ChainRange(0, 20, 2)[3:].collect(tuple)
-        ChainIterable of (6, 8, 10, 12, 14, 16, 18)
+    def take(self, n: int) -> 'ChainPlan[T_co]':
+        return self._append(SLICE, *normalize_slice(n))
 
-        >>> ChainRange(0, 20, 2)[3::2].collect(tuple)
-        ChainIterable of (6, 10, 14, 18)
 
-        Args:
-            key:  `int` or `slice`
-        Returns:
-            if 'item' is `slice`, `ChainRange` over the values selected. Otherwise, single value at the position
+class ChainAsyncIterable(Generic[T_co], metaclass=ChainedMeta):
+    """Wrapper object that provides convenient chain-like methods for any asynchronous iterable."""
+
+    __slots__ = ('_core',)
+
+    def __init__(self, iterable: Union[AsyncIterable[T_co], Iterable[T_co]], /) -> None:
         """
-        if isinstance(key, slice):
-            return ChainRange._make_with_no_checks(self._core[key])
-        return self._core[key]
+        Wrapper object that provides convenient chain-like methods for any asynchronous iterable.
+        Synchronous iterables are accepted as well: they are iterated anew by each consumption,
+        so the wrappers of sequences are re-iterable, while the wrappers of iterators are one-shot.
 
-    def __iter__(self) -> Iterator[int]:
-        return iter(self._core)
+        >>> import asyncio
+        >>> chain = ChainAsyncIterable(range(3, 6))
+        >>> asyncio.run(chain.collect(tuple)), asyncio.run(chain.last())
+        (ChainSequence of (3, 4, 5), 5)
 
-    def __len__(self) -> int:
-        return len(self._core)
+        Args:
+            iterable:  asynchronous or synchronous iterable
+        """
+        if hasattr(iterable, '__aiter__'):
+            self._core: Final[AsyncIterable[T_co]] = iterable  # type: ignore
+        elif hasattr(iterable, '__iter__'):
+            self._core: Final[AsyncIterable[T_co]] = AsyncIterableWrapper(iterable)  # type: ignore
+        else:
+            raise TypeError(
+                'Cannot initialize an instance of `ChainAsyncIterable` '
+                f'from the instance of a non-iterable class {type(iterable)}'
+            )
 
-    def __repr__(self) -> str:
-        return f'ChainRange({self._core.__repr__()[6:-1]})'
+    def __aiter__(self) -> AsyncIterator[T_co]:
+        return self._core.__aiter__()
 
-    def __reversed__(self) -> Iterator[int]:
-        return reversed(self._core)
+    def __repr__(self) -> str:
+        return f'ChainAsyncIterable of {self._core}'
 
     @staticmethod
-    def _make_with_no_checks(rng: range) -> 'ChainRange':  # type: ignore
+    def _make_with_no_checks(aiterable: AsyncIterable[T_co]) -> 'ChainAsyncIterable[T_co]':
         """
         Makes class instance with no safety checks.
 
         Args:
-            rng:  `range` object to wrap around
+            aiterable:  asynchronous iterable to wrap around
         Returns:
-            `ChainRange` wrapper of the range
+            `ChainAsyncIterable` wrapper of the asynchronous iterable
         """
-        instance = ChainRange.__new__(ChainRange)
-        instance._core = rng  # type: ignore
+        instance = ChainAsyncIterable.__new__(ChainAsyncIterable)
+        instance._core = aiterable  # type: ignore
         return instance
 
     @property
-    def core(self) -> range:
+    def core(self) -> AsyncIterable[T_co]:
         """
-        Internal iterable access handler.
-
-        >>> ChainRange(1, 232, 3).core
-        range(1, 232, 3)
+        Internal asynchronous iterable access handler.
 
         Returns:
-            Raw `range` object inside the 'self' instance
+            Raw asynchronous iterable inside the 'self' instance
         """
         return self._core
 
-    def count(self, value: int) -> int:
-        return self._core.count(value)
+    def chunks(self,
+               chunk_size: int,
+               collector: Callable[[Iterable[T_co]], Iterable[T_co]] = tuple) -> 'ChainAsyncIterator[Iterable[T_co]]':
+        """
+        Splits the 'self' into chunks of length `chunk_size`. The last chunk may be shorter.
 
-    def index(self, value: int) -> int:
-        return self._core.index(value)
+        >>> import asyncio
+        >>> asyncio.run(ChainAsyncIterable(range(5)).chunks(2, list).collect(tuple))
+        ChainSequence of ([0, 1], [2, 3], [4])
 
-    def len(self) -> int:
+        Args:
+            chunk_size:  size of chunk
+            collector:   chunk holder, can be any callable with signature (Iterable) -> Iterable
+        Returns:
+            resulting asynchronous iterator
         """
-        Returns the length of the range. Does not iterate anything.
+        return ChainAsyncIterator._make_with_no_checks(achunks(self._core, chunk_size, collector))
 
-        >>> ChainRange(1, 232, 3).len()
-        77
+    async def collect(self, collector: Callable[[Iterable[T_co]], Iterable[M]]) -> ChainIterable[M]:
+        """
+        Awaits all the values of the 'self' and passes them to the 'collector'.
+
+        >>> import asyncio
+        >>> asyncio.run(ChainAsyncIterable(range(5)).collect(list))
+        ChainSequence of [0, 1, 2, 3, 4]
 
+        Args:
+            collector:  any callable with signature (Iterable) -> Iterable
         Returns:
-            range length
+            Result of this consumption wrapped in the instance of 'ChainIterable'
         """
-        return len(self._core)
+        return ChainIterable._make_with_no_checks([item async for item in self._core]).collect(collector)
+
+    def enumerate(self, init_value: int = 0) -> 'ChainAsyncIterator[Tuple[int, T_co]]':
+        """
+        >>> import asyncio
+        >>> asyncio.run(ChainAsyncIterable('ab').enumerate(1).collect(tuple))
+        ChainSequence of ((1, 'a'), (2, 'b'))
+
+        Args:
+            init_value:  initial value to count from
+        Returns:
+            resulting asynchronous iterator
+        """
+        return ChainAsyncIterator._make_with_no_checks(aenumerate(self._core, init_value))
 
+    def filter(self, *predicates: Callable[[T_co], Union[Awaitable[bool], bool]]) -> 'ChainAsyncIterator[T_co]':
+        """
+        Filters values of 'self', applying 'predicates' from left to right.
+        Predicates may be both ordinary and coroutine functions.
+
+        >>> import asyncio
+        >>> async def is_even(x):
+        ...     return x % 2 == 0
+        >>> asyncio.run(ChainAsyncIterable(range(10)).filter(is_even, lambda x: x > 3).collect(tuple))
+        ChainSequence of (4, 6, 8)
+
+        Args:
+            *predicates:  predicates to apply
+        Returns:
+            resulting asynchronous iterator
+        """
+        return ChainAsyncIterator._make_with_no_checks(afilter(predicates, self._core))
+
+    async def first(self, default: Any = None) -> Optional[T_co]:
+        """
+        The iterator over the 'self' is closed afterwards, so that the calls still running in it are cancelled.
+
+        >>> import asyncio
+        >>> asyncio.run(ChainAsyncIterable(()).first('default'))
+        'default'
+
+        Args:
+            default:  return value in case of 'self' is empty
+        Returns:
+            first value of 'self'
+        """
+        iterator = self._core.__aiter__()
+        try:
+            async for item in iterator:
+                return item
+            return default
+        finally:
+            await aclose(iterator)
+
+    async def last(self, *, default: Any = None) -> Optional[T_co]:
+        """
+        >>> import asyncio
+        >>> asyncio.run(ChainAsyncIterable(range(10)).last())
+        9
+
+        Args:
+            default:  default value to return
+        Returns:
+            The last element if 'self' contains anything. 'default' - otherwise
+        """
+        last_elem = default
+        async for last_elem in self._core:
+            pass
+        return last_elem
+
+    def map(self,
+            func: Callable[[T_co], Union[Awaitable[T], T]],
+            /,
+            *funcs: Callable[[Any], Any],
+            concurrency: int = 1,
+            ordered: bool = True) -> 'ChainAsyncIterator':
+        """
+        Maps functions to the values of the 'self'. Functions may be both ordinary and coroutine functions.
+        Up to 'concurrency' calls of each function run at once.
+        The first exception raised by any call is propagated as soon as it is noticed.
+
+        >>> import asyncio
+        >>> async def fetch(x):
+        ...     await asyncio.sleep(0.01)
+        ...     return x * 10
+        >>> asyncio.run(ChainAsyncIterable(range(100)).map(fetch, str, concurrency=50).take(3).collect(tuple))
+        ChainSequence of ('0', '10', '20')
+
+        Args:
+            func:         first function to map
+            *funcs:       remaining functions to map
+            concurrency:  maximum number of calls of each function running at once
+            ordered:      whether to yield results in the order of the arguments or in the completion order
+        Returns:
+            resulting asynchronous iterator
+        """
+        aiterator = amap(func, self._core, concurrency, ordered)
+        for func in funcs:
+            aiterator = amap(func, aiterator, concurrency, ordered)
+        return ChainAsyncIterator._make_with_no_checks(aiterator)
+
+    def skip(self, n: int) -> 'ChainAsyncIterator[T_co]':
+        """
+        >>> import asyncio
+        >>> asyncio.run(ChainAsyncIterable(range(5)).skip(3).collect(tuple))
+        ChainSequence of (3, 4)
+
+        Args:
+            n:    number of items to skip
+        Returns:
+            slice iterator
+        """
+        return ChainAsyncIterator._make_with_no_checks(aislice(self._core, n, None))
+
+    def take(self, n: int) -> 'ChainAsyncIterator[T_co]':
+        """
+        >>> import asyncio
+        >>> asyncio.run(ChainAsyncIterable(range(5)).take(3).collect(tuple))
+        ChainSequence of (0, 1, 2)
+
+        Args:
+            n:    number of items
+        Returns:
+            slice iterator
+        """
+        return ChainAsyncIterator._make_with_no_checks(aislice(self._core, n))
+
+    def zip(self: 'ChainAsyncIterable[M_co]',
+            *iterables: Union[AsyncIterable[M_co], Iterable[M_co]]) -> 'ChainAsyncIterator[Tuple[M_co, ...]]':
+        """
+        "Zips up" the 'self' with synchronous or asynchronous 'iterables' into a single iterator of tuples.
+
+        >>> import asyncio
+        >>> asyncio.run(ChainAsyncIterable((1, 2, 3)).zip((4, 5, 6), ChainAsyncIterable((7, 8))).collect(tuple))
+        ChainSequence of ((1, 4, 7), (2, 5, 8))
+
+        Args:
+            *iterables:  iterables to "zip up"
+        Returns:
+            resulting asynchronous iterator
+        """
+        return ChainAsyncIterator._make_with_no_checks(azip(self._core, *iterables))
+
+
+class ChainAsyncIterator(ChainAsyncIterable[T_co]):
+    """``ChainAsyncIterable`` iterator"""
+
+    __slots__ = ()
 
-# Cache dict for storing already created class - to - chain-class associations
+    def __init__(self, iterable: Union[AsyncIterable[T_co], Iterable[T_co]], /) -> None:
+        """
+        ``ChainAsyncIterable`` iterator.
+
+        Args:
+            iterable:  asynchronous or synchronous iterable object to wrap in
+        """
+        if not hasattr(iterable, '__aiter__') and not hasattr(iterable, '__iter__'):
+            raise TypeError(
+                'Cannot initialize an instance of `ChainAsyncIterator` '
+                f'from the instance of a non-iterable class {type(iterable)}'
+            )
+        self._core: Final = as_async_iterator(iterable)  # type: ignore
+
+    def __aiter__(self) -> AsyncIterator[T_co]:
+        return self._core  # type: ignore
+
+    def __anext__(self) -> Awaitable[T_co]:
+        return self._core.__anext__()  # type: ignore
+
+    def __repr__(self) -> str:
+        return f'ChainAsyncIterator wrapper of {self._core}'
+
+    @staticmethod
+    def _make_with_no_checks(aiterator: AsyncIterator[T_co]) -> 'ChainAsyncIterator[T_co]':  # type: ignore
+        """
+        Makes class instance with no safety checks.
+
+        Args:
+            aiterator:  asynchronous iterator to wrap around
+        Returns:
+            `ChainAsyncIterator` wrapper of the asynchronous iterator
+        """
+        instance = ChainAsyncIterator.__new__(ChainAsyncIterator)
+        instance._core = aiterator  # type: ignore
+        return instance
+
+
+# Class - to - chain-class associations that hold regardless of ABC registrations
 _registered_chain_classes: Final[Dict] = {
     GeneratorType: ChainGenerator,
-    range: ChainRange
+    range: ChainRange,
+    ArithmeticProgression: ChainCount,
+    GeometricProgression: ChainLazySequence,
+    Recurrence: ChainLazySequence,
+    MappedRecords: ChainRecords,
+    StructRecords: ChainStructRecords
 }
 
+# ABCs and chain classes for their instances, from the most specific to the least specific ones
+_abc_chain_classes: Final = (
+    (abc.Sequence, ChainSequence),
+    (abc.Mapping, ChainMapping),
+    (abc.Set, ChainSet),
+    (abc.Iterator, ChainIterator),
+    (abc.Reversible, ChainReversible),
+    (abc.AsyncIterator, ChainAsyncIterator),
+    (abc.AsyncIterable, ChainAsyncIterable),
+)
+
+# Cache for storing already resolved class - to - chain-class associations
+_resolved_chain_classes: Final = TypeCache()
+
 
 @overload
-def seq(start: int, ell: 'ellipsis', /) -> ChainIterator[int]:
+def seq(start: int, ell: 'ellipsis', /) -> ChainCount:
     pass
 
 
@@ -1249,7 +4085,7 @@ def seq(start: int, ell: 'ellipsis', end: int, /) -> ChainRange:
 
 
 @overload
-def seq(start: int, second: int, ell: 'ellipsis', /) -> ChainIterator[int]:
+def seq(start: int, second: int, ell: 'ellipsis', /) -> ChainCount:
     pass
 
 
@@ -1268,24 +4104,46 @@ def seq(start: int, second: int, ell: 'ellipsis', /, *, last: int) -> ChainRange
     pass
 
 
+@overload
+def seq(start: int, second: int, third: int, ell: 'ellipsis', /) -> ChainIterable[int]:
+    pass
+
+
+@overload
+def seq(start: int, second: int, third: int, ell: 'ellipsis', end: int, /) -> ChainIterable[int]:
+    pass
+
+
+@overload
+def seq(start: int, second: int, third: int, ell: 'ellipsis', /, *, last: int) -> ChainIterable[int]:
+    pass
+
+
+@overload
+def seq(*initial_and_ellipsis: Any, rule: Callable[..., T]) -> 'ChainLazySequence[T]':
+    pass
+
+
 @overload
 def seq(*args: int) -> ChainIterable[int]:
     pass
 
 
 @cleandoc_deco
-def seq(*args: Union[int, 'ellipsis'], last: Optional[int] = None) -> ChainIterable[int]:
+def seq(*args: Union[int, 'ellipsis'],
+        last: Optional[int] = None,
+        rule: Optional[Callable[..., Any]] = None) -> ChainIterable[int]:
     """
-    Creates a sequence that can be one of the following seven types.
+    Creates a sequence that can be one of the following types.
 
     >>> seq(3, ...)              # [3, +∞)                 # step = 1
-    ChainIterator wrapper of count(3)
+    ChainCount(3)
 
     >>> seq(3, ..., 10)          # [3, 10)                 # step = 1
     ChainRange(3, 10)
 
     >>> seq(2, 5, ...)           # [2, 5, 8, 11, ..., +∞)  # step = 3
-    ChainIterator wrapper of count(2, 3)
+    ChainCount(2, 3)
 
     >>> seq(2, 5, ..., 10)       # [2, 5, 8]               # step = 3
     ChainRange(2, 10, 3)
@@ -1297,11 +4155,27 @@ def seq(*args: Union[int, 'ellipsis'], last: Optional[int] = None) -> ChainItera
     ChainRange(2, 11, 2)
 
     >>> seq(1, 3, -1, -22, 1)    # [1, 3, -1, -22, 1]      # arbitrary sequence
-    ChainIterable of (1, 3, -1, -22, 1)
+    ChainSequence of (1, 3, -1, -22, 1)
+
+    Three terms before the Ellipsis may also define a geometric progression.
+    Its ratio is an integer if it divides the terms exactly. Otherwise, it is a float.
+
+    >>> seq(1, 2, 4, ...)        # [1, 2, 4, 8, ..., +∞)   # ratio = 2
+    ChainLazySequence of GeometricProgression(1, 2)
+
+    >>> seq(1, 2, 4, ..., 100)   # [1, 2, 4, ..., 64]      # ratio = 2
+    ChainSequence of SequenceView([1, 2, 4, 8, 16, 32, 64])
+
+    'rule' defines a recurrence: the next term is computed from as many preceding terms as given before the Ellipsis.
+    The terms are memoized in a bounded cache.
+
+    >>> seq(1, 1, ..., rule=lambda a, b: a + b)[10]
+    89
 
     Args:
         *args:  positional arguments as in the examples
         last:   optional last element of the sequence
+        rule:   optional function computing the next term from the preceding ones
     Returns:
         resulting sequence
     """
@@ -1309,16 +4183,28 @@ def seq(*args: Union[int, 'ellipsis'], last: Optional[int] = None) -> ChainItera
         if elem is Ellipsis:
             break
     else:
-        return ChainIterable._make_with_no_checks(args)  # type: ignore
+        if rule is not None or last is not None:
+            raise ValueError(
+                "Parameters 'rule' and 'last' should not be defined "
+                'if there is no Ellipsis among the positional arguments'
+            )
+        return ChainSequence._make_with_no_checks(args)  # type: ignore
 
     arg_length = len(args)
     left_bound = args[0]
 
+    if rule is not None:
+        if not i or arg_length != i + 1 or last is not None:
+            raise IndexError(
+                "Only (arg1, ..., argN, ...) signature is allowed if parameter 'rule' is defined"
+            )
+        return ChainLazySequence._make_with_no_checks(Recurrence(args[:i], rule))
+
     if i == 1:
 
         if arg_length == 2:
             if last is None:
-                return ChainIterator._make_with_no_checks(count(left_bound))  # type: ignore
+                return ChainCount(left_bound)  # type: ignore
             return ChainRange(left_bound, last + 1)  # type: ignore
 
         if arg_length == 3:
@@ -1340,7 +4226,7 @@ def seq(*args: Union[int, 'ellipsis'], last: Optional[int] = None) -> ChainItera
         step = args[1] - left_bound  # type: ignore
         if arg_length == 3:
             if last is None:
-                return ChainIterator._make_with_no_checks(count(left_bound, step))  # type: ignore
+                return ChainCount(left_bound, step)  # type: ignore
             return ChainRange(left_bound, last + 1, step)  # type: ignore
 
         if arg_length == 4:
@@ -1357,8 +4243,31 @@ def seq(*args: Union[int, 'ellipsis'], last: Optional[int] = None) -> ChainItera
             '(start, second, ..., stop), (arg1, second, ..., last=last) signatures are only allowed'
         )
 
+    if i == 3 and arg_length <= 5 and all(isinstance(arg, Number) for arg in args[:3]):
+        second, third = args[1], args[2]
+        if second - left_bound == third - second:  # type: ignore
+            return seq(left_bound, second, *args[3:], last=last)  # type: ignore
+        if left_bound and second * second == left_bound * third:  # type: ignore
+            ratio = second // left_bound if not second % left_bound else second / left_bound  # type: ignore
+            progression = GeometricProgression(left_bound, ratio)
+            if arg_length == 4:
+                if last is None:
+                    return ChainLazySequence._make_with_no_checks(progression)
+                return ChainSequence._make_with_no_checks(
+                    SequenceView(progression, range(progression.terms_before(last, inclusive=True)))
+                )
+            if last is not None:
+                raise ValueError(
+                    "Parameter 'last' should not be defined "
+                    'if positional arguments obey the following pattern: (start, second, third, ..., stop)'
+                )
+            return ChainSequence._make_with_no_checks(
+                SequenceView(progression, range(progression.terms_before(args[-1])))
+            )
+
     raise IndexError(
-        'Ellipsis can be a placeholder only at the 1st or the 2nd index positions'
+        'Ellipsis can be a placeholder only at the 1st or the 2nd index positions '
+        'or at the 3rd one if the preceding terms form an arithmetic or a geometric progression'
     )
 
 
@@ -1372,13 +4281,31 @@ def make_chain(iterable: Iterable[T]) -> ChainIterable[T]:
     pass
 
 
+@cleandoc_deco
 def make_chain(iterable: Iterable[T]) -> ChainIterable[T]:
-    # TODO
-    if hasattr(iterable, '__iter__'):
-        if hasattr(iterable, '__next__'):
-            return ChainIterator._make_with_no_checks(iterable)  # type: ignore
-        return ChainIterable._make_with_no_checks(iterable)
-    raise TypeError('')
+    """
+    Wraps the 'iterable' into the chain class that provides the most efficient methods for it.
+
+    >>> make_chain([1, 2, 3])
+    ChainSequence of [1, 2, 3]
+
+    >>> make_chain({'a': 1})
+    ChainMapping of {'a': 1}
+
+    >>> make_chain(range(3))
+    ChainRange(0, 3)
+
+    >>> make_chain(iter((1, 2)))  # doctest: +ELLIPSIS
+    ChainIterator wrapper of <tuple_iterator object at ...>
+
+    Args:
+        iterable:  synchronous or asynchronous iterable to wrap
+    Returns:
+        chain over the 'iterable'
+    """
+    if not hasattr(iterable, '__iter__') and not hasattr(iterable, '__aiter__'):
+        raise TypeError(f'Cannot make a chain from the instance of a non-iterable class {type(iterable)}')
+    return resolve_appropriate_container(type(iterable))._make_with_no_checks(iterable)
 
 
 c = seq
@@ -1,5 +1,8 @@
+from abc import get_cache_token
 from collections import abc, deque, defaultdict
-from typing import Final, Mapping, Type, Tuple, Dict
+from types import AsyncGeneratorType, GeneratorType
+from typing import Any, Callable, Final, Iterable, Mapping, Optional, Type, Tuple, Dict
+from weakref import WeakKeyDictionary
 
 from chained.type_utils.typevar import T
 
@@ -133,20 +136,91 @@ _all_abcs: Final = {
 }
 
 
-def resolve_abstract_bases(cls):
+class TypeCache:
+    """
+    Per-type cache that does not keep the types alive and is cleared
+    whenever a new virtual subclass is registered to any ABC.
+    Entries of the prefilled types are recomputed after clearing.
     """
-    Finds abstract base classes from the 'collections.abc'
-    for a collection type that most closely match its interface.
 
-    Result is a dictionary with these ABCs as keys and their priorities* as values.
+    __slots__ = ('_data', '_token', '_prefilled', '_function')
 
-    *based on topological sorting of the hierarchical graph of their relationships
+    def __init__(self) -> None:
+        """
+        Per-type cache that does not keep the types alive.
 
-    Args:
-        cls:  type to find ABCs for
-    Returns:
-        Resulting dict
-    """
+        >>> cache = TypeCache()
+        >>> cache[list] = 1
+        >>> cache.get(list), cache.get(tuple)
+        (1, None)
+
+        >>> class Virtual(abc.Sized): pass
+        >>> class Dummy: pass
+        >>> _ = Virtual.register(Dummy)
+        >>> cache.get(list) is None
+        True
+        """
+        self._data: Final[WeakKeyDictionary] = WeakKeyDictionary()
+        self._token = get_cache_token()
+        self._prefilled: Tuple[type, ...] = ()
+        self._function: Optional[Callable[[type], Any]] = None
+
+    def __setitem__(self, cls: type, value: Any) -> None:
+        try:
+            self._data[cls] = value
+        except TypeError:
+            # Type does not support weak references, so it is not cached
+            pass
+
+    def get(self, cls: type, default: Optional[Any] = None) -> Any:
+        """
+        Args:
+            cls:      type to look up
+            default:  value to return if there is no entry for the 'cls'
+        Returns:
+            cached value
+        """
+        token = get_cache_token()
+        if token != self._token:
+            # ABC registrations may change results of `issubclass` checks
+            self._data.clear()
+            self._token = token
+            self._fill()
+        try:
+            return self._data.get(cls, default)
+        except TypeError:
+            return default
+
+    def _fill(self) -> None:
+        function = self._function
+        if function is not None:
+            for cls in self._prefilled:
+                self[cls] = function(cls)
+
+    def prefill(self, types: Iterable[type], function: Callable[[type], Any]) -> None:
+        """
+        Computes the entries of the 'types' in advance and recomputes them whenever the cache is cleared,
+        so that they are never missed, however many ABC registrations there are.
+
+        >>> cache = TypeCache()
+        >>> cache.prefill((list, tuple), lambda cls: cls.__name__)
+        >>> class Virtual(abc.Sized): pass
+        >>> class Dummy: pass
+        >>> _ = Virtual.register(Dummy)
+        >>> cache.get(list)
+        'list'
+
+        Args:
+            types:     types to keep in the cache
+            function:  function computing the entry of a type
+        """
+        self._prefilled = tuple(types)
+        self._function = function
+        self._fill()
+
+
+def _resolve_abstract_bases(cls: type) -> Dict[type, int]:
+    """Uncached implementation of ``resolve_abstract_bases``."""
     matched_abcs = {}
     abcs_to_check = _all_abcs.copy()
     abcs_to_remove = deque(())
@@ -170,3 +244,43 @@ def resolve_abstract_bases(cls):
             abcs_to_check.remove(abc_to_remove)
             abcs_to_remove.extend(_abc_hierarchy[abc_to_remove])
     return matched_abcs
+
+
+# Resolved ABCs of the types seen so far
+_resolved_abcs: Final = TypeCache()
+
+# Builtin containers resolved in advance to make the first `collect` calls cheap
+_builtin_containers: Final = (
+    tuple, list, str, bytes, bytearray, memoryview, range,
+    dict, set, frozenset, deque,
+    type({}.keys()), type({}.values()), type({}.items()),
+    type(iter(())), type(iter([])), type(iter(range(0))),
+    GeneratorType, AsyncGeneratorType
+)
+_resolved_abcs.prefill(_builtin_containers, _resolve_abstract_bases)
+
+
+def resolve_abstract_bases(cls):
+    """
+    Finds abstract base classes from the 'collections.abc'
+    for a collection type that most closely match its interface.
+
+    Result is a dictionary with these ABCs as keys and their priorities* as values.
+    Results are memoized per type until the next ABC registration.
+
+    *based on topological sorting of the hierarchical graph of their relationships
+
+    >>> resolve_abstract_bases(list)
+    {<class 'collections.abc.MutableSequence'>: 3}
+
+    Args:
+        cls:  type to find ABCs for
+    Returns:
+        Resulting dict
+    """
+    matched_abcs = _resolved_abcs.get(cls)
+    if matched_abcs is None:
+        matched_abcs = _resolve_abstract_bases(cls)
+        _resolved_abcs[cls] = matched_abcs
+    # Copied so that callers cannot corrupt the cache
+    return dict(matched_abcs)
@@ -0,0 +1,189 @@
+from itertools import islice, repeat
+from math import fsum, sqrt
+from operator import mul, sub
+from typing import Any, Dict, Final, Iterable, Sequence
+
+from chained.functions.lambded import np
+from chained.type_utils.meta import ChainedMeta
+
+# Statistics supported by ``Moments.result`` in the order of their output
+STATISTICS: Final = ('count', 'sum', 'mean', 'var', 'std', 'min', 'max')
+
+# Number of elements summarized at once in C before being merged into the running summary
+_CHUNK_SIZE: Final = 4096
+
+
+class Moments(metaclass=ChainedMeta):
+    """Mergeable single-pass summary of real numbers: count, sum, mean, sum of squared deviations and extrema."""
+
+    __slots__ = ('_spread', '_extrema', '_count', '_total', '_compensation', '_mean', '_m2', '_min', '_max')
+
+    def __init__(self, spread: bool = True, extrema: bool = True) -> None:
+        """
+        Mergeable single-pass summary of real numbers.
+        Chunks of elements are summarized in C: exactly rounded sums by ``math.fsum`` and squared deviations
+        from the chunk mean. Chunk summaries are merged by the pairwise formulas of Chan et al.,
+        and the chunk sums are accumulated with Neumaier compensation.
+
+        >>> moments = Moments()
+        >>> moments.update([1e16, 1.0, -1e16] * 1000)
+        >>> moments.result(('count', 'sum', 'min'))
+        {'count': 3000, 'sum': 1000.0, 'min': -1e+16}
+
+        Args:
+            spread:   whether to track the squared deviations (needed for 'var' and 'std')
+            extrema:  whether to track the minimum and the maximum
+        """
+        self._spread: Final = spread
+        self._extrema: Final = extrema
+        self._count = 0
+        self._total: Any = 0
+        self._compensation = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min: Any = None
+        self._max: Any = None
+
+    def _merge(self, count: int, total: Any, mean: float, m2: float, low: Any, high: Any) -> None:
+        """Merges the summary of a chunk into the 'self'."""
+        if not count:
+            return
+        if not self._count:
+            self._count, self._total, self._mean, self._m2, self._min, self._max = count, total, mean, m2, low, high
+            return
+        new_count = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / new_count
+        self._m2 += m2 + delta * delta * self._count * count / new_count
+        self._count = new_count
+
+        previous = self._total
+        new_total = previous + total
+        if isinstance(new_total, float):
+            # Neumaier compensation of the error of the addition
+            if abs(previous) >= abs(total):
+                self._compensation += (previous - new_total) + total
+            else:
+                self._compensation += (total - new_total) + previous
+        self._total = new_total
+
+        if self._extrema:
+            if low < self._min:
+                self._min = low
+            if high > self._max:
+                self._max = high
+
+    def merge(self, other: 'Moments') -> None:
+        """
+        Merges the summary of other elements into the 'self'.
+
+        >>> left, right = Moments(), Moments()
+        >>> left.update([1, 2, 3])
+        >>> right.update([4, 5])
+        >>> left.merge(right)
+        >>> left.result(('mean', 'var', 'max'))
+        {'mean': 3.0, 'var': 2.0, 'max': 5}
+
+        Args:
+            other:  summary tracking the same statistics
+        """
+        self._merge(other._count, other._total, other._mean, other._m2, other._min, other._max)
+        self._compensation += other._compensation
+
+    def result(self, statistics: Sequence[str] = STATISTICS, ddof: int = 0, default: Any = None) -> Dict[str, Any]:
+        """
+        Args:
+            statistics:  names of the statistics from `STATISTICS`
+            ddof:        delta degrees of freedom: the variance is divided by ``count - ddof``
+            default:     value of the statistics that are not defined for the number of elements summarized
+        Returns:
+            dictionary of the statistics
+        """
+        count = self._count
+        total = self._total + self._compensation if isinstance(self._total, float) else self._total
+        var = self._m2 / (count - ddof) if count > ddof else default
+        values = {
+            'count': count,
+            'sum': total,
+            'mean': total / count if count else default,
+            'var': var,
+            'std': default if var is default else sqrt(var),
+            'min': default if self._min is None else self._min,
+            'max': default if self._max is None else self._max
+        }
+        return {name: values[name] for name in statistics}
+
+    def update(self, values: Iterable[Any]) -> None:
+        """
+        Summarizes the 'values' chunk by chunk.
+
+        Args:
+            values:  real numbers
+        """
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, _CHUNK_SIZE))
+            if not chunk:
+                return
+            self.update_batch(chunk)
+
+    def update_batch(self, batch: Any) -> None:
+        """
+        Summarizes a batch of elements at once.
+
+        Args:
+            batch:  list, ``array.array`` or NumPy array of real numbers
+        """
+        count = len(batch)
+        if not count:
+            return
+        if np is not None and isinstance(batch, np.ndarray):
+            total = batch.sum().item()
+            mean = total / count
+            m2 = float(np.square(batch - mean).sum()) if self._spread else 0.0
+            low, high = (batch.min().item(), batch.max().item()) if self._extrema else (None, None)
+            self._merge(count, total, mean, m2, low, high)
+            return
+        total = sum(batch)
+        if type(total) is float:
+            total = fsum(batch)
+        mean = total / count
+        m2 = 0.0
+        if self._spread:
+            deviations = list(map(sub, batch, repeat(mean, count)))
+            m2 = fsum(map(mul, deviations, deviations))
+        low, high = (min(batch), max(batch)) if self._extrema else (None, None)
+        self._merge(count, total, mean, m2, low, high)
+
+
+def aggregate(iterable: Iterable[Any],
+              statistics: Sequence[str],
+              ddof: int = 0,
+              default: Any = None,
+              batched: bool = False) -> Dict[str, Any]:
+    """
+    Computes the 'statistics' of the elements of the 'iterable' in a single pass.
+
+    >>> aggregate(range(1, 101), ('sum', 'mean', 'std'))
+    {'sum': 5050, 'mean': 50.5, 'std': 28.86607004772212}
+
+    Args:
+        iterable:    real numbers or, if 'batched', batches of them
+        statistics:  names of the statistics from `STATISTICS`
+        ddof:        delta degrees of freedom of the variance
+        default:     value of the statistics that are not defined for the number of elements
+        batched:     whether the elements of the 'iterable' are lists, ``array.array`` or NumPy arrays
+    Returns:
+        dictionary of the statistics
+    """
+    unknown = set(statistics).difference(STATISTICS)
+    if unknown:
+        raise ValueError(f'Unknown statistics: {sorted(unknown)}. Supported ones: {STATISTICS}')
+    moments = Moments(spread=bool({'var', 'std'}.intersection(statistics)),
+                      extrema=bool({'min', 'max'}.intersection(statistics)))
+    if batched:
+        for batch in iterable:
+            moments.update_batch(batch)
+    else:
+        moments.update(iterable)
+    return moments.result(statistics, ddof, default)
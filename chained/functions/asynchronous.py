@@ -0,0 +1,269 @@
+from asyncio import FIRST_COMPLETED, Future, ensure_future, wait
+from collections import deque
+from inspect import isawaitable
+from itertools import count
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Final,
+    Iterable,
+    Optional,
+    Tuple,
+    Union
+)
+
+from chained.functions.plan import normalize_slice
+from chained.type_utils.meta import ChainedMeta
+from chained.type_utils.typevar import T, M
+
+
+async def to_async(iterable: Iterable[T]) -> AsyncGenerator[T, None]:
+    """
+    Wraps a synchronous iterable into an asynchronous generator.
+
+    >>> import asyncio
+    >>> async def main():
+    ...     return [x async for x in to_async(range(3))]
+    >>> asyncio.run(main())
+    [0, 1, 2]
+
+    Args:
+        iterable:  iterable to wrap
+    Returns:
+        asynchronous generator over the values of the 'iterable'
+    """
+    for item in iterable:
+        yield item
+
+
+class AsyncIterableWrapper(metaclass=ChainedMeta):
+    """Asynchronous iterable over a synchronous one, re-iterable as long as the wrapped iterable is."""
+
+    __slots__ = ('_iterable',)
+
+    def __init__(self, iterable: Iterable[T]) -> None:
+        """
+        Asynchronous iterable over a synchronous one. Each ``__aiter__`` call iterates the 'iterable' anew,
+        so wrappers of sequences are re-iterable, while wrappers of iterators are one-shot.
+
+        >>> import asyncio
+        >>> async def main(aiterable):
+        ...     return [x async for x in aiterable], [x async for x in aiterable]
+        >>> asyncio.run(main(AsyncIterableWrapper(range(2))))
+        ([0, 1], [0, 1])
+
+        Args:
+            iterable:  iterable to wrap
+        """
+        self._iterable: Final = iterable
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return to_async(self._iterable)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._iterable!r})'
+
+
+async def aclose(aiterator: AsyncIterator) -> None:
+    """Closes the 'aiterator' if it can be closed, e.g. if it is an asynchronous generator."""
+    close = getattr(aiterator, 'aclose', None)
+    if close is not None:
+        await close()
+
+
+def as_async_iterator(iterable: Union[AsyncIterable[T], Iterable[T]]) -> AsyncIterator[T]:
+    """
+    Returns:
+        asynchronous iterator over the 'iterable' that may be either synchronous or asynchronous
+    """
+    if hasattr(iterable, '__aiter__'):
+        return iterable.__aiter__()  # type: ignore
+    return to_async(iterable)  # type: ignore
+
+
+async def resolve(value: Union[Awaitable[T], T]) -> T:
+    """Awaits the 'value' if it is awaitable."""
+    if isawaitable(value):
+        return await value  # type: ignore
+    return value  # type: ignore
+
+
+async def _amap(function: Callable[[T], Union[Awaitable[M], M]],
+                aiterable: AsyncIterable[T],
+                concurrency: int,
+                ordered: bool) -> AsyncGenerator[M, None]:
+    iterator = aiterable.__aiter__()
+    pending: Deque[Future] = deque()
+    exhausted = False
+    try:
+        if concurrency == 1:
+            async for item in iterator:
+                yield await resolve(function(item))
+            return
+
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    pending.append(ensure_future(resolve(function(item))))
+            if not pending:
+                return
+
+            if not (pending[0].done() if ordered else any(task.done() for task in pending)):
+                await wait([task for task in pending if not task.done()], return_when=FIRST_COMPLETED)
+            for task in pending:
+                if task.done() and task.exception() is not None:
+                    raise task.exception()  # type: ignore
+
+            if ordered:
+                while pending and pending[0].done():
+                    yield pending.popleft().result()
+            else:
+                done = [task for task in pending if task.done()]
+                for task in done:
+                    pending.remove(task)
+                for task in done:
+                    yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await aclose(iterator)
+
+
+def amap(function: Callable[[T], Union[Awaitable[M], M]],
+         aiterable: AsyncIterable[T],
+         concurrency: int = 1,
+         ordered: bool = True) -> AsyncGenerator[M, None]:
+    """
+    Asynchronous analogue of ``map`` accepting both ordinary and coroutine functions.
+    Up to 'concurrency' calls are run at once as tasks. The first exception raised by any call
+    is propagated as soon as it is noticed. Closing the generator cancels the running tasks and closes the source.
+
+    >>> import asyncio
+    >>> async def double(x):
+    ...     await asyncio.sleep(0.05 * (3 - x))
+    ...     return x * 2
+    >>> async def main(ordered):
+    ...     return [x async for x in amap(double, to_async(range(4)), 4, ordered)]
+    >>> asyncio.run(main(True))
+    [0, 2, 4, 6]
+
+    >>> asyncio.run(main(False))
+    [6, 4, 2, 0]
+
+    Args:
+        function:     function or coroutine function to apply
+        aiterable:    asynchronous iterable of arguments
+        concurrency:  maximum number of calls running at once
+        ordered:      whether to yield results in the order of the arguments or in the completion order
+    Returns:
+        asynchronous generator over the results
+    """
+    if concurrency < 1:
+        raise ValueError(f'Concurrency should be positive. Got: {concurrency}')
+    return _amap(function, aiterable, concurrency, ordered)
+
+
+async def afilter(predicates: Tuple[Callable[[T], Any], ...], aiterable: AsyncIterable[T]) -> AsyncGenerator[T, None]:
+    """Asynchronous analogue of ``compose_filter`` accepting both ordinary and coroutine predicates."""
+    iterator = aiterable.__aiter__()
+    try:
+        async for item in iterator:
+            for pred in predicates:
+                if not await resolve(pred(item)):
+                    break
+            else:
+                yield item
+    finally:
+        await aclose(iterator)
+
+
+async def aislice(aiterable: AsyncIterable[T], *args: Optional[int]) -> AsyncGenerator[T, None]:
+    """
+    Asynchronous analogue of ``itertools.islice``. The source is closed as soon as the slice is complete,
+    so that the tasks still running in it (e.g. in ``amap``) are cancelled.
+
+    >>> import asyncio
+    >>> async def main():
+    ...     return [x async for x in aislice(to_async(range(10)), 2, 8, 3)]
+    >>> asyncio.run(main())
+    [2, 5]
+
+    Args:
+        aiterable:  asynchronous iterable to slice
+        *args:      slicing parameters: ([start,] stop[, step])
+    Returns:
+        asynchronous generator over the values selected
+    """
+    start, stop, step = normalize_slice(*args)
+    if stop is not None and stop <= start:
+        return
+    next_index = start
+    enumerated = aenumerate(aiterable)
+    try:
+        async for i, item in enumerated:
+            if i == next_index:
+                yield item
+                next_index += step
+                if stop is not None and next_index >= stop:
+                    return
+    finally:
+        await enumerated.aclose()
+
+
+async def aenumerate(aiterable: AsyncIterable[T], init_value: int = 0) -> AsyncGenerator[Tuple[int, T], None]:
+    """Asynchronous analogue of ``enumerate``."""
+    counter = count(init_value)
+    iterator = aiterable.__aiter__()
+    try:
+        async for item in iterator:
+            yield next(counter), item
+    finally:
+        await aclose(iterator)
+
+
+async def achunks(aiterable: AsyncIterable[T],
+                  chunk_size: int,
+                  collector: Callable[[Iterable[T]], Iterable[T]] = tuple) -> AsyncGenerator[Iterable[T], None]:
+    """Splits the 'aiterable' into chunks of length `chunk_size` collected by the 'collector'."""
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size should be positive. Got: {chunk_size}')
+    chunk = []
+    iterator = aiterable.__aiter__()
+    try:
+        async for item in iterator:
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield collector(chunk)
+                chunk = []
+    finally:
+        await aclose(iterator)
+    if chunk:
+        yield collector(chunk)
+
+
+async def azip(*iterables: Union[AsyncIterable, Iterable]) -> AsyncGenerator[Tuple, None]:
+    """Asynchronous analogue of ``zip`` accepting both synchronous and asynchronous iterables."""
+    iterators = tuple(map(as_async_iterator, iterables))
+    if not iterators:
+        return
+    try:
+        while True:
+            values = []
+            for iterator in iterators:
+                try:
+                    values.append(await iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+            yield tuple(values)
+    finally:
+        for iterator in iterators:
+            await aclose(iterator)
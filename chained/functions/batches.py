@@ -0,0 +1,137 @@
+from array import array
+from collections import abc
+from itertools import compress, islice
+from typing import Any, Callable, Final, Generator, Iterable, Optional, Union
+
+from chained.functions.lambded import np
+from chained.functions.vectorized import _int64_bounds
+
+# Batch backends
+ARRAY: Final = 'array'
+NUMPY: Final = 'numpy'
+
+
+def _check_size(size: int) -> None:
+    if size < 1:
+        raise ValueError(f'Batch size should be positive. Got: {size}')
+
+
+def array_batches(iterable: Iterable, size: int, typecode: str = 'd') -> Generator[array, None, None]:
+    """
+    Splits the 'iterable' into ``array.array`` batches of length `size`. The last batch may be shorter.
+
+    >>> tuple(array_batches(range(5), 2, 'l'))
+    (array('l', [0, 1]), array('l', [2, 3]), array('l', [4]))
+
+    Args:
+        iterable:  numeric iterable
+        size:      batch size
+        typecode:  ``array.array`` type code
+    Returns:
+        generator over the batches
+    """
+    _check_size(size)
+    if isinstance(iterable, array) and iterable.typecode == typecode:
+        for i in range(0, len(iterable), size):
+            yield iterable[i:i + size]
+        return
+    iterator = iter(iterable)
+    while True:
+        batch = array(typecode, islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def numpy_batches(iterable: Iterable, size: int, dtype: Any = 'd') -> Generator:
+    """
+    Splits the 'iterable' into NumPy arrays of length `size`. The last array may be shorter.
+    Arrays and ranges are sliced without iterating their elements in Python,
+    the number of elements of other sized iterables is passed to ``np.fromiter`` in advance.
+
+    Args:
+        iterable:  numeric iterable
+        size:      batch size
+        dtype:     NumPy data type
+    Returns:
+        generator over the arrays
+    """
+    if np is None:
+        raise ImportError('NumPy is required to make NumPy batches')
+    _check_size(size)
+    dtype = np.dtype(dtype)
+
+    if isinstance(iterable, np.ndarray) and iterable.ndim == 1:
+        for i in range(0, len(iterable), size):
+            yield iterable[i:i + size].astype(dtype, copy=False)
+        return
+
+    if isinstance(iterable, range) and _int64_bounds[0] <= min(iterable.start, iterable.stop) \
+            and max(iterable.start, iterable.stop) <= _int64_bounds[1]:
+        for i in range(0, len(iterable), size):
+            sub_range = iterable[i:i + size]
+            yield np.arange(sub_range.start, sub_range.stop, sub_range.step, dtype=dtype)
+        return
+
+    iterator = iter(iterable)
+    if isinstance(iterable, abc.Sized):
+        remaining = len(iterable)
+        while remaining > 0:
+            count = min(size, remaining)
+            yield np.fromiter(iterator, dtype, count)
+            remaining -= count
+        return
+
+    while True:
+        batch = np.fromiter(islice(iterator, size), dtype)
+        if not len(batch):
+            return
+        yield batch
+
+
+def filter_batch(predicate: Callable[[Any], Any], batch: Union[array, Any]) -> Union[array, Any]:
+    """
+    Selects the elements of the 'batch' satisfying the 'predicate'.
+    NumPy arrays are passed to the 'predicate' at once, and it should return a boolean mask.
+    ``array.array`` elements are passed to the 'predicate' one by one.
+
+    >>> filter_batch(lambda v: v > 1, array('l', [0, 2, 1, 3]))
+    array('l', [2, 3])
+
+    Args:
+        predicate:  predicate to apply
+        batch:      ``array.array`` or NumPy array
+    Returns:
+        batch of the selected elements
+    """
+    if isinstance(batch, array):
+        return array(batch.typecode, compress(batch, map(predicate, batch)))
+    return batch[np.asarray(predicate(batch), dtype=bool)]
+
+
+def reduce_batches(batches: Iterable, reducer: str, default: Optional[Any] = None) -> Any:
+    """
+    Reduces the elements of all the 'batches' by 'sum', 'min' or 'max'.
+
+    >>> reduce_batches((array('d', [1, 5]), array('d', [3])), 'max')
+    5.0
+
+    Args:
+        batches:  ``array.array`` or NumPy arrays
+        reducer:  'sum', 'min' or 'max'
+        default:  value to return if there are no elements ('sum' returns 0)
+    Returns:
+        Python scalar
+    """
+    builtin = {'sum': sum, 'min': min, 'max': max}[reducer]
+    partials = []
+    for batch in batches:
+        if not len(batch):
+            continue
+        if isinstance(batch, array):
+            partials.append(builtin(batch))
+        else:
+            partials.append(getattr(batch, reducer)().item())
+    if not partials:
+        return 0 if reducer == 'sum' else default
+    return builtin(partials)
@@ -0,0 +1,355 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, islice, repeat
+from math import ceil, fsum, pi, sin
+from operator import mul
+from random import Random
+from typing import Any, Final, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from chained.functions.lambded import np
+from chained.type_utils.meta import ChainedMeta
+
+# Quantile estimation methods
+TDIGEST: Final = 'tdigest'
+KLL: Final = 'kll'
+
+# Number of values buffered at once before being merged into a digest
+_CHUNK_SIZE: Final = 4096
+
+
+def _check_quantiles(qs: Sequence[float]) -> None:
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError(f'Quantiles should be from 0 to 1. Got: {q}')
+
+
+def _chunks(iterable: Iterable[Any]) -> Iterator[List[Any]]:
+    """Splits the 'iterable' into lists of `_CHUNK_SIZE` values. NumPy arrays are converted at once."""
+    if np is not None and isinstance(iterable, np.ndarray):
+        iterable = iterable.ravel().tolist()
+    iterator = iter(iterable)
+    return iter(lambda: list(islice(iterator, _CHUNK_SIZE)), [])
+
+
+class TDigest(metaclass=ChainedMeta):
+    """Mergeable t-digest: a bounded number of weighted centroids, smaller near the tails."""
+
+    __slots__ = ('_compression', '_centroids', '_buffer', '_count', '_min', '_max')
+
+    def __init__(self, compression: int = 200) -> None:
+        """
+        Mergeable merging t-digest. It keeps about 'compression' centroids,
+        and the centroids near the tails are smaller, so that the extreme quantiles are the most precise.
+        Incoming values are buffered and merged into the centroids in sorted batches.
+
+        >>> digest = TDigest()
+        >>> digest.update(range(100_001))
+        >>> [round(estimate) for estimate in digest.quantiles((0, 0.5, 0.999, 1))]
+        [0, 50000, 99900, 100000]
+
+        Args:
+            compression:  accuracy parameter bounding the number of centroids
+        """
+        if compression < 10:
+            raise ValueError(f'Compression should be at least 10. Got: {compression}')
+        self._compression: Final = compression
+        # (mean, weight) pairs in the ascending order of the means
+        self._centroids: List[Tuple[float, float]] = []
+        self._buffer: List[Any] = []
+        self._count = 0
+        self._min: Any = None
+        self._max: Any = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(compression={self._compression}, count={self._count})'
+
+    @property
+    def compression(self) -> int:
+        """Accuracy parameter bounding the number of centroids."""
+        return self._compression
+
+    @property
+    def count(self) -> int:
+        """Number of values accounted for."""
+        return self._count
+
+    def _compress(self, extra: Sequence[Tuple[float, float]] = ()) -> None:
+        """
+        Merges the buffered values and the 'extra' centroids into the centroids of the 'self'.
+        Sorted points are split where the scale function ``compression / pi * asin(2 * q - 1)``
+        of their cumulative weights 'q' crosses an integer, so that the centroids are the smallest near the tails.
+        The boundaries are found by bisection, and the points between them are averaged in C.
+        """
+        centroids = sorted(self._centroids + list(extra)) if extra else self._centroids
+        buffer = self._buffer
+        self._buffer = []
+        if not buffer and not extra:
+            return
+        buffer.sort()
+        # Inserts the few centroids between the sorted buffered values of the weight 1
+        means: List[Any] = []
+        weights: List[float] = []
+        previous = 0
+        for mean, weight in centroids:
+            position = bisect_right(buffer, mean, previous)
+            means += buffer[previous:position]
+            weights += repeat(1, position - previous)
+            means.append(mean)
+            weights.append(weight)
+            previous = position
+        means += buffer[previous:]
+        weights += repeat(1, len(buffer) - previous)
+        ends = list(accumulate(weights))
+        total = ends[-1]
+        compression = self._compression
+        merged = []
+        start = 0
+        for k in range(-(compression // 2), compression // 2 + 1):
+            stop = bisect_right(ends, total * (1 + sin(pi * k / compression)) / 2, start)
+            if stop - start == 1:
+                merged.append((means[start], weights[start]))
+            elif stop > start:
+                weight = ends[stop - 1] - (ends[start - 1] if start else 0)
+                merged.append((fsum(map(mul, means[start:stop], weights[start:stop])) / weight, weight))
+            start = stop
+        if start < len(means):
+            weight = total - (ends[start - 1] if start else 0)
+            merged.append((fsum(map(mul, means[start:], weights[start:])) / weight, weight))
+        self._centroids = merged
+
+    def merge(self, other: 'TDigest') -> None:
+        """
+        Merges the digest of other values into the 'self'.
+
+        >>> left, right = TDigest(), TDigest()
+        >>> left.update(range(0, 1000))
+        >>> right.update(range(1000, 2001))
+        >>> left.merge(right)
+        >>> left.quantile(0.5)
+        1000.0
+
+        Args:
+            other:  digest of other values
+        """
+        if not other._count:
+            return
+        self._count += other._count
+        self._min = other._min if self._min is None else min(self._min, other._min)
+        self._max = other._max if self._max is None else max(self._max, other._max)
+        self._buffer.extend(other._buffer)
+        self._compress(other._centroids)
+
+    def quantile(self, q: float) -> Any:
+        """
+        Args:
+            q:  quantile from 0 to 1
+        Returns:
+            estimate of the quantile. ``None`` if the digest is empty
+        """
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Sequence[float]) -> List[Any]:
+        """
+        Interpolates linearly between the centers of the centroids. Quantiles 0 and 1 are the exact extrema.
+
+        Args:
+            qs:  quantiles from 0 to 1
+        Returns:
+            estimates of the quantiles. ``None`` for each quantile if the digest is empty
+        """
+        _check_quantiles(qs)
+        if not self._count:
+            return [None] * len(qs)
+        self._compress()
+        centroids = self._centroids
+        # Cumulative weights of the centroid centers, bounded by the extrema
+        positions = [0.0]
+        values = [self._min]
+        cumulative = 0
+        for mean, weight in centroids:
+            positions.append(cumulative + weight / 2)
+            values.append(mean)
+            cumulative += weight
+        positions.append(cumulative)
+        values.append(self._max)
+
+        estimates = []
+        for q in qs:
+            if q == 0:
+                estimates.append(self._min)
+                continue
+            if q == 1:
+                estimates.append(self._max)
+                continue
+            target = q * cumulative
+            i = max(bisect_left(positions, target), 1)
+            left, right = positions[i - 1], positions[i]
+            share = (target - left) / (right - left) if right > left else 0.0
+            estimates.append(values[i - 1] + (values[i] - values[i - 1]) * share)
+        return estimates
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        """
+        Args:
+            iterable:  real numbers or NumPy array of them
+        """
+        limit = max(5 * self._compression, _CHUNK_SIZE)
+        for chunk in _chunks(iterable):
+            self._count += len(chunk)
+            low, high = min(chunk), max(chunk)
+            self._min = low if self._min is None else min(self._min, low)
+            self._max = high if self._max is None else max(self._max, high)
+            self._buffer += chunk
+            if len(self._buffer) >= limit:
+                self._compress()
+
+
+class KLLSketch(metaclass=ChainedMeta):
+    """Mergeable KLL quantile sketch: a hierarchy of compactors with a rank error guarantee."""
+
+    __slots__ = ('_k', '_levels', '_random', '_count', '_min', '_max')
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        """
+        Mergeable KLL quantile sketch. It keeps about ``3 * k`` values, and the rank error
+        is about ``1.7 / k`` of the number of values with high probability, whatever their distribution.
+
+        >>> sketch = KLLSketch(seed=0)
+        >>> sketch.update(range(100_001))
+        >>> [abs(estimate - q * 100_000) < 1_000 for q, estimate in zip((0.5, 0.9), sketch.quantiles((0.5, 0.9)))]
+        [True, True]
+
+        Args:
+            k:     accuracy parameter: the capacity of the top compactor
+            seed:  seed of the random choices of the compactions
+        """
+        if k < 8:
+            raise ValueError(f'Parameter k should be at least 8. Got: {k}')
+        self._k: Final = k
+        # Values of the weight 2 ** level at each level
+        self._levels: List[List[Any]] = [[]]
+        self._random: Final = Random(seed)
+        self._count = 0
+        self._min: Any = None
+        self._max: Any = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(k={self._k}, count={self._count})'
+
+    @property
+    def count(self) -> int:
+        """Number of values accounted for."""
+        return self._count
+
+    @property
+    def k(self) -> int:
+        """Accuracy parameter: the capacity of the top compactor."""
+        return self._k
+
+    def _compress(self) -> None:
+        """Compacts the levels exceeding their capacities, promoting every other sorted value to the next level."""
+        levels = self._levels
+        while True:
+            depth = len(levels)
+            for level, values in enumerate(levels):
+                if len(values) > max(2, ceil(self._k * (2 / 3) ** (depth - level - 1))):
+                    break
+            else:
+                return
+            if level + 1 == depth:
+                levels.append([])
+            values.sort()
+            # An odd value stays at the level, so that the total weight is preserved
+            remainder = [values.pop()] if len(values) % 2 else []
+            levels[level + 1] += values[self._random.getrandbits(1)::2]
+            levels[level] = remainder
+
+    def merge(self, other: 'KLLSketch') -> None:
+        """
+        Merges the sketch of other values into the 'self'.
+
+        >>> left, right = KLLSketch(seed=1), KLLSketch(seed=2)
+        >>> left.update(range(0, 5000))
+        >>> right.update(range(5000, 10001))
+        >>> left.merge(right)
+        >>> abs(left.quantile(0.5) - 5000) < 200
+        True
+
+        Args:
+            other:  sketch of other values
+        """
+        if not other._count:
+            return
+        self._count += other._count
+        self._min = other._min if self._min is None else min(self._min, other._min)
+        self._max = other._max if self._max is None else max(self._max, other._max)
+        for level, values in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append([])
+            self._levels[level] += values
+        self._compress()
+
+    def quantile(self, q: float) -> Any:
+        """
+        Args:
+            q:  quantile from 0 to 1
+        Returns:
+            estimate of the quantile. ``None`` if the sketch is empty
+        """
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Sequence[float]) -> List[Any]:
+        """
+        Finds the retained values whose weighted ranks reach the quantiles. Quantiles 0 and 1 are the exact extrema.
+
+        Args:
+            qs:  quantiles from 0 to 1
+        Returns:
+            estimates of the quantiles. ``None`` for each quantile if the sketch is empty
+        """
+        _check_quantiles(qs)
+        if not self._count:
+            return [None] * len(qs)
+        weighted = sorted((value, 1 << level) for level, values in enumerate(self._levels) for value in values)
+        ranks = list(accumulate(weight for _, weight in weighted))
+        estimates = []
+        for q in qs:
+            if q == 0:
+                estimates.append(self._min)
+            elif q == 1:
+                estimates.append(self._max)
+            else:
+                estimates.append(weighted[min(bisect_left(ranks, q * self._count), len(weighted) - 1)][0])
+        return estimates
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        """
+        Args:
+            iterable:  comparable values or NumPy array of them
+        """
+        bottom_capacity = self._k
+        for chunk in _chunks(iterable):
+            self._count += len(chunk)
+            low, high = min(chunk), max(chunk)
+            self._min = low if self._min is None else min(self._min, low)
+            self._max = high if self._max is None else max(self._max, high)
+            self._levels[0] += chunk
+            if len(self._levels[0]) > bottom_capacity:
+                self._compress()
+
+
+def make_digest(method: str, size: Optional[int] = None) -> Any:
+    """
+    >>> make_digest('kll', 100)
+    KLLSketch(k=100, count=0)
+
+    Args:
+        method:  'tdigest' or 'kll'
+        size:    compression of the t-digest or 'k' of the KLL sketch. ``None`` means the default one
+    Returns:
+        empty digest
+    """
+    if method == TDIGEST:
+        return TDigest() if size is None else TDigest(size)
+    if method == KLL:
+        return KLLSketch() if size is None else KLLSketch(size)
+    raise ValueError(f"Method should be either '{TDIGEST}' or '{KLL}'. Got: {method!r}")
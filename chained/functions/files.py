@@ -0,0 +1,396 @@
+from array import array, typecodes
+from codecs import lookup
+from collections import abc
+from itertools import chain
+from mmap import ACCESS_READ, mmap
+from operator import methodcaller
+from os import PathLike, fspath
+from re import findall
+from struct import Struct
+from typing import Any, Final, Generator, Iterable, Iterator, List, Optional, Tuple, Union, overload
+
+from chained.functions.batches import ARRAY, NUMPY
+from chained.functions.lambded import np
+from chained.functions.views import SequenceView
+from chained.type_utils.meta import ChainedMeta
+
+# Number of bytes searched for single-byte separators at once while skipping records
+_SCAN_BLOCK: Final = 1 << 20
+
+# Encodings in which the encoded separator never occurs inside the encoding of another character,
+# so that decoded blocks can be split by the decoded separator
+_SPLIT_SAFE_ENCODINGS: Final = frozenset(('utf-8', 'ascii', 'iso8859-1', 'iso8859-15', 'cp1251', 'cp1252'))
+
+
+def map_file(path: Union[str, bytes, PathLike]) -> Optional[mmap]:
+    """
+    Memory-maps the file at the 'path' for reading.
+
+    Args:
+        path:  path to the file
+    Returns:
+        read-only mapping. ``None`` if the file is empty (empty files cannot be mapped)
+    """
+    with open(fspath(path), 'rb') as file:
+        try:
+            return mmap(file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            # Mapping of an empty file
+            return None
+
+
+def skip_records(mapping: mmap, sep: bytes, position: int, n: int) -> int:
+    """
+    Finds the beginning of the record following 'n' records starting at the 'position'.
+    Does not create any record objects. Single-byte separators are counted block by block.
+
+    >>> with open(__file__, 'rb') as file:
+    ...     mapping = mmap(file.fileno(), 0, access=ACCESS_READ)
+    >>> skip_records(mapping, b'\\n', 0, 2) == mapping.find(b'\\n', mapping.find(b'\\n') + 1) + 1
+    True
+
+    Args:
+        mapping:   mapped file
+        sep:       record separator
+        position:  position of the first record
+        n:         number of records to skip
+    Returns:
+        position of the record. Mapping length if there are not enough records
+    """
+    size = len(mapping)
+    if len(sep) == 1:
+        while n and position < size:
+            end = min(position + _SCAN_BLOCK, size)
+            found = mapping[position:end].count(sep)
+            if found >= n:
+                break
+            n -= found
+            position = end
+    while n and position < size:
+        end = mapping.find(sep, position)
+        if end == -1:
+            return size
+        position = end + len(sep)
+        n -= 1
+    return position
+
+
+class MappedRecords(metaclass=ChainedMeta):
+    """Re-iterable sequence of records of a memory-mapped file, separated by a byte string."""
+
+    __slots__ = ('_path', '_sep', '_encoding', '_start', '_stop')
+
+    def __init__(self,
+                 path: Union[str, bytes, PathLike],
+                 sep: bytes = b'\n',
+                 encoding: Optional[str] = None,
+                 start: int = 0,
+                 stop: Optional[int] = None) -> None:
+        """
+        Re-iterable sequence of records of a memory-mapped file.
+        Records are `bytes` that do not include the separators. The mapping is split block by block,
+        so there is no per-record searching in Python and no buffered reader in between.
+        A separator at the end of the file does not start a new record.
+
+        Args:
+            path:      path to the file
+            sep:       record separator
+            encoding:  if specified, records are decoded into `str` using this encoding
+            start:     number of leading records to skip
+            stop:      number of the record to stop before. ``None`` means "until the end of the file"
+        """
+        if not sep:
+            raise ValueError('Record separator should not be empty')
+        self._path: Final = path
+        self._sep: Final[bytes] = bytes(sep)
+        self._encoding: Final = encoding
+        self._start: Final = start
+        self._stop: Final = stop
+
+    def __iter__(self) -> Iterator[Union[bytes, str]]:
+        return chain.from_iterable(self._blocks())
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}'
+            f'({self._path!r}, {self._sep!r}, {self._encoding!r}, {self._start}, {self._stop})'
+        )
+
+    @property
+    def bounds(self) -> Tuple[int, Optional[int]]:
+        """Numbers of the first record and of the record to stop before."""
+        return self._start, self._stop
+
+    @property
+    def path(self) -> Union[str, bytes, PathLike]:
+        """Path to the file."""
+        return self._path
+
+    def _blocks(self) -> Generator[Iterable[Union[bytes, str]], None, None]:
+        """
+        Yields the records block by block, so that iterating over each block runs in C.
+        The mapping is closed as soon as the generator is exhausted, closed or fails.
+        """
+        mapping = map_file(self._path)
+        if mapping is None:
+            return
+        view = memoryview(mapping)
+        try:
+            size = len(mapping)
+            sep, encoding = self._sep, self._encoding
+            split_decoded = encoding is not None and lookup(encoding).name in _SPLIT_SAFE_ENCODINGS
+            position = skip_records(mapping, sep, 0, self._start)
+            remaining = -1 if self._stop is None else self._stop - self._start
+            while remaining and position < size:
+                # Splits whole blocks in C instead of searching for each separator in Python
+                end = min(position + _SCAN_BLOCK, size)
+                cut = mapping.rfind(sep, position, end) if end < size else size
+                if cut == -1:
+                    # The record is longer than the block
+                    cut = mapping.find(sep, end)
+                    if cut == -1:
+                        cut = size
+                if split_decoded:
+                    records = str(view[position:cut], encoding).split(sep.decode(encoding))
+                else:
+                    records = mapping[position:cut].split(sep)
+                if cut == size and mapping[size - len(sep):] == sep:
+                    # A separator at the end of the file does not start a new record
+                    records.pop()
+                if remaining > 0:
+                    del records[remaining:]
+                    remaining -= len(records)
+                if encoding is None or split_decoded:
+                    yield records
+                else:
+                    yield map(methodcaller('decode', encoding), records)
+                position = cut + len(sep)
+        finally:
+            # Early termination should not keep the file mapped until the generator is collected
+            view.release()
+            mapping.close()
+
+    def nth(self, n: int) -> Optional[Union[bytes, str]]:
+        """
+        Finds the n-th record by scanning the mapping.
+
+        Args:
+            n:  order number of the record counting from the first one
+        Returns:
+            record if there is one. ``None`` - otherwise
+        """
+        return next(iter(self.slice(n, n + 1)), None)
+
+    def slice(self, start: int, stop: Optional[int]) -> 'MappedRecords':
+        """
+        Args:
+            start:  number of leading records to skip
+            stop:   number of the record to stop before. ``None`` means "until the end"
+        Returns:
+            records between 'start' and 'stop' counting from the first one
+        """
+        new_start = self._start + start
+        new_stop = self._stop if stop is None else self._start + stop
+        if self._stop is not None and new_stop is not None:
+            new_stop = min(new_stop, self._stop)
+        if new_stop is not None:
+            new_start = min(new_start, new_stop)
+        return MappedRecords(self._path, self._sep, self._encoding, new_start, new_stop)
+
+
+def _format_fields(fmt: str) -> Tuple[str, List[str]]:
+    """
+    Splits a ``struct`` format into the byte order character and a format code per unpacked field.
+
+    >>> _format_fields('<2hx3sd')
+    ('<', ['h', 'h', '3s', 'd'])
+
+    Args:
+        fmt:  ``struct`` format
+    Returns:
+        (byte order character, field codes)
+    """
+    order = fmt[:1] if fmt[:1] in '@=<>!' else '@'
+    fields = []
+    for repeat, code in findall(r'(\d*)([xcbB?hHiIlLqQnNefdspP])', fmt.replace(' ', '')):
+        if code in 'sp':
+            fields.append(repeat + code)
+        elif code != 'x':
+            fields.extend(code * int(repeat or 1))
+    return order, fields
+
+
+class StructRecords(abc.Sequence):
+    """Zero-copy sequence of fixed-width binary records of a buffer unpacked by a ``struct`` format."""
+
+    __slots__ = ('_buffer', '_struct', '_mapping')
+
+    def __init__(self, buffer: Any, fmt: Union[str, Struct]) -> None:
+        """
+        Zero-copy sequence of fixed-width binary records of a buffer.
+        Indexing and slicing compute the record offsets, iteration runs ``Struct.iter_unpack``.
+        The buffer is owned by the caller and should outlive the records and their slices.
+
+        >>> from struct import pack
+        >>> records = StructRecords(b''.join(pack('<id', i, i / 2) for i in range(5)), '<id')
+        >>> records[3], records[-1], len(records)
+        ((3, 1.5), (4, 2.0), 5)
+
+        >>> records[1:3]
+        StructRecords('<id', [(1, 0.5), (2, 1.0)])
+
+        Args:
+            buffer:  C-contiguous object supporting the buffer protocol: `bytes`, ``mmap``, etc.
+            fmt:     ``struct`` format or compiled ``struct.Struct``
+        """
+        record_struct = fmt if isinstance(fmt, Struct) else Struct(fmt)
+        if not record_struct.size:
+            raise ValueError(f'Record size should be positive. Got the format: {record_struct.format!r}')
+        view = memoryview(buffer).cast('B')
+        if len(view) % record_struct.size:
+            raise ValueError(f'Buffer size {len(view)} is not a multiple of the record size {record_struct.size}')
+        self._buffer: Final[memoryview] = view
+        self._struct: Final[Struct] = record_struct
+        # Mapping of the file owned by the records, see ``from_file``
+        self._mapping: Optional[mmap] = None
+
+    @overload
+    def __getitem__(self, item: int) -> Tuple:
+        pass
+
+    @overload
+    def __getitem__(self, item: slice) -> Union['StructRecords', SequenceView]:
+        pass
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Tuple, 'StructRecords', SequenceView]:
+        size = self._struct.size
+        if isinstance(item, slice):
+            indices = range(len(self))[item]
+            if indices.step != 1:
+                return SequenceView(self, indices)
+            return StructRecords(self._buffer[indices.start * size:indices.stop * size], self._struct)
+        length = len(self)
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError('Record index out of range')
+        return self._struct.unpack_from(self._buffer, item * size)
+
+    def __iter__(self) -> Iterator[Tuple]:
+        return self._struct.iter_unpack(self._buffer)
+
+    def __len__(self) -> int:
+        return len(self._buffer) // self._struct.size
+
+    def __enter__(self) -> 'StructRecords':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._struct.format!r}, {list(self)})'
+
+    @classmethod
+    def from_file(cls, path: Union[str, bytes, PathLike], fmt: Union[str, Struct]) -> 'StructRecords':
+        """
+        Records of the memory-mapped file. The records own the mapping: it is closed by ``close``
+        or on leaving the ``with`` block. Slices and NumPy columns are views of the mapping
+        that stay valid after that: the mapping is closed once the last of them is garbage-collected.
+
+        Args:
+            path:  path to the file
+            fmt:   ``struct`` format or compiled ``struct.Struct``
+        Returns:
+            records owning the mapping of the file
+        """
+        mapping = map_file(path)
+        if mapping is None:
+            return cls(b'', fmt)
+        try:
+            records = cls(mapping, fmt)
+        except ValueError:
+            mapping.close()
+            raise
+        records._mapping = mapping
+        return records
+
+    @property
+    def buffer(self) -> memoryview:
+        """Byte view of the buffer."""
+        return self._buffer
+
+    @property
+    def format(self) -> str:
+        """``struct`` format of the records."""
+        return self._struct.format
+
+    def _numpy_dtype(self) -> Optional[Any]:
+        """NumPy structured data type equivalent to the format. ``None`` if there is no such one."""
+        order, fields = _format_fields(self._struct.format)
+        if order == '@' or any(code in 'npP' or code.endswith('p') for code in fields):
+            # Native alignment and pointer-sized fields are not expressible portably
+            return None
+        order = '>' if order == '!' else order
+        dtype = np.dtype([(f'f{i}', order + code) for i, code in enumerate(fields)])
+        return dtype if dtype.itemsize == self._struct.size else None
+
+    def close(self) -> None:
+        """
+        Releases the view of the buffer and closes the mapping owned by the records, if any.
+        The records are unusable afterwards. Closing the records twice has no effect.
+        While slices or NumPy columns of the buffer exist, the mapping stays open for them
+        and is closed once the last of them is garbage-collected.
+        """
+        mapping, self._mapping = self._mapping, None
+        try:
+            self._buffer.release()
+            if mapping is not None:
+                mapping.close()
+        except BufferError:
+            # The views still in use hold the last references to the mapping
+            pass
+
+    def columns(self, batch_size: int, backend: str = ARRAY) -> Generator[Tuple, None, None]:
+        """
+        Splits the records into batches of `batch_size` records and transposes each batch into columns.
+        Columns are ``array.array`` instances (tuples for the fields with no matching type code)
+        or, if 'backend' is 'numpy', zero-copy NumPy views of the buffer.
+
+        >>> from struct import pack
+        >>> records = StructRecords(b''.join(pack('<hd', i, -i) for i in range(3)), '<hd')
+        >>> tuple(records.columns(2))
+        ((array('h', [0, 1]), array('d', [0.0, -1.0])), (array('h', [2]), array('d', [-2.0])))
+
+        Args:
+            batch_size:  number of records in a batch
+            backend:     'array' or 'numpy'
+        Returns:
+            generator over the tuples of columns
+        """
+        if batch_size < 1:
+            raise ValueError(f'Batch size should be positive. Got: {batch_size}')
+        if backend not in (ARRAY, NUMPY):
+            raise ValueError(f"Backend should be either '{ARRAY}' or '{NUMPY}'. Got: {backend!r}")
+        size = self._struct.size
+        length = len(self)
+
+        if backend == NUMPY:
+            if np is None:
+                raise ImportError('NumPy is required to make NumPy batches')
+            dtype = self._numpy_dtype()
+            if dtype is None:
+                raise ValueError(f'Format {self._struct.format!r} has no portable NumPy equivalent')
+            table = np.frombuffer(self._buffer, dtype)
+            for i in range(0, length, batch_size):
+                batch = table[i:i + batch_size]
+                yield tuple(batch[name] for name in dtype.names)
+            return
+
+        _, fields = _format_fields(self._struct.format)
+        for i in range(0, length, batch_size):
+            chunk = self._buffer[i * size:(i + batch_size) * size]
+            yield tuple(
+                array(code, column) if code in typecodes else column
+                for code, column in zip(fields, zip(*self._struct.iter_unpack(chunk)))
+            )
@@ -0,0 +1,229 @@
+from functools import lru_cache
+from itertools import islice, starmap
+from typing import Any, Callable, Final, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from chained.functions import filter_map
+from chained.functions import lambded
+from chained.functions.lambded import LambdaExpr
+
+# Stage kinds shared by the eager chain methods and the `LogicalPlan`
+MAP: Final = 'map'
+STARMAP: Final = 'starmap'
+FILTER: Final = 'filter'
+FILTER_MAP: Final = 'filter_map'
+INSPECT: Final = 'inspect'
+SLICE: Final = 'slice'
+
+_fusion_enabled = True
+
+# Prefix of the names used inside the generated code. `LambdaVar` names starting with it are never inlined
+_PREFIX: Final = '_chained_'
+
+
+def set_fusion(enabled: bool) -> bool:
+    """
+    Enables or disables fusion of adjacent ``map``, ``starmap``, ``filter``, ``filter_map`` and ``inspect`` stages
+    into a single generated generator. Disabling it makes tracebacks point to the stacked built-in iterators,
+    which may be handy for debugging.
+
+    >>> previous = set_fusion(False)
+    >>> set_fusion(previous)
+    False
+
+    Args:
+        enabled:  whether the fusion should be performed
+    Returns:
+        previous state of the switch
+    """
+    global _fusion_enabled
+    previous, _fusion_enabled = _fusion_enabled, bool(enabled)
+    return previous
+
+
+def fusion_enabled() -> bool:
+    """
+    >>> fusion_enabled()
+    True
+
+    Returns:
+        whether the fusion is currently enabled
+    """
+    return _fusion_enabled
+
+
+def _inline_source(func: Any) -> Optional[Tuple[str, str]]:
+    """Returns (argument name, expression source) of a single-argument ``LambdaExpr``, if it can be inlined.
+
+    >>> from chained.functions.lambded import x
+    >>> _inline_source(x * 2 + 1)
+    ('x', '((x)*(2))+(1)')
+
+    >>> _inline_source(str) is None
+    True
+
+    Args:
+        func:  stage function
+    Returns:
+        (argument name, expression source) if 'func' can be inlined. ``None`` - otherwise
+    """
+    if not isinstance(func, LambdaExpr):
+        return None
+    args = func._get_args()
+    if len(args) != 1 or not args[0].isidentifier() or args[0].startswith(_PREFIX):
+        return None
+    source = str(func)
+    # The expression must be a valid lambda body, otherwise calling it would fail anyway
+    if not _is_lambda(f'lambda {args[0]}:{source}'):
+        return None
+    return args[0], source
+
+
+@lru_cache(maxsize=256)
+def _is_lambda(source: str) -> bool:
+    """Checks the syntax of the lambda 'source' by compiling it without evaluating or caching the function."""
+    try:
+        compile(source, '<fused chain>', 'eval')
+    except SyntaxError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def _compile_factory(source: str) -> Callable:
+    """Compiles the generated source of a fused generator factory."""
+    namespace: dict = {}
+    # `LambdaExpr` bodies are evaluated in the globals of the 'lambded' module, so are the inlined ones
+    exec(compile(source, '<fused chain>', 'exec'), lambded.__dict__, namespace)
+    return namespace['make']
+
+
+def fuse(stages: Sequence[Tuple]) -> Callable[[Iterable], Iterator]:
+    """
+    Compiles a run of ``map``, ``starmap``, ``filter``, ``filter_map`` and ``inspect`` stages
+    into a single generator function. Single-argument ``LambdaExpr`` bodies are inlined as source code.
+
+    >>> from chained.functions.lambded import x
+    >>> fused = fuse(((MAP, x * 3), (FILTER, lambda v: v % 2), (FILTER_MAP, lambda v: 6 // (v - 3), ZeroDivisionError)))
+    >>> tuple(fused(range(8)))
+    (1, 0, 0)
+
+    Args:
+        stages:  (kind, *args) tuples
+    Returns:
+        generator function of an iterable
+    """
+    params: List[str] = []
+    values: List[Any] = []
+    body: List[str] = []
+
+    def bind(value: Any) -> str:
+        name = f'{_PREFIX}a{len(params)}'
+        params.append(name)
+        values.append(value)
+        return name
+
+    item = f'{_PREFIX}item'
+    for kind, *args in stages:
+        inlined = _inline_source(args[0]) if kind != STARMAP else None
+        if kind == FILTER and args[0] is None:
+            # Mirrors `filter(None, iterable)`
+            prologue = []
+            call = item
+        elif inlined is not None:
+            var, expr = inlined
+            prologue = [f'{var} = {item}']
+            call = f'({expr})'
+        else:
+            prologue = []
+            call = f'{bind(args[0])}(*{item})' if kind == STARMAP else f'{bind(args[0])}({item})'
+
+        if kind in (MAP, STARMAP):
+            body += prologue
+            body.append(f'{item} = {call}')
+        elif kind == FILTER:
+            body += prologue
+            body += [f'if not {call}:', '    continue']
+        elif kind == FILTER_MAP:
+            body.append('try:')
+            body += [f'    {line}' for line in prologue]
+            body += [f'    {item} = {call}', f'except {bind(args[1])}:', '    continue']
+        elif kind == INSPECT:
+            body += prologue
+            body.append(call)
+        else:
+            raise ValueError(f'Stage of kind {kind!r} cannot be fused')
+
+    source = '\n'.join((
+        f'def make({", ".join(params)}):',
+        f'    def fused({_PREFIX}iterable):',
+        f'        for {item} in {_PREFIX}iterable:',
+        *(f'            {line}' for line in body),
+        f'            yield {item}',
+        '    return fused',
+    ))
+    return _compile_factory(source)(*values)
+
+
+def _inspector(callback: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wraps 'callback' into a function that calls it and passes its argument on."""
+
+    def inspector(x):
+        callback(x)
+        return x
+
+    return inspector
+
+
+def _apply_unfused(iterator: Iterable, stages: Sequence[Tuple]) -> Iterable:
+    """Stacks one built-in iterator per stage."""
+    for kind, *args in stages:
+        if kind == MAP:
+            iterator = map(args[0], iterator)
+        elif kind == STARMAP:
+            iterator = starmap(args[0], iterator)
+        elif kind == FILTER:
+            iterator = filter(args[0], iterator)
+        elif kind == FILTER_MAP:
+            iterator = filter_map(args[0], iterator, args[1])
+        elif kind == INSPECT:
+            iterator = map(_inspector(args[0]), iterator)
+        else:
+            iterator = islice(iterator, *args)
+    return iterator
+
+
+def apply_stages(iterable: Iterable, stages: Sequence[Tuple]) -> Iterator:
+    """
+    Applies 'stages' to the 'iterable'. Runs of fusible stages are fused if the fusion is enabled
+    and if it pays off: a run consists of several stages, of a single stage implemented in Python,
+    or contains a ``LambdaExpr``.
+
+    >>> tuple(apply_stages(range(10), ((MAP, abs), (SLICE, 2, None, 3), (FILTER, bool), (MAP, str))))
+    ('2', '5', '8')
+
+    Args:
+        iterable:  iterable to transform
+        stages:    (kind, *args) tuples
+    Returns:
+        resulting iterator
+    """
+    iterator = iter(iterable)
+    run: List[Tuple] = []
+
+    def flush(iterator: Iterable) -> Iterable:
+        if not run:
+            return iterator
+        kind, func, *_ = run[0]
+        if _fusion_enabled and (len(run) > 1 or kind in (FILTER_MAP, INSPECT) or isinstance(func, LambdaExpr)):
+            iterator = fuse(run)(iterator)
+        else:
+            iterator = _apply_unfused(iterator, run)
+        run.clear()
+        return iterator
+
+    for stage in stages:
+        if stage[0] == SLICE:
+            iterator = islice(flush(iterator), *stage[1:])
+        else:
+            run.append(stage)
+    return iter(flush(iterator))
@@ -0,0 +1,208 @@
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, Final, Generator, Iterable, List, Optional, Tuple
+
+from chained.functions.spill import SEGMENT_SIZE, SpillFile
+from chained.type_utils.meta import ChainedMeta
+
+# Marker of the omitted initial aggregate
+NO_INITIAL: Final = object()
+
+# Number of partitions the spilled elements are distributed among by the hashes of their keys
+PARTITIONS: Final = 16
+
+
+class SpilledPartitions(metaclass=ChainedMeta):
+    """Hash partitions of (key, value) pairs buffered in memory and written to a spill file in frames."""
+
+    __slots__ = ('_salt', '_spill', '_buffers', '_frames')
+
+    def __init__(self, salt: int, spill_dir: Optional[str] = None) -> None:
+        """
+        Hash partitions of (key, value) pairs.
+
+        >>> partitions = SpilledPartitions(0)
+        >>> for i in range(100):
+        ...     partitions.add(i % 3, i)
+        >>> sorted(key for pairs in partitions.drain() for key, _ in pairs) == sorted(i % 3 for i in range(100))
+        True
+
+        Args:
+            salt:       value mixed into the hashes of the keys, so that nested partitionings differ
+            spill_dir:  directory for the spill file. ``None`` means the default temporary directory
+        """
+        self._salt: Final = salt
+        self._spill: Final = SpillFile(spill_dir)
+        self._buffers: Final[List[List[Tuple[Any, Any]]]] = [[] for _ in range(PARTITIONS)]
+        # Offsets of the frames of each partition
+        self._frames: Final[List[List[int]]] = [[] for _ in range(PARTITIONS)]
+
+    def _read(self, index: int) -> Generator[Tuple[Any, Any], None, None]:
+        """Loads the frames of the partition one by one."""
+        for offset in self._frames[index]:
+            yield from self._spill.read(offset)
+
+    def add(self, key: Any, value: Any) -> None:
+        """
+        Args:
+            key:    hashable key
+            value:  picklable value
+        """
+        index = hash((self._salt, key)) % PARTITIONS
+        buffer = self._buffers[index]
+        buffer.append((key, value))
+        if len(buffer) == SEGMENT_SIZE:
+            self._frames[index].append(self._spill.write(buffer))
+            self._buffers[index] = []
+
+    def drain(self) -> Generator[Iterable[Tuple[Any, Any]], None, None]:
+        """
+        Yields the pairs of each non-empty partition. The spill file is removed afterwards.
+
+        Returns:
+            generator over the iterables of pairs
+        """
+        try:
+            for index, buffer in enumerate(self._buffers):
+                if buffer:
+                    self._frames[index].append(self._spill.write(buffer))
+                    self._buffers[index] = []
+            for index, frames in enumerate(self._frames):
+                if frames:
+                    yield self._read(index)
+        finally:
+            self._spill.close()
+
+
+def check_max_keys(max_keys: Optional[int]) -> None:
+    """Raises ``ValueError`` unless the 'max_keys' limit is ``None`` or positive."""
+    if max_keys is not None and max_keys < 1:
+        raise ValueError(f'Maximum number of keys should be positive. Got: {max_keys}')
+
+
+def hash_aggregate(pairs: Iterable[Tuple[Any, Any]],
+                   start: Callable[[Any], Any],
+                   update: Callable[[Any, Any], Any],
+                   max_keys: Optional[int] = None,
+                   spill_dir: Optional[str] = None,
+                   salt: int = 0) -> Generator[Tuple[Any, Any], None, None]:
+    """
+    Aggregates the values of the (key, value) 'pairs' by key in a hash table of at most 'max_keys' keys.
+    Once the table is full, the pairs with new keys are spilled to disk, partitioned by the hashes of the keys.
+    The table is yielded first, then each partition is aggregated in the same way.
+    Spilled pairs never share keys with the table, so no aggregates have to be merged.
+
+    >>> dict(hash_aggregate(((i % 4, i) for i in range(10)), lambda v: v, lambda a, v: a + v, max_keys=2))
+    {0: 12, 1: 15, 2: 8, 3: 10}
+
+    Args:
+        pairs:      (key, value) pairs. If 'max_keys' may be exceeded, they should be picklable
+        start:      function making the aggregate of the first value of a key
+        update:     function making the new aggregate of a key from the previous one and the next value
+        max_keys:   maximum number of keys kept in memory at once. ``None`` means "unlimited"
+        spill_dir:  directory for the spill files. ``None`` means the default temporary directory
+        salt:       value mixed into the hashes of the keys
+    Returns:
+        generator over the (key, aggregate) pairs
+    """
+    check_max_keys(max_keys)
+    table: Dict[Any, Any] = {}
+    partitions = None
+    for key, value in pairs:
+        if key in table:
+            table[key] = update(table[key], value)
+        elif max_keys is None or len(table) < max_keys:
+            table[key] = start(value)
+        else:
+            if partitions is None:
+                partitions = SpilledPartitions(salt, spill_dir)
+            partitions.add(key, value)
+    yield from table.items()
+    if partitions is None:
+        return
+    del table
+    for partition in partitions.drain():
+        yield from hash_aggregate(partition, start, update, max_keys, spill_dir, salt + 1)
+
+
+def count_by(iterable: Iterable[Any],
+             key: Optional[Callable[[Any], Any]] = None,
+             max_keys: Optional[int] = None,
+             spill_dir: Optional[str] = None) -> Generator[Tuple[Any, int], None, None]:
+    """
+    >>> dict(count_by('abracadabra'))
+    {'a': 5, 'b': 2, 'r': 2, 'c': 1, 'd': 1}
+
+    Args:
+        iterable:   elements to count
+        key:        function computing the key of an element. ``None`` means the element itself
+        max_keys:   maximum number of keys kept in memory at once. ``None`` means "unlimited"
+        spill_dir:  directory for the spill files
+    Returns:
+        generator over the (key, number of elements) pairs
+    """
+    keys = iterable if key is None else map(key, iterable)
+    if max_keys is None:
+        # Counting is done in C
+        yield from Counter(keys).items()
+    else:
+        yield from hash_aggregate(zip(keys, iter(int, 1)), lambda _: 1, lambda total, _: total + 1, max_keys, spill_dir)
+
+
+def group_by(iterable: Iterable[Any],
+             key: Callable[[Any], Any],
+             max_keys: Optional[int] = None,
+             spill_dir: Optional[str] = None) -> Generator[Tuple[Any, List[Any]], None, None]:
+    """
+    >>> dict(group_by(range(7), lambda v: v % 3))
+    {0: [0, 3, 6], 1: [1, 4], 2: [2, 5]}
+
+    Args:
+        iterable:   elements to group
+        key:        function computing the key of an element
+        max_keys:   maximum number of keys kept in memory at once. ``None`` means "unlimited"
+        spill_dir:  directory for the spill files
+    Returns:
+        generator over the (key, list of elements) pairs
+    """
+    if max_keys is None:
+        groups = defaultdict(list)
+        for value in iterable:
+            groups[key(value)].append(value)
+        yield from groups.items()
+        return
+
+    def append(group: List[Any], value: Any) -> List[Any]:
+        group.append(value)
+        return group
+
+    pairs = ((key(value), value) for value in iterable)
+    yield from hash_aggregate(pairs, lambda value: [value], append, max_keys, spill_dir)
+
+
+def reduce_by_key(iterable: Iterable[Any],
+                  key: Callable[[Any], Any],
+                  reducer: Callable[[Any, Any], Any],
+                  initial: Any = NO_INITIAL,
+                  max_keys: Optional[int] = None,
+                  spill_dir: Optional[str] = None) -> Generator[Tuple[Any, Any], None, None]:
+    """
+    >>> dict(reduce_by_key(['ab', 'c', 'de', 'f'], len, lambda a, b: a + b))
+    {2: 'abde', 1: 'cf'}
+
+    Args:
+        iterable:   elements to reduce
+        key:        function computing the key of an element
+        reducer:    function of the aggregate of a key and its next element
+        initial:    initial aggregate of every key. If omitted, the first element of a key is its initial aggregate
+        max_keys:   maximum number of keys kept in memory at once. ``None`` means "unlimited"
+        spill_dir:  directory for the spill files
+    Returns:
+        generator over the (key, aggregate) pairs
+    """
+    if initial is NO_INITIAL:
+        def start(value: Any) -> Any:
+            return value
+    else:
+        def start(value: Any) -> Any:
+            return reducer(initial, value)
+    yield from hash_aggregate(((key(value), value) for value in iterable), start, reducer, max_keys, spill_dir)
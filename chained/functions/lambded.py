@@ -1,9 +1,16 @@
+from collections import OrderedDict
 from functools import partial
 from keyword import iskeyword
-from typing import Tuple, Final, Callable, Any, List, Generator, NoReturn, Dict
+from threading import Lock
+from typing import Tuple, Final, Callable, Any, List, Generator, NoReturn, Dict, NamedTuple, Optional
 
 from chained.type_utils.meta import ChainedMeta
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def _call_monkey_patcher(self, *args, **kwargs):
     """LambdaExpr.__call__ monkey patcher"""
@@ -31,6 +38,145 @@ def _token_expander(value: Any) -> Generator[Any, None, None]:
         yield value
 
 
+# Tokens whose semantics on NumPy arrays is the element-wise semantics on scalars
+_vectorizable_tokens: Final = frozenset((
+    '(', ')', ',',
+    '+(', '-(', '~(', 'abs(',
+    '+', '-', '*', '/', '//', '%', '**',
+    '<<', '>>', '&', '|', '^',
+    '==', '!=', '<', '>', '<=', '>='
+))
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def _check_maxsize(maxsize: Optional[int]) -> None:
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f'Cache size should be non-negative or None. Got: {maxsize}')
+
+
+class LambdaCache(metaclass=ChainedMeta):
+    """Process-wide LRU cache of lambda functions compiled from the sources of ``LambdaExpr`` instances."""
+    __slots__ = (
+        '_functions',
+        '_maxsize',
+        '_hits',
+        '_misses',
+        '_lock'
+    )
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        """
+        Process-wide LRU cache of lambda functions compiled from the sources of ``LambdaExpr`` instances.
+
+        >>> cache = LambdaCache(2)
+        >>> cache.get('lambda x:(x)+(1)')(1)
+        2
+
+        >>> cache.get('lambda x:(x)+(1)') is cache.get('lambda x:(x)+(1)')
+        True
+
+        >>> cache.info()
+        CacheInfo(hits=2, misses=1, maxsize=2, currsize=1)
+
+        Args:
+            maxsize:  maximum number of functions to keep. ``None`` means "unbounded", 0 disables caching
+        """
+        _check_maxsize(maxsize)
+        self._functions: Final['OrderedDict[str, Callable]'] = OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._lock: Final = Lock()
+
+    def __len__(self) -> int:
+        return len(self._functions)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}{tuple(self.info())} at {hex(id(self))}>'
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        return self._maxsize
+
+    def _shrink(self) -> None:
+        """Evicts the least recently used functions until the size limit is satisfied."""
+        functions = self._functions
+        maxsize = self._maxsize
+        if maxsize is not None:
+            while len(functions) > maxsize:
+                functions.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Forgets all compiled functions and resets the counters.
+
+        >>> cache = LambdaCache()
+        >>> _ = cache.get('lambda:1')
+        >>> cache.clear()
+        >>> cache.info()
+        CacheInfo(hits=0, misses=0, maxsize=1024, currsize=0)
+        """
+        with self._lock:
+            self._functions.clear()
+            self._hits = self._misses = 0
+
+    def get(self, source: str) -> Callable:
+        """
+        Returns the lambda function compiled from the 'source', compiling it on a cache miss.
+
+        Args:
+            source:  source code of a lambda function
+        Returns:
+            compiled function
+        """
+        functions = self._functions
+        with self._lock:
+            function = functions.get(source)
+            if function is not None:
+                self._hits += 1
+                functions.move_to_end(source)
+                return function
+            self._misses += 1
+        function = eval(source)
+        if self._maxsize != 0:
+            with self._lock:
+                functions[source] = function
+                self._shrink()
+        return function
+
+    def info(self) -> CacheInfo:
+        """
+        Returns:
+            cache statistics: hits, misses, size limit and current size
+        """
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._functions))
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        """
+        Changes the size limit, evicting the least recently used functions if necessary.
+
+        >>> cache = LambdaCache()
+        >>> for i in range(5):
+        ...     _ = cache.get(f'lambda:{i}')
+        >>> cache.resize(2)
+        >>> cache.info()
+        CacheInfo(hits=0, misses=5, maxsize=2, currsize=2)
+
+        Args:
+            maxsize:  new maximum number of functions to keep. ``None`` means "unbounded", 0 disables caching
+        """
+        _check_maxsize(maxsize)
+        with self._lock:
+            self._maxsize = maxsize
+            self._shrink()
+
+
 class LambdaExpr(metaclass=ChainedMeta):
     """Implements functionality for shortened creation of lambda functions."""
     __slots__ = (
@@ -205,8 +351,32 @@ class LambdaExpr(metaclass=ChainedMeta):
 
         return arg_list
 
+    def _is_vectorizable(self) -> bool:
+        """Checks whether the expression consists only of the operators with element-wise semantics on arrays.
+
+        >>> x = LambdaVar('x')
+        >>> (abs(x * 2 - 1) >= 3)._is_vectorizable()
+        True
+
+        >>> x._if(x > 0)._else(-x)._is_vectorizable()
+        False
+
+        Returns:
+            whether NumPy can evaluate the expression over whole arrays
+        """
+        for token in self._tokens:
+            if isinstance(token, str):
+                if token not in _vectorizable_tokens and (
+                        token not in _registered_vars or isinstance(_registered_vars[token], _StarredLambdaVar)
+                ):
+                    return False
+            elif not isinstance(token, (int, float, complex)):
+                return False
+        return True
+
     def eval(self) -> Callable:
         """Evaluates tokens into a lambda function.
+        Equal sources are compiled once per process, see ``lambda_cache``.
 
         >>> x = LambdaVar('x')
         >>> y = LambdaVar('y')
@@ -219,10 +389,31 @@ class LambdaExpr(metaclass=ChainedMeta):
         """
         string_repr = f'lambda {",".join(self._get_args())}:{self}'
         self._string_repr: str = string_repr
-        evaluated_lambda = eval(string_repr)
+        evaluated_lambda = lambda_cache.get(string_repr)
         self._lambda = evaluated_lambda
         return evaluated_lambda
 
+    def vectorize(self) -> Callable:
+        """Evaluates tokens into a function over whole NumPy arrays.
+        Arithmetic, comparison and bitwise expressions are evaluated by NumPy at once,
+        the other ones (e.g. built with ``_if`` or ``_for``) fall back to calling the scalar lambda element-wise.
+
+        Be careful: NumPy semantics differs from the Python one on integer overflow and division by zero.
+
+        Returns:
+            function taking array-like arguments and returning a NumPy array
+        """
+        if np is None:
+            raise ImportError('NumPy is required to vectorize an instance of `LambdaExpr`')
+        function = self.eval()
+        if self._is_vectorizable():
+            def vectorized(*arrays):
+                return function(*map(np.asarray, arrays))
+        else:
+            def vectorized(*arrays):
+                return np.array(list(map(function, *arrays)))
+        return vectorized
+
     # >>> Unary operators
     def __pos__(self) -> 'LambdaExpr':
         return LambdaExpr('+(', *self._tokens, ')')
@@ -464,6 +655,9 @@ class LambdaKwargs(_StarredLambdaVar):
 
 _registered_vars: Final[Dict[str, LambdaVar]] = {}
 
+# Compiled lambda functions shared by all the `LambdaExpr` instances with equal sources
+lambda_cache: Final = LambdaCache()
+
 x = LambdaVar('x')
 y = LambdaVar('y')
 z = LambdaVar('z')
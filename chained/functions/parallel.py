@@ -0,0 +1,154 @@
+from collections import deque
+from concurrent.futures import Executor, Future, wait, FIRST_COMPLETED
+from itertools import islice, starmap
+from os import cpu_count
+from typing import Any, Callable, Deque, Generator, Iterable, Iterator, List, Optional
+
+from chained.type_utils.typevar import T, M
+
+
+def default_workers() -> int:
+    """
+    >>> default_workers() >= 1
+    True
+
+    Returns:
+        number of workers to use if it is not specified
+    """
+    return cpu_count() or 1
+
+
+def default_thread_workers() -> int:
+    """
+    >>> default_thread_workers() >= 5
+    True
+
+    Returns:
+        number of threads to use if it is not specified. Matches the default of ``ThreadPoolExecutor``
+    """
+    return min(32, default_workers() + 4)
+
+
+def check_workers(workers: int) -> None:
+    """Validates the number of workers of a pool eagerly, before the pool is started at the first iteration."""
+    if workers < 1:
+        raise ValueError(f'Number of workers should be positive. Got: {workers}')
+
+
+def chunked(iterable: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
+    """
+    Splits the 'iterable' into lists of length `chunk_size`. The last list may be shorter.
+
+    >>> tuple(chunked(range(5), 2))
+    ([0, 1], [2, 3], [4])
+
+    Args:
+        iterable:    iterable to split
+        chunk_size:  size of chunk
+    Returns:
+        iterator over the lists
+    """
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size should be positive. Got: {chunk_size}')
+    iterator = iter(iterable)
+    return iter(lambda: list(islice(iterator, chunk_size)), [])
+
+
+def map_chunk(function: Callable[[T], M], chunk: Iterable[T]) -> List[M]:
+    """Maps the 'function' over the 'chunk' inside a worker."""
+    return list(map(function, chunk))
+
+
+def starmap_chunk(function: Callable[..., M], chunk: Iterable[Iterable]) -> List[M]:
+    """Maps the 'function' over the unpacked items of the 'chunk' inside a worker."""
+    return list(starmap(function, chunk))
+
+
+def filter_chunk(predicate: Callable[[T], Any], chunk: Iterable[T]) -> List[T]:
+    """Filters the 'chunk' by the 'predicate' inside a worker."""
+    return list(filter(predicate, chunk))
+
+
+def _pool_map(executor_factory: Callable[[], Executor],
+              function: Callable[[T], M],
+              iterable: Iterable[T],
+              max_in_flight: int,
+              ordered: bool,
+              yield_preceding: bool) -> Generator[M, None, None]:
+    iterator = iter(iterable)
+    pending: Deque[Future] = deque()
+    executor: Optional[Executor] = None
+    exhausted = False
+    try:
+        executor = executor_factory()
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                for item in islice(iterator, 1):
+                    pending.append(executor.submit(function, item))
+                    break
+                else:
+                    exhausted = True
+            if not pending:
+                return
+
+            if not (pending[0].done() if ordered else any(future.done() for future in pending)):
+                wait([future for future in pending if not future.done()], return_when=FIRST_COMPLETED)
+            failed = [future for future in pending if future.done() and future.exception() is not None]
+
+            if ordered and yield_preceding:
+                # No calls are submitted after a failure, the results preceding it are still yielded
+                exhausted = exhausted or bool(failed)
+            elif failed:
+                raise failed[0].exception()  # type: ignore
+
+            if ordered:
+                while pending and pending[0].done():
+                    yield pending.popleft().result()
+            else:
+                done = [future for future in pending if future.done()]
+                for future in done:
+                    pending.remove(future)
+                for future in done:
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def pool_map(executor_factory: Callable[[], Executor],
+             function: Callable[[T], M],
+             iterable: Iterable[T],
+             max_in_flight: int,
+             ordered: bool = True,
+             *,
+             yield_preceding: bool = False) -> Iterator[M]:
+    """
+    Applies the 'function' to each item of the 'iterable' on an executor
+    created by the 'executor_factory' at the first iteration.
+
+    At most 'max_in_flight' calls are submitted but not yet yielded at any moment.
+    The first exception raised by any call is propagated as soon as it is noticed, unless both 'ordered'
+    and 'yield_preceding' are set: then the results preceding the first failed call are yielded
+    before its exception is raised, as by the built-in ``map``, and no calls are submitted after the failure.
+    When the generator is closed (e.g. because the consumer stops iterating), outstanding calls are cancelled
+    and the executor is shut down.
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> tuple(pool_map(ThreadPoolExecutor, abs, range(-3, 3), 2))
+    (3, 2, 1, 0, 1, 2)
+
+    Args:
+        executor_factory:  callable returning an executor
+        function:          function to apply
+        iterable:          iterable of arguments
+        max_in_flight:     maximum number of pending calls
+        ordered:           whether to yield results in the order of the arguments or in the completion order
+        yield_preceding:   whether to yield the results preceding a failed call before raising its exception
+    Returns:
+        generator over the results
+    """
+    if max_in_flight < 1:
+        raise ValueError(f'The number of calls in flight should be positive. Got: {max_in_flight}')
+    return _pool_map(executor_factory, function, iterable, max_in_flight, ordered, yield_preceding)
@@ -0,0 +1,197 @@
+from collections import abc
+from itertools import islice
+from typing import Any, Final, Iterable, Iterator, List, Optional, Tuple
+
+from chained.functions.fused import MAP, STARMAP, FILTER, SLICE, apply_stages
+from chained.functions.lambded import LambdaExpr
+from chained.type_utils.meta import ChainedMeta
+
+# Stages that transform each element into exactly one element, so that slicing commutes with them
+_ELEMENT_WISE: Final = frozenset((MAP, STARMAP))
+
+
+def _stage_name(obj: Any) -> str:
+    """Human-readable name of a stage argument used by ``LogicalPlan.explain``.
+
+    >>> _stage_name(str)
+    'str'
+
+    >>> _stage_name(3)
+    '3'
+
+    Args:
+        obj:  stage argument
+    Returns:
+        its name
+    """
+    if isinstance(obj, LambdaExpr):
+        return str(obj)
+    name = getattr(obj, '__qualname__', None)
+    return name if isinstance(name, str) else repr(obj)
+
+
+def normalize_slice(*args: Optional[int]) -> Tuple[int, Optional[int], int]:
+    """Converts ``islice``-like arguments ([start,] stop[, step]) into a (start, stop, step) triple.
+
+    >>> normalize_slice(5)
+    (0, 5, 1)
+
+    >>> normalize_slice(2, None, 3)
+    (2, None, 3)
+
+    Args:
+        *args:  slicing parameters: ([start,] stop[, step])
+    Returns:
+        normalized triple. Stop equal to ``None`` means "unbounded"
+    """
+    # Delegates argument validation to `islice` so that the errors match the eager mode
+    islice((), *args)
+    s = slice(*args)
+    return s.start or 0, s.stop, s.step or 1
+
+
+def compose_slices(first: Tuple[int, Optional[int], int],
+                   second: Tuple[int, Optional[int], int]) -> Tuple[int, Optional[int], int]:
+    """Composes two normalized slices into a single one that selects the same elements.
+
+    >>> compose_slices((2, None, 3), (1, 3, 1))
+    (5, 11, 3)
+
+    >>> compose_slices((0, 10, 1), (3, None, 1))
+    (3, 10, 1)
+
+    Args:
+        first:   slice applied first
+        second:  slice applied to the result of the first one
+    Returns:
+        composed slice
+    """
+    start_1, stop_1, step_1 = first
+    start_2, stop_2, step_2 = second
+    start = start_1 + start_2 * step_1
+    stop = stop_1
+    if stop_2 is not None:
+        bound = start_1 + stop_2 * step_1
+        stop = bound if stop is None else min(stop, bound)
+    if stop is not None and stop < start:
+        stop = start
+    return start, stop, step_1 * step_2
+
+
+class LogicalPlan(metaclass=ChainedMeta):
+    """Deferred sequence of chain stages over a source iterable, rewritten before each execution."""
+
+    __slots__ = ('_source', '_stages')
+
+    def __init__(self, source: Iterable, stages: Tuple[Tuple, ...] = ()) -> None:
+        """
+        Deferred sequence of chain stages over a source iterable.
+
+        >>> list(LogicalPlan(range(10), ((MAP, str), (SLICE, 7, None, 1))))
+        ['7', '8', '9']
+
+        Args:
+            source:  iterable to start from
+            stages:  recorded stages in the order of their application
+        """
+        self._source: Final = source
+        self._stages: Final[Tuple[Tuple, ...]] = stages
+
+    def __iter__(self) -> Iterator:
+        """
+        Optimizes the plan and executes it. Adjacent element-wise stages are fused, see ``set_fusion``.
+
+        Returns:
+            iterator over the resulting values
+        """
+        plan = self.optimize()
+        stages = plan._stages
+        iterator = plan._source
+        if stages and stages[0][0] == SLICE and isinstance(iterator, abc.Sequence):
+            # Random access instead of walking the prefix
+            _, start, stop, step = stages[0]
+            iterator = map(iterator.__getitem__, range(len(iterator))[start:stop:step])
+            stages = stages[1:]
+        return apply_stages(iterator, stages)
+
+    def __repr__(self) -> str:
+        return f'LogicalPlan({self.explain()})'
+
+    @property
+    def source(self) -> Iterable:
+        """Iterable the plan starts from."""
+        return self._source
+
+    @property
+    def stages(self) -> Tuple[Tuple, ...]:
+        """Recorded stages in the order of their application."""
+        return self._stages
+
+    def append(self, kind: str, *args: Any) -> 'LogicalPlan':
+        """
+        Creates a new plan with one more stage at the end.
+
+        >>> LogicalPlan(range(10)).append(MAP, str).append(SLICE, 2, 4, 1)
+        LogicalPlan(range(0, 10) | map(str) | slice(2, 4, 1))
+
+        Args:
+            kind:   stage kind
+            *args:  stage arguments
+        Returns:
+            extended plan
+        """
+        return LogicalPlan(self._source, (*self._stages, (kind, *args)))
+
+    def explain(self) -> str:
+        """
+        Describes the plan as a pipe-separated string.
+
+        >>> LogicalPlan((1, 2), ((FILTER, bool), (MAP, abs))).explain()
+        '(1, 2) | filter(bool) | map(abs)'
+
+        Returns:
+            plan description
+        """
+        parts = [repr(self._source)]
+        for kind, *args in self._stages:
+            if kind == SLICE:
+                parts.append(f'slice{tuple(args)}')
+            else:
+                parts.append(f'{kind}({", ".join(map(_stage_name, args))})')
+        return ' | '.join(parts)
+
+    def optimize(self) -> 'LogicalPlan':
+        """
+        Rewrites the plan so that it yields the same values doing less work.
+
+        Slicing stages (``skip``, ``take``, ``slice``, ``step_by``) are pushed below element-wise stages
+        (``map``, ``starmap``) and merged with each other. A leading slice over a ``range`` source is folded into it.
+
+        >>> LogicalPlan(range(10 ** 9)).append(MAP, str).append(SLICE, 10 ** 8, None, 1).append(SLICE, 0, 3, 1).optimize()
+        LogicalPlan(range(100000000, 100000003) | map(str))
+
+        >>> LogicalPlan([1, 2, 3]).append(FILTER, bool).append(SLICE, 1, None, 1).optimize()
+        LogicalPlan([1, 2, 3] | filter(bool) | slice(1, None, 1))
+
+        Returns:
+            optimized plan
+        """
+        stages: List[Tuple] = []
+        for stage in self._stages:
+            if stage[0] != SLICE:
+                stages.append(stage)
+                continue
+            held = []
+            while stages and stages[-1][0] in _ELEMENT_WISE:
+                held.append(stages.pop())
+            if stages and stages[-1][0] == SLICE:
+                stage = (SLICE, *compose_slices(stages.pop()[1:], stage[1:]))
+            stages.append(stage)
+            stages.extend(reversed(held))
+
+        source = self._source
+        if stages and stages[0][0] == SLICE and isinstance(source, range):
+            _, start, stop, step = stages.pop(0)
+            source = source[start:stop:step]
+        return LogicalPlan(source, tuple(stages))
+
@@ -0,0 +1,375 @@
+from collections import deque
+from itertools import count, islice
+from math import ceil, log
+from numbers import Number
+from threading import Lock
+from typing import Any, Callable, Final, Iterator, List, Optional, Sequence, Tuple, Union
+
+from chained.functions.views import SequenceView
+from chained.type_utils.meta import ChainedMeta
+
+
+def _check_slice(item: slice) -> Tuple[int, Optional[int], int]:
+    """Validates the slice of an infinite sequence and converts it to a (start, stop, step) triple."""
+    start = item.start or 0
+    step = item.step or 1
+    if start < 0 or step < 1 or (item.stop is not None and item.stop < 0):
+        raise ValueError(f'Only non-negative starts and stops and positive steps are allowed. Got: {item}')
+    return start, item.stop, step
+
+
+class ArithmeticProgression(metaclass=ChainedMeta):
+    """Immutable infinite arithmetic progression: a re-iterable analogue of ``itertools.count``."""
+
+    __slots__ = ('_start', '_step')
+
+    def __init__(self, start: Number = 0, step: Number = 1) -> None:
+        """
+        Immutable infinite arithmetic progression.
+
+        >>> progression = ArithmeticProgression(2, 3)
+        >>> progression[10 ** 9], 3 * 10 ** 9 + 2 in progression
+        (3000000002, True)
+
+        >>> progression[5:8]
+        range(17, 26, 3)
+
+        Args:
+            start:  first term
+            step:   difference between the consecutive terms
+        """
+        self._start: Final = start
+        self._step: Final = step
+
+    def __contains__(self, item: object) -> bool:
+        return self._index(item) is not None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArithmeticProgression):
+            return NotImplemented
+        return (self._start, self._step) == (other._start, other._step)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Number, range, SequenceView, 'ArithmeticProgression']:
+        """
+        Computes the term at the position or selects the terms by the slice with non-negative parameters.
+
+        Args:
+            item:  `int` or `slice`
+        Returns:
+            if 'item' is `slice` with a stop, range of the terms selected (or a view, if the terms are not integers).
+            If 'item' is `slice` without a stop, progression of the terms selected.
+            Otherwise, single term at the position
+        """
+        if isinstance(item, slice):
+            start, stop, step = _check_slice(item)
+            if stop is None:
+                return ArithmeticProgression(self[start], self._step * step)
+            indices = range(start, stop, step)
+            if type(self._start) is int and type(self._step) is int and self._step:
+                return range(self[indices.start], self[indices.stop], self._step * step)
+            return SequenceView(self, indices)
+        if item < 0:
+            raise IndexError('Infinite progression does not support negative indices')
+        return self._start + self._step * item
+
+    def __hash__(self) -> int:
+        return hash((ArithmeticProgression, self._start, self._step))
+
+    def __iter__(self) -> Iterator[Number]:
+        return count(self._start, self._step)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._start}, {self._step})'
+
+    @property
+    def start(self) -> Number:
+        """First term."""
+        return self._start
+
+    @property
+    def step(self) -> Number:
+        """Difference between the consecutive terms."""
+        return self._step
+
+    def _index(self, value: object) -> Optional[int]:
+        """Position of the 'value' if the progression contains it."""
+        if not isinstance(value, Number):
+            return None
+        difference = value - self._start  # type: ignore
+        if not self._step:
+            return 0 if difference == 0 else None
+        position, remainder = divmod(difference, self._step)
+        if remainder or position < 0:
+            return None
+        return int(position)
+
+    def index(self, value: object) -> int:
+        """
+        >>> ArithmeticProgression(10, -2).index(-4)
+        7
+
+        Args:
+            value:  term to look for
+        Returns:
+            position of the first occurrence of the 'value'
+        """
+        position = self._index(value)
+        if position is None:
+            raise ValueError(f'{value!r} is not in progression')
+        return position
+
+
+class GeometricProgression(metaclass=ChainedMeta):
+    """Immutable infinite geometric progression with closed-form indexing."""
+
+    __slots__ = ('_start', '_ratio')
+
+    def __init__(self, start: Number, ratio: Number) -> None:
+        """
+        Immutable infinite geometric progression.
+
+        >>> progression = GeometricProgression(3, 2)
+        >>> progression[100]
+        3802951800684688204490109616128
+
+        >>> 3 * 2 ** 50 in progression, progression.index(96)
+        (True, 5)
+
+        >>> progression[2:]
+        GeometricProgression(12, 2)
+
+        Args:
+            start:  first term
+            ratio:  ratio of the consecutive terms
+        """
+        self._start: Final = start
+        self._ratio: Final = ratio
+
+    def __contains__(self, item: object) -> bool:
+        return self._index(item) is not None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GeometricProgression):
+            return NotImplemented
+        return (self._start, self._ratio) == (other._start, other._ratio)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Number, SequenceView, 'GeometricProgression']:
+        """
+        Computes the term at the position or selects the terms by the slice with non-negative parameters.
+
+        Args:
+            item:  `int` or `slice`
+        Returns:
+            if 'item' is `slice` with a stop, zero-copy view of the terms selected.
+            If 'item' is `slice` without a stop, progression of the terms selected.
+            Otherwise, single term at the position
+        """
+        if isinstance(item, slice):
+            start, stop, step = _check_slice(item)
+            if stop is None:
+                return GeometricProgression(self[start], self._ratio ** step)
+            return SequenceView(self, range(start, stop, step))
+        if item < 0:
+            raise IndexError('Infinite progression does not support negative indices')
+        return self._start * self._ratio ** item
+
+    def __hash__(self) -> int:
+        return hash((GeometricProgression, self._start, self._ratio))
+
+    def __iter__(self) -> Iterator[Number]:
+        term = self._start
+        ratio = self._ratio
+        while True:
+            yield term
+            term *= ratio
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._start}, {self._ratio})'
+
+    @property
+    def ratio(self) -> Number:
+        """Ratio of the consecutive terms."""
+        return self._ratio
+
+    @property
+    def start(self) -> Number:
+        """First term."""
+        return self._start
+
+    def _index(self, value: object) -> Optional[int]:
+        """Position of the 'value' if the progression contains it."""
+        if not isinstance(value, Number):
+            return None
+        start, ratio = self._start, self._ratio
+        if value == start:
+            return 0
+        if not start or not value or abs(ratio) in (0, 1):
+            # At most two distinct values
+            return 1 if value == start * ratio else None
+        try:
+            estimate = round(log(abs(value / start)) / log(abs(ratio)))  # type: ignore
+        except (ValueError, OverflowError):
+            return None
+        for position in range(max(estimate - 1, 1), estimate + 2):
+            if self[position] == value:
+                return position
+        return None
+
+    def index(self, value: object) -> int:
+        """
+        >>> GeometricProgression(1, -3).index(-27)
+        3
+
+        Args:
+            value:  term to look for
+        Returns:
+            position of the first occurrence of the 'value'
+        """
+        position = self._index(value)
+        if position is None:
+            raise ValueError(f'{value!r} is not in progression')
+        return position
+
+    def terms_before(self, bound: Number, inclusive: bool = False) -> int:
+        """
+        Counts the leading terms of a monotonic progression that do not reach the 'bound'.
+
+        >>> GeometricProgression(1, 2).terms_before(100)
+        7
+
+        >>> GeometricProgression(64, 0.5).terms_before(1, inclusive=True)
+        7
+
+        Args:
+            bound:      bound in the direction of the progression
+            inclusive:  whether the terms equal to the 'bound' are counted
+        Returns:
+            number of terms
+        """
+        start, ratio = self._start, self._ratio
+        if not start or ratio <= 0 or ratio == 1:
+            raise ValueError(f'{self} is not strictly monotonic, so it cannot be bounded')
+        increasing = (start > 0) == (ratio > 1)
+
+        def before(term: Number) -> bool:
+            if increasing:
+                return term <= bound if inclusive else term < bound  # type: ignore
+            return term >= bound if inclusive else term > bound  # type: ignore
+
+        if not before(start):
+            return 0
+        if ratio < 1 and (bound >= 0 if increasing else bound <= 0):  # type: ignore
+            raise ValueError(f'{self} converges to 0 and never reaches {bound}')
+        n = max(ceil(log(bound / start) / log(ratio)), 1)  # type: ignore
+        while n > 1 and not before(self[n - 1]):
+            n -= 1
+        while before(self[n]):
+            n += 1
+        return n
+
+
+class Recurrence(metaclass=ChainedMeta):
+    """
+    Infinite sequence defined by its first terms and a rule computing the next term from the preceding ones.
+    The terms are memoized in a bounded cache.
+    """
+
+    __slots__ = ('_initial', '_rule', '_cache_size', '_prefix', '_window', '_lock')
+
+    def __init__(self, initial: Sequence, rule: Callable[..., Any], cache_size: int = 4096) -> None:
+        """
+        Infinite sequence defined by its first terms and a rule.
+        Each term is computed by calling 'rule' with ``len(initial)`` preceding terms.
+
+        Up to 'cache_size' leading terms are memoized. Beyond them, only the most recent window of terms is kept,
+        so accessing the terms in the ascending order takes constant time per term.
+
+        >>> fibonacci = Recurrence((0, 1), lambda a, b: a + b)
+        >>> fibonacci[90], fibonacci[10:15]
+        (2880067194370816120, SequenceView([55, 89, 144, 233, 377]))
+
+        Args:
+            initial:     first terms
+            rule:        function of ``len(initial)`` preceding terms
+            cache_size:  maximum number of leading terms to memoize
+        """
+        if not initial:
+            raise ValueError('Recurrence requires at least one initial term')
+        self._initial: Final[Tuple] = tuple(initial)
+        self._rule: Final = rule
+        self._cache_size: Final = max(cache_size, len(initial))
+        self._prefix: Final[List] = list(initial)
+        # (index of the first term of the window, terms of the window)
+        self._window: Tuple[int, Tuple] = (0, self._initial)
+        self._lock: Final = Lock()
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Any, SequenceView, Iterator, 'Recurrence']:
+        """
+        Computes the term at the position or selects the terms by the slice with non-negative parameters.
+
+        Args:
+            item:  `int` or `slice`
+        Returns:
+            if 'item' is `slice` with a stop, zero-copy view of the terms selected.
+            If 'item' is `slice` without a stop, recurrence starting from the selected position
+            (iterator over the terms selected if the step differs from 1).
+            Otherwise, single term at the position
+        """
+        if isinstance(item, slice):
+            start, stop, step = _check_slice(item)
+            if stop is not None:
+                return SequenceView(self, range(start, stop, step))
+            if step != 1:
+                return islice(self, start, None, step)
+            order = len(self._initial)
+            return Recurrence([self[i] for i in range(start, start + order)], self._rule, self._cache_size)
+        if item < 0:
+            raise IndexError('Infinite sequence does not support negative indices')
+        prefix = self._prefix
+        if item < len(prefix):
+            return prefix[item]
+        with self._lock:
+            return self._compute(item)
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            terms = self._prefix[:]
+        yield from terms
+        rule = self._rule
+        window = deque(terms[-len(self._initial):], len(self._initial))
+        while True:
+            term = rule(*window)
+            window.append(term)
+            yield term
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._initial}, {getattr(self._rule, "__qualname__", self._rule)})'
+
+    @property
+    def initial(self) -> Tuple:
+        """First terms."""
+        return self._initial
+
+    @property
+    def rule(self) -> Callable[..., Any]:
+        """Function computing the next term from the preceding ones."""
+        return self._rule
+
+    def _compute(self, n: int) -> Any:
+        """Computes the n-th term beyond the cached prefix starting from the closest known window."""
+        prefix = self._prefix
+        order = len(self._initial)
+        rule = self._rule
+        first, window = self._window
+        if not len(prefix) - order <= first <= n - order + 1:
+            # The window is either behind the cached prefix or ahead of the n-th term
+            first, window = len(prefix) - order, tuple(prefix[-order:])
+        terms = deque(window, order)
+        position = first + order - 1  # index of the last term in the 'terms'
+        while position < n:
+            terms.append(rule(*terms))
+            position += 1
+            if position == len(prefix) and position < self._cache_size:
+                prefix.append(terms[-1])
+        self._window = (position - order + 1, tuple(terms))
+        return terms[-1]
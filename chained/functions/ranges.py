@@ -0,0 +1,174 @@
+import ast
+from math import gcd
+from typing import Any, Optional, Tuple
+
+from chained.functions.lambded import LambdaExpr
+
+
+def _single_arg_tree(func: Any) -> Optional[Tuple[str, ast.expr]]:
+    """Parses the body of a single-argument ``LambdaExpr``."""
+    if not isinstance(func, LambdaExpr):
+        return None
+    args = func._get_args()
+    if len(args) != 1:
+        return None
+    try:
+        return args[0], ast.parse(str(func), mode='eval').body
+    except SyntaxError:
+        return None
+
+
+def _int_constant(node: ast.expr) -> Optional[int]:
+    """Value of an integer literal (booleans excluded)."""
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return node.value
+    return None
+
+
+def _affine(node: ast.expr, var: str) -> Optional[Tuple[int, int]]:
+    """Integer coefficients (a, b) such that the expression equals a * var + b."""
+    if isinstance(node, ast.Name):
+        return (1, 0) if node.id == var else None
+    constant = _int_constant(node)
+    if constant is not None:
+        return 0, constant
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        operand = _affine(node.operand, var)
+        if operand is None:
+            return None
+        sign = -1 if isinstance(node.op, ast.USub) else 1
+        return sign * operand[0], sign * operand[1]
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub, ast.Mult)):
+        left = _affine(node.left, var)
+        right = _affine(node.right, var)
+        if left is None or right is None:
+            return None
+        (a_1, b_1), (a_2, b_2) = left, right
+        if isinstance(node.op, ast.Add):
+            return a_1 + a_2, b_1 + b_2
+        if isinstance(node.op, ast.Sub):
+            return a_1 - a_2, b_1 - b_2
+        if a_1 and a_2:
+            # Quadratic term
+            return None
+        return a_1 * b_2 + a_2 * b_1, b_1 * b_2
+    return None
+
+
+def affine_coefficients(func: Any) -> Optional[Tuple[int, int]]:
+    """
+    Recognizes ``LambdaExpr`` instances of the form ``x * a + b`` with integer 'a' and 'b'.
+
+    >>> from chained.functions.lambded import x
+    >>> affine_coefficients((x + 1) * -2 + 3)
+    (-2, 1)
+
+    >>> affine_coefficients(x * x) is None
+    True
+
+    Args:
+        func:  mapped function
+    Returns:
+        (a, b) if 'func' is affine. ``None`` - otherwise
+    """
+    parsed = _single_arg_tree(func)
+    if parsed is None:
+        return None
+    return _affine(parsed[1], parsed[0])
+
+
+def modulo_condition(func: Any) -> Optional[Tuple[int, int]]:
+    """
+    Recognizes ``LambdaExpr`` predicates of the form ``x % m == r`` with positive integer 'm' and integer 'r'.
+
+    >>> from chained.functions.lambded import x
+    >>> modulo_condition(x % 3 == 1)
+    (3, 1)
+
+    Args:
+        func:  predicate
+    Returns:
+        (m, r) if 'func' is a modulo condition. ``None`` - otherwise
+    """
+    parsed = _single_arg_tree(func)
+    if parsed is None:
+        return None
+    var, node = parsed
+    if not (isinstance(node, ast.Compare) and len(node.ops) == 1 and isinstance(node.ops[0], ast.Eq)):
+        return None
+    left, right = node.left, node.comparators[0]
+    if not isinstance(left, ast.BinOp):
+        left, right = right, left
+    if not (isinstance(left, ast.BinOp) and isinstance(left.op, ast.Mod)):
+        return None
+    modulus = _int_constant(left.right)
+    remainder = _int_constant(right)
+    if _affine(left.left, var) != (1, 0) or modulus is None or modulus <= 0 or remainder is None:
+        return None
+    return modulus, remainder
+
+
+def map_range(rng: range, a: int, b: int) -> range:
+    """
+    Applies ``x * a + b`` with a non-zero 'a' to every element of the 'rng'.
+
+    >>> map_range(range(1, 10, 3), -2, 5)
+    range(3, -15, -6)
+
+    Args:
+        rng:  range to map
+        a:    non-zero multiplier
+        b:    addend
+    Returns:
+        range of the mapped values
+    """
+    return range(rng.start * a + b, rng.stop * a + b, rng.step * a)
+
+
+def solve_congruence(start: int, step: int, modulus: int, remainder: int) -> Optional[Tuple[int, int]]:
+    """
+    Finds the indices 'k' of the arithmetic progression ``start + k * step`` such that
+    ``(start + k * step) % modulus == remainder``. They form the progression ``first + i * period``.
+
+    >>> solve_congruence(2, 4, 6, 4)
+    (2, 3)
+
+    Args:
+        start:      first term of the progression
+        step:       difference of the progression
+        modulus:    positive modulus
+        remainder:  expected remainder
+    Returns:
+        (first, period) if there are such indices. ``None`` - otherwise
+    """
+    if not 0 <= remainder < modulus:
+        return None
+    divisor = gcd(step, modulus)
+    difference = remainder - start
+    if difference % divisor:
+        return None
+    period = modulus // divisor
+    if period == 1:
+        return 0, 1
+    return difference // divisor * pow(step // divisor, -1, period) % period, period
+
+
+def filter_range(rng: range, modulus: int, remainder: int) -> range:
+    """
+    Selects the elements 'x' of the 'rng' satisfying ``x % modulus == remainder``.
+
+    >>> filter_range(range(2, 100, 4), 6, 4)
+    range(10, 102, 12)
+
+    Args:
+        rng:        range to filter
+        modulus:    positive modulus
+        remainder:  expected remainder
+    Returns:
+        range of the selected elements
+    """
+    solution = solve_congruence(rng.start, rng.step, modulus, remainder)
+    if solution is None:
+        return rng[:0]
+    first, period = solution
+    return rng[first::period]
@@ -0,0 +1,250 @@
+from collections import abc
+from heapq import heapify, heapreplace
+from itertools import islice
+from math import exp, expm1, floor, inf, log, log1p
+from random import Random
+from sys import maxsize
+from typing import Any, Callable, Dict, Final, Generator, Hashable, Iterable, List, Optional, Tuple
+
+from chained.type_utils.meta import ChainedMeta
+
+# Marker of the exhausted iterator
+_MISSING: Final = object()
+
+# Threshold of ``_log1mexp`` between its two formulas: log(1/2)
+_LOG_HALF: Final = -0.6931471805599453
+
+
+def _check_size(n: int) -> None:
+    if n < 0:
+        raise ValueError(f'Sample size should be non-negative. Got: {n}')
+
+
+def _uniform(rng: Random) -> float:
+    """Uniform random number from the open interval (0, 1)."""
+    while True:
+        u = rng.random()
+        if u:
+            return u
+
+
+def _log1mexp(x: float) -> float:
+    """Accurate ``log(1 - exp(x))`` for negative 'x' of any magnitude."""
+    return log(-expm1(x)) if x > _LOG_HALF else log1p(-exp(x))
+
+
+def _gap(rng: Random, log_w: float) -> int:
+    """Number of the elements skipped by Algorithm L before the next replacement. 'log_w' is the log of its 'W'."""
+    return min(floor(log(_uniform(rng)) / _log1mexp(log_w)), maxsize)
+
+
+def _jump(rng: Random, threshold: float) -> float:
+    """Total weight skipped by Algorithm A-ExpJ before the next replacement. 'threshold' is the log of the least key."""
+    return log(_uniform(rng)) / threshold if threshold else inf
+
+
+class Reservoir(metaclass=ChainedMeta):
+    """Uniform sample of a fixed size from the elements added one by one, maintained by Algorithm L."""
+
+    __slots__ = ('_size', '_random', '_seen', '_next', '_log_w', '_items', '_positions')
+
+    def __init__(self, size: int, rng: Optional[Random] = None) -> None:
+        """
+        Uniform sample of at most 'size' elements. Algorithm L draws random numbers only when an element
+        replaces a sampled one, i.e. O(size * log(seen / size)) times, so adding an element is a comparison.
+
+        >>> reservoir = Reservoir(3, Random(0))
+        >>> for i in range(1000):
+        ...     reservoir.add(i)
+        >>> reservoir.seen, len(reservoir.result())
+        (1000, 3)
+
+        Args:
+            size:  maximum number of the sampled elements
+            rng:   source of the random numbers. ``None`` means a new unseeded one
+        """
+        _check_size(size)
+        self._size: Final = size
+        self._random: Final = Random() if rng is None else rng
+        self._seen = 0
+        # Position of the next element replacing a sampled one. Never reached by an empty reservoir
+        self._next = size if size else -1
+        self._log_w = 0.0
+        self._items: Final[List[Any]] = []
+        self._positions: Final[List[int]] = []
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(size={self._size}, seen={self._seen})'
+
+    @property
+    def seen(self) -> int:
+        """Number of the elements added."""
+        return self._seen
+
+    @property
+    def size(self) -> int:
+        """Maximum number of the sampled elements."""
+        return self._size
+
+    def add(self, item: Any) -> None:
+        """
+        Args:
+            item:  element to sample from
+        """
+        position = self._seen
+        self._seen = position + 1
+        if position < self._size:
+            self._items.append(item)
+            self._positions.append(position)
+            if position + 1 == self._size:
+                self._log_w = log(_uniform(self._random)) / self._size
+                self._next = self._size + _gap(self._random, self._log_w)
+            return
+        if position != self._next:
+            return
+        rng = self._random
+        slot = rng.randrange(self._size)
+        self._items[slot] = item
+        self._positions[slot] = position
+        self._log_w += log(_uniform(rng)) / self._size
+        self._next = position + 1 + _gap(rng, self._log_w)
+
+    def result(self) -> List[Any]:
+        """
+        Returns:
+            sampled elements in the order they were added
+        """
+        items = self._items
+        return [items[i] for i in sorted(range(len(items)), key=self._positions.__getitem__)]
+
+
+def reservoir_sample(iterable: Iterable[Any], n: int, rng: Random) -> List[Any]:
+    """
+    Uniform sample of 'n' elements of the 'iterable' of unknown length in a single pass.
+    Sequences are sampled by index without iterating them.
+    Other iterables are sampled by Algorithm L, which draws the number of elements to skip
+    before the next replacement at once and skips them by ``itertools.islice`` in C,
+    so that only O(n * log(N / n)) of the N elements are handled in Python.
+
+    >>> reservoir_sample(range(10 ** 12), 3, Random(0))
+    [44756014165, 424533559245, 978212965548]
+    >>> len(reservoir_sample(iter(range(10 ** 6)), 5, Random(0)))
+    5
+
+    Args:
+        iterable:  elements to sample from
+        n:         sample size
+        rng:       source of the random numbers
+    Returns:
+        sampled elements in their original order. All the elements if there are at most 'n' of them
+    """
+    _check_size(n)
+    if isinstance(iterable, abc.Sequence):
+        size = len(iterable)
+        if n >= size:
+            return list(iterable)
+        return [iterable[i] for i in sorted(rng.sample(range(size), n))]
+
+    iterator = iter(iterable)
+    items = list(islice(iterator, n))
+    if len(items) < n or not n:
+        return items
+    positions = list(range(n))
+    position = n - 1
+    log_w = log(_uniform(rng)) / n
+    while True:
+        skip = _gap(rng, log_w)
+        item = next(islice(iterator, skip, None), _MISSING)
+        if item is _MISSING:
+            break
+        position += skip + 1
+        slot = rng.randrange(n)
+        items[slot] = item
+        positions[slot] = position
+        log_w += log(_uniform(rng)) / n
+    return [items[i] for i in sorted(range(n), key=positions.__getitem__)]
+
+
+def weighted_sample(iterable: Iterable[Any], n: int, weight: Callable[[Any], float], rng: Random) -> List[Any]:
+    """
+    Weighted sample of 'n' elements of the 'iterable' without replacement in a single pass.
+    Each element gets the key ``u ** (1 / weight)`` for a uniform random 'u', and the 'n' largest keys are kept
+    in a heap (A-Res of Efraimidis and Spirakis). Keys are handled as logarithms to avoid underflows.
+    Exponential jumps (A-ExpJ) draw random numbers only for the elements entering the sample.
+
+    >>> weighted_sample('abcdef', 2, lambda letter: 1 if letter in 'ab' else 0, Random(0))
+    ['a', 'b']
+
+    Args:
+        iterable:  elements to sample from
+        n:         sample size
+        weight:    function computing the non-negative weight of an element. Elements of zero weight are never sampled
+        rng:       source of the random numbers
+    Returns:
+        sampled elements in their original order. All the elements of positive weight if there are at most 'n' of them
+    """
+    _check_size(n)
+    if not n:
+        return []
+    # (log of the key, position, element) entries
+    heap: List[Tuple[float, int, Any]] = []
+    iterator = enumerate(iterable)
+    for position, item in iterator:
+        w = weight(item)
+        if w < 0:
+            raise ValueError(f'Weights should be non-negative. Got: {w}')
+        if w:
+            heap.append((log(_uniform(rng)) / w, position, item))
+            if len(heap) == n:
+                break
+    else:
+        return [item for _, _, item in heap]
+
+    heapify(heap)
+    threshold = heap[0][0]
+    jump = _jump(rng, threshold)
+    for position, item in iterator:
+        w = weight(item)
+        if w < 0:
+            raise ValueError(f'Weights should be non-negative. Got: {w}')
+        jump -= w
+        if jump > 0:
+            continue
+        # The key of the element is uniform among the ones exceeding the threshold
+        low = exp(threshold * w)
+        heapreplace(heap, (log(low + (1 - low) * _uniform(rng)) / w, position, item))
+        threshold = heap[0][0]
+        jump = _jump(rng, threshold)
+    heap.sort(key=lambda entry: entry[1])
+    return [item for _, _, item in heap]
+
+
+def sample_by(iterable: Iterable[Any],
+              key: Callable[[Any], Hashable],
+              n: int,
+              rng: Random) -> Generator[Tuple[Hashable, List[Any]], None, None]:
+    """
+    Stratified sample: a uniform sample of 'n' elements of each key kept in a separate `Reservoir`.
+
+    >>> dict(sample_by(range(100), lambda v: v % 2, 100, Random(0))) == {0: list(range(0, 100, 2)),
+    ...                                                                 1: list(range(1, 100, 2))}
+    True
+
+    Args:
+        iterable:  elements to sample from
+        key:       function computing the key of an element
+        n:         sample size of each key
+        rng:       source of the random numbers
+    Returns:
+        generator over the (key, sampled elements in their original order) pairs in the order of the keys' appearance
+    """
+    _check_size(n)
+    strata: Dict[Hashable, Reservoir] = {}
+    for item in iterable:
+        group = key(item)
+        reservoir = strata.get(group)
+        if reservoir is None:
+            strata[group] = reservoir = Reservoir(n, rng)
+        reservoir.add(item)
+    for group, reservoir in strata.items():
+        yield group, reservoir.result()
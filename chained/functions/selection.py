@@ -0,0 +1,74 @@
+from heapq import heappush, heapreplace, nlargest, nsmallest
+from itertools import chain, count
+from typing import Any, Callable, Generator, Iterable, List, Optional
+
+from chained.functions.lambded import np
+
+
+def running_top_k(iterable: Iterable[Any],
+                  k: int,
+                  key: Optional[Callable[[Any], Any]] = None) -> Generator[List[Any], None, None]:
+    """
+    Maintains the 'k' largest elements seen so far in a bounded min-heap
+    and yields them in the descending order each time they change.
+    Of the elements with equal keys, the earlier ones are preferred.
+
+    >>> list(running_top_k([3, 1, 4, 1, 5], 2))
+    [[3], [3, 1], [4, 3], [5, 4]]
+
+    Args:
+        iterable:  elements to select from
+        k:         number of elements to keep
+        key:       function computing the comparison key
+    Returns:
+        generator over the updated top lists
+    """
+    if k < 1:
+        return
+    heap: List[Any] = []
+    # Negated order numbers make the later of the equal elements the first to be evicted
+    order = count(0, -1)
+    for item in iterable:
+        entry = (item if key is None else key(item), next(order), item)
+        if len(heap) < k:
+            heappush(heap, entry)
+        elif entry > heap[0]:
+            heapreplace(heap, entry)
+        else:
+            continue
+        yield [entry[2] for entry in sorted(heap, reverse=True)]
+
+
+def batch_top_k(batches: Iterable[Any], k: int, largest: bool = True) -> List[Any]:
+    """
+    Selects the 'k' largest (or smallest) elements of all the 'batches'.
+    NumPy batches are reduced to 'k' candidates at a time by ``np.argpartition``,
+    other batches are scanned by a bounded heap.
+
+    >>> from array import array
+    >>> batch_top_k((array('d', [4, 1, 7]), array('d', [9, 2])), 2)
+    [9.0, 7.0]
+
+    Args:
+        batches:  ``array.array`` or NumPy arrays
+        k:        number of elements to select
+        largest:  whether to select the largest elements instead of the smallest ones
+    Returns:
+        list of the selected elements ordered from the most extreme one
+    """
+    iterator = iter(batches)
+    first = next(iterator, None)
+    if first is None or k < 1:
+        return []
+    if np is None or not isinstance(first, np.ndarray):
+        select = nlargest if largest else nsmallest
+        return select(k, chain.from_iterable(chain((first,), iterator)))
+    candidates = first[:0]
+    for batch in chain((first,), iterator):
+        pool = np.concatenate((candidates, batch))
+        if len(pool) > k:
+            indices = np.argpartition(pool, len(pool) - k if largest else k - 1)
+            pool = pool[indices[-k:]] if largest else pool[indices[:k]]
+        candidates = pool
+    candidates = np.sort(candidates)
+    return (candidates[::-1] if largest else candidates).tolist()
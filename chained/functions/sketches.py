@@ -0,0 +1,326 @@
+from hashlib import blake2b
+from heapq import heapify, heappush, heapreplace
+from math import ceil, log
+from numbers import Complex, Number, Rational, Real
+from typing import Any, Dict, Final, Hashable, Iterable, List, Tuple
+
+from chained.type_utils.meta import ChainedMeta
+
+# Inverse powers of two indexed by the register values of HyperLogLog
+_INVERSE_POWERS: Final = tuple(2.0 ** -rank for rank in range(65))
+
+
+def _ratio_bytes(numerator: int, denominator: int) -> bytes:
+    return b'%x/%x' % (numerator, denominator)
+
+
+def _canonical(item: Any) -> bytes:
+    """
+    Encodes the 'item' so that equal values have equal encodings independently of the process.
+    Numbers are encoded by their exact ratios, containers - by the encodings of their elements
+    (unordered ones - by the sorted encodings).
+    """
+    cls = type(item)
+    if cls is str:
+        return b's' + item.encode('utf-8', 'surrogatepass')
+    if cls is int or cls is bool:
+        return b'n' + _ratio_bytes(item, 1)
+    if isinstance(item, (bytes, bytearray)):
+        return b'b' + item
+    if isinstance(item, Number):
+        if isinstance(item, Complex) and not isinstance(item, Real):
+            if item.imag:
+                return b'c' + _canonical(item.real) + b',' + _canonical(item.imag)
+            item = item.real
+        if isinstance(item, Rational):
+            return b'n' + _ratio_bytes(item.numerator, item.denominator)
+        try:
+            return b'n' + _ratio_bytes(*item.as_integer_ratio())  # type: ignore
+        except (AttributeError, OverflowError, ValueError):
+            # Infinities and NaNs
+            return b'f' + repr(float(item)).encode()  # type: ignore
+    if item is None:
+        return b'N'
+    if isinstance(item, (tuple, list)):
+        tag = b't' if isinstance(item, tuple) else b'l'
+        return tag + b''.join(_framed(element) for element in item)
+    if isinstance(item, (set, frozenset)):
+        return b'S' + b''.join(sorted(map(_framed, item)))
+    return b'r' + repr(item).encode('utf-8', 'surrogatepass')
+
+
+def _framed(item: Any) -> bytes:
+    """Length-prefixed canonical encoding of an element of a container."""
+    encoded = _canonical(item)
+    return b'%x:' % len(encoded) + encoded
+
+
+def stable_hash(item: Any) -> int:
+    """
+    64-bit hash of the 'item' that does not depend on the process (unlike the built-in ``hash`` of strings),
+    so that the sketches built in different processes can be merged. Equal values hash equally:
+    strings and bytes are hashed by their contents, numbers (``1``, ``1.0``, ``True``, ``Fraction(1)``) -
+    by their exact values, tuples, lists, sets and frozensets - by their elements, sets regardless of their order.
+    Objects of other types are hashed by their ``repr``, so their hashes agree across processes
+    only if their ``repr`` does (unlike the default one showing the address).
+
+    >>> stable_hash('abc') == stable_hash('abc') != stable_hash(b'abc')
+    True
+    >>> stable_hash(1) == stable_hash(1.0) == stable_hash(True) != stable_hash(1.5)
+    True
+
+    Args:
+        item:  object to hash
+    Returns:
+        unsigned 64-bit integer
+    """
+    return int.from_bytes(blake2b(_canonical(item), digest_size=8).digest(), 'little')
+
+
+class HyperLogLog(metaclass=ChainedMeta):
+    """Mergeable HyperLogLog sketch estimating the number of distinct elements in 2 ** precision bytes."""
+
+    __slots__ = ('_precision', '_registers')
+
+    def __init__(self, precision: int = 14) -> None:
+        """
+        Mergeable HyperLogLog sketch. The relative standard error is about ``1.04 / sqrt(2 ** precision)``:
+        0.8% for the default precision taking 16 KB.
+
+        >>> sketch = HyperLogLog(12)
+        >>> sketch.update(i % 50_000 for i in range(200_000))
+        >>> abs(sketch.estimate() - 50_000) < 50_000 * 0.05
+        True
+
+        Args:
+            precision:  number of hash bits selecting a register, from 4 to 18
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError(f'Precision should be from 4 to 18. Got: {precision}')
+        self._precision: Final = precision
+        self._registers = bytearray(1 << precision)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(precision={self._precision}, estimate={self.estimate()})'
+
+    @property
+    def precision(self) -> int:
+        """Number of hash bits selecting a register."""
+        return self._precision
+
+    def add(self, item: Any) -> None:
+        """
+        Args:
+            item:  element to account for
+        """
+        precision = self._precision
+        hashed = stable_hash(item)
+        rest = hashed & ((1 << (64 - precision)) - 1)
+        rank = 64 - precision - rest.bit_length() + 1
+        index = hashed >> (64 - precision)
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def estimate(self) -> int:
+        """
+        Returns:
+            estimated number of distinct elements
+        """
+        registers = self._registers
+        size = len(registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(size, 0.7213 / (1 + 1.079 / size))
+        raw = alpha * size * size / sum(map(_INVERSE_POWERS.__getitem__, registers))
+        zeros = registers.count(0)
+        if raw <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return round(size * log(size / zeros))
+        return round(raw)
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """
+        Merges the sketch of other elements into the 'self', so that it estimates the cardinality of the union.
+
+        >>> left, right = HyperLogLog(10), HyperLogLog(10)
+        >>> left.update(range(0, 600))
+        >>> right.update(range(300, 900))
+        >>> left.merge(right)
+        >>> abs(left.estimate() - 900) < 900 * 0.1
+        True
+
+        Args:
+            other:  sketch of the same precision
+        """
+        if other._precision != self._precision:
+            raise ValueError(f'Cannot merge sketches of precisions {self._precision} and {other._precision}')
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        """
+        Args:
+            iterable:  elements to account for
+        """
+        precision = self._precision
+        registers = self._registers
+        shift = 64 - precision
+        mask = (1 << shift) - 1
+        for hashed in map(stable_hash, iterable):
+            rank = shift - (hashed & mask).bit_length() + 1
+            index = hashed >> shift
+            if rank > registers[index]:
+                registers[index] = rank
+
+
+class SpaceSaving(metaclass=ChainedMeta):
+    """Mergeable Space-Saving summary of the most frequent elements with a bounded number of counters."""
+
+    __slots__ = ('_capacity', '_counts', '_errors', '_heap', '_order', '_total')
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Mergeable Space-Saving summary keeping at most 'capacity' counters.
+        Every element occurring more than ``total / capacity`` times is guaranteed to be counted,
+        and every count is overestimated by at most ``total / capacity``.
+
+        >>> summary = SpaceSaving(3)
+        >>> summary.update('abracadabra')
+        >>> summary.top(2)
+        [('a', 5), ('b', 3)]
+
+        Args:
+            capacity:  maximum number of counters
+        """
+        if capacity < 1:
+            raise ValueError(f'Capacity should be positive. Got: {capacity}')
+        self._capacity: Final = capacity
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        # Min-heap of (count, order number, element) entries, one per counted element.
+        # Entries are refreshed lazily: a popped entry with an outdated count is pushed back
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        # Number of the entries pushed to the heap: order numbers break the ties of the counts
+        self._order = 0
+        self._total = 0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(capacity={self._capacity}, total={self._total}, top={self.top(3)})'
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of counters."""
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """Number of elements accounted for."""
+        return self._total
+
+    def _entry(self, value: int, item: Hashable) -> Tuple[int, int, Hashable]:
+        self._order += 1
+        return value, self._order, item
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [self._entry(value, item) for item, value in self._counts.items()]
+        heapify(self._heap)
+
+    def add(self, item: Hashable) -> None:
+        """
+        Args:
+            item:  element to account for
+        """
+        self._total += 1
+        counts = self._counts
+        if item in counts:
+            counts[item] += 1
+            return
+        if len(counts) < self._capacity:
+            counts[item] = 1
+            self._errors[item] = 0
+            heappush(self._heap, self._entry(1, item))
+            return
+        heap = self._heap
+        while True:
+            value, _, evicted = heap[0]
+            if counts[evicted] == value:
+                break
+            heapreplace(heap, self._entry(counts[evicted], evicted))
+        # The new element takes over the counter of the least frequent one
+        del counts[evicted], self._errors[evicted]
+        counts[item] = value + 1
+        self._errors[item] = value
+        heapreplace(heap, self._entry(value + 1, item))
+
+    def error(self, item: Hashable) -> int:
+        """
+        Args:
+            item:  counted element
+        Returns:
+            maximum overestimation of the count of the 'item'
+        """
+        return self._errors[item]
+
+    def merge(self, other: 'SpaceSaving') -> None:
+        """
+        Merges the summary of other elements into the 'self'. Elements missing in a full summary are assumed
+        to occur as many times as its smallest counter, so the guarantees hold for the union.
+
+        >>> left, right = SpaceSaving(2), SpaceSaving(2)
+        >>> left.update('aaab')
+        >>> right.update('aacc')
+        >>> left.merge(right)
+        >>> left.top(1)
+        [('a', 5)]
+
+        Args:
+            other:  summary of the same capacity
+        """
+        if other._capacity != self._capacity:
+            raise ValueError(f'Cannot merge summaries of capacities {self._capacity} and {other._capacity}')
+
+        def floor(summary: SpaceSaving) -> int:
+            return min(summary._counts.values()) if len(summary._counts) == summary._capacity else 0
+
+        own_floor, other_floor = floor(self), floor(other)
+        merged = []
+        for item in self._counts.keys() | other._counts.keys():
+            value = self._counts.get(item, own_floor) + other._counts.get(item, other_floor)
+            error = self._errors.get(item, own_floor) + other._errors.get(item, other_floor)
+            merged.append((value, error, item))
+        merged.sort(key=lambda entry: entry[0], reverse=True)
+        del merged[self._capacity:]
+        self._counts = {item: value for value, _, item in merged}
+        self._errors = {item: error for _, error, item in merged}
+        self._total += other._total
+        self._rebuild_heap()
+
+    def top(self, k: int) -> List[Tuple[Hashable, int]]:
+        """
+        Args:
+            k:  number of elements to select
+        Returns:
+            (element, estimated count) pairs of the 'k' most frequent elements in the descending order of the counts
+        """
+        return sorted(self._counts.items(), key=lambda pair: pair[1], reverse=True)[:max(k, 0)]
+
+    def update(self, iterable: Iterable[Hashable]) -> None:
+        """
+        Args:
+            iterable:  elements to account for
+        """
+        add = self.add
+        for item in iterable:
+            add(item)
+
+
+def capacity_for(epsilon: float) -> int:
+    """
+    >>> capacity_for(0.001)
+    1000
+
+    Args:
+        epsilon:  maximum overestimation of the counts relative to the number of elements
+    Returns:
+        number of counters of the Space-Saving summary guaranteeing the 'epsilon'
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError(f'Epsilon should be between 0 and 1. Got: {epsilon}')
+    return ceil(1 / epsilon)
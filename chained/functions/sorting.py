@@ -0,0 +1,73 @@
+from heapq import merge
+from itertools import islice
+from typing import Any, Callable, Generator, Iterable, List, Optional, Union
+
+from chained.functions.spill import SEGMENT_SIZE, SpillFile, estimate_size
+
+
+def _read_run(spill: SpillFile, offsets: List[int]) -> Generator[Any, None, None]:
+    """Loads the frames of a sorted run one by one."""
+    for offset in offsets:
+        yield from spill.read(offset)
+
+
+def _merge_runs(spill: SpillFile,
+                runs: List[List[int]],
+                last_run: List[Any],
+                key: Optional[Callable[[Any], Any]],
+                reverse: bool) -> Generator[Any, None, None]:
+    """Lazily merges the spilled runs followed by the last run kept in memory and removes the spill file afterwards."""
+    try:
+        yield from merge(*(_read_run(spill, offsets) for offsets in runs), last_run, key=key, reverse=reverse)
+    finally:
+        spill.close()
+
+
+def external_sort(iterable: Iterable[Any],
+                  key: Optional[Callable[[Any], Any]] = None,
+                  reverse: bool = False,
+                  memory_limit: Optional[int] = None,
+                  spill_dir: Optional[str] = None) -> Union[List[Any], Generator[Any, None, None]]:
+    """
+    Stably sorts the elements of the 'iterable', keeping approximately 'memory_limit' bytes of them in memory.
+    Whenever the limit is exceeded, the collected elements are sorted and spilled to a temporary file as a run.
+    The runs are k-way merged lazily while the result is iterated.
+
+    >>> external_sort([5, 3, 8, 1], reverse=True)
+    [8, 5, 3, 1]
+
+    >>> list(external_sort(range(3000, 0, -1), memory_limit=0))[:3]
+    [1, 2, 3]
+
+    Args:
+        iterable:      elements to sort. They should be picklable if they do not fit into the 'memory_limit'
+        key:           function computing the comparison key
+        reverse:       whether to sort in the descending order
+        memory_limit:  approximate memory budget in bytes (estimated shallowly). ``None`` means "unlimited"
+        spill_dir:     directory for the spill file. ``None`` means the default temporary directory
+    Returns:
+        sorted list if all the elements fit into the 'memory_limit'. Generator over the sorted elements - otherwise
+    """
+    if memory_limit is None:
+        return sorted(iterable, key=key, reverse=reverse)
+    iterator = iter(iterable)
+    spill = SpillFile(spill_dir)
+    runs: List[List[int]] = []
+    run: List[Any] = []
+    memory = 0
+    while True:
+        segment = list(islice(iterator, SEGMENT_SIZE))
+        if not segment:
+            break
+        run += segment
+        memory += estimate_size(segment)
+        if memory > memory_limit:
+            run.sort(key=key, reverse=reverse)
+            runs.append([spill.write(run[i:i + SEGMENT_SIZE]) for i in range(0, len(run), SEGMENT_SIZE)])
+            run = []
+            memory = 0
+    run.sort(key=key, reverse=reverse)
+    if not runs:
+        # Everything fits into the memory
+        return run
+    return _merge_runs(spill, runs, run, key, reverse)
@@ -0,0 +1,220 @@
+import pickle
+from itertools import islice
+from sys import getsizeof
+from tempfile import TemporaryFile
+from threading import Lock
+from typing import IO, Any, Final, Iterator, List, Optional, Union
+
+from chained.type_utils.meta import ChainedMeta
+
+# Number of elements stored, measured and spilled together
+SEGMENT_SIZE: Final = 1024
+
+
+def estimate_size(items: List[Any]) -> int:
+    """
+    Estimates the memory occupied by the list and (shallowly) by its elements.
+
+    >>> estimate_size([]) < estimate_size([1, 2, 3]) < estimate_size(['a' * 100, 2, 3])
+    True
+
+    Args:
+        items:  list to measure
+    Returns:
+        size in bytes
+    """
+    return getsizeof(items) + sum(map(getsizeof, items))
+
+
+class SpillFile(metaclass=ChainedMeta):
+    """Anonymous temporary file storing lists of picklable elements as separate frames. Not thread-safe."""
+
+    __slots__ = ('_directory', '_file')
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """
+        Anonymous temporary file storing lists as pickle frames. The file is created on the first write
+        and removed by the OS when it is closed or garbage collected.
+
+        >>> spill = SpillFile()
+        >>> first, second = spill.write([1, 2]), spill.write(['a'])
+        >>> spill.read(second), spill.read(first)
+        (['a'], [1, 2])
+
+        Args:
+            directory:  directory to create the file in. ``None`` means the default temporary directory
+        """
+        self._directory: Final = directory
+        self._file: Optional[IO[bytes]] = None
+
+    @property
+    def directory(self) -> Optional[str]:
+        """Directory to create the file in."""
+        return self._directory
+
+    def close(self) -> None:
+        """Closes and thereby removes the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read(self, offset: int) -> List[Any]:
+        """
+        Args:
+            offset:  offset of the frame returned by ``write``
+        Returns:
+            list stored in the frame
+        """
+        file = self._file
+        if file is None:
+            raise ValueError('Nothing has been spilled yet')
+        file.seek(offset)
+        return pickle.load(file)
+
+    def write(self, items: List[Any]) -> int:
+        """
+        Appends a frame to the file.
+
+        Args:
+            items:  list of picklable elements
+        Returns:
+            offset of the frame
+        """
+        if self._file is None:
+            self._file = TemporaryFile('w+b', dir=self._directory)
+        file = self._file
+        offset = file.seek(0, 2)
+        pickle.dump(items, file, pickle.HIGHEST_PROTOCOL)
+        return offset
+
+
+class ReplayCache(metaclass=ChainedMeta):
+    """
+    Re-iterable cache of the elements of an iterator recorded as they are consumed.
+    Old segments are spilled to disk when the memory budget is exceeded.
+    """
+
+    __slots__ = (
+        '_source',
+        '_max_memory',
+        '_read_ahead',
+        '_segments',
+        '_tail',
+        '_memory',
+        '_resident',
+        '_spill',
+        '_lock'
+    )
+
+    def __init__(self,
+                 source: Iterator[Any],
+                 max_memory: Optional[int] = None,
+                 spill_dir: Optional[str] = None,
+                 read_ahead: int = 1) -> None:
+        """
+        Re-iterable cache of the elements of the 'source'.
+        Each iteration replays the recorded elements and then continues consuming the 'source',
+        so several readers can be at different positions at the same time, also in different threads.
+        The 'source' is advanced by one reader at a time, and each of its elements is consumed once.
+        By default, a reader consumes one element at a time. Otherwise, it consumes up to 'read_ahead' elements
+        under a single lock acquisition, which is faster for cheap sources, but waits for all of them to arrive.
+
+        Elements are stored in segments of `SEGMENT_SIZE`. When the estimated size of the in-memory segments
+        exceeds 'max_memory', the oldest ones are pickled to a temporary file and loaded back one at a time on replay.
+
+        >>> cache = ReplayCache(iter(range(5)), max_memory=0)
+        >>> iterator = iter(cache)
+        >>> next(iterator), list(cache), next(iterator)
+        (0, [0, 1, 2, 3, 4], 1)
+
+        Args:
+            source:      iterator to cache
+            max_memory:  approximate memory budget of the cache in bytes. ``None`` means "unlimited"
+            spill_dir:   directory for the spill file. ``None`` means the default temporary directory
+            read_ahead:  maximum number of elements consumed from the 'source' at once
+        """
+        if read_ahead < 1:
+            raise ValueError(f'Read-ahead should be positive. Got: {read_ahead}')
+        self._source: Optional[Iterator[Any]] = source
+        self._max_memory: Final = max_memory
+        self._read_ahead: Final = read_ahead
+        # Full segments in the order of the elements: lists in memory or offsets of the spilled frames
+        self._segments: Final[List[Union[List[Any], int]]] = []
+        self._tail: List[Any] = []
+        self._memory = 0
+        # Index of the first segment kept in memory
+        self._resident = 0
+        self._spill: Final = SpillFile(spill_dir)
+        self._lock: Final = Lock()
+
+    def __iter__(self) -> Iterator[Any]:
+        position = 0
+        lock = self._lock
+        while True:
+            with lock:
+                chunk = self._chunk(position)
+            if not chunk:
+                return
+            yield from chunk
+            position += len(chunk)
+
+    def __repr__(self) -> str:
+        state = 'complete' if self._source is None else 'partial'
+        return f'{self.__class__.__name__}({self.recorded} elements recorded, {state})'
+
+    @property
+    def recorded(self) -> int:
+        """Number of the elements consumed from the source so far."""
+        return len(self._segments) * SEGMENT_SIZE + len(self._tail)
+
+    @property
+    def spilled(self) -> int:
+        """Number of the elements stored on disk."""
+        return self._resident * SEGMENT_SIZE
+
+    def _chunk(self, position: int) -> List[Any]:
+        """
+        Finds the recorded elements starting from the 'position', consuming up to 'read_ahead' elements
+        of the source if needed. Should be called under the lock.
+        """
+        index, offset = divmod(position, SEGMENT_SIZE)
+        if index < len(self._segments):
+            segment = self._segments[index]
+            if type(segment) is int:
+                segment = self._spill.read(segment)
+            return segment[offset:] if offset else segment
+        tail = self._tail
+        if offset < len(tail):
+            return tail[offset:]
+        if self._source is None:
+            return []
+        start = len(tail)
+        wanted = min(self._read_ahead, SEGMENT_SIZE - start)
+        # Elements consumed before an exception of the source stay recorded
+        tail += islice(self._source, wanted)
+        chunk = tail[start:]
+        if len(chunk) < wanted:
+            self._source = None
+        if len(tail) == SEGMENT_SIZE:
+            self._seal()
+        return chunk
+
+    def _seal(self) -> None:
+        """Moves the full tail to the segments and spills the oldest segments if the memory budget is exceeded."""
+        tail = self._tail
+        self._segments.append(tail)
+        self._tail = []
+        if self._max_memory is None:
+            return
+        self._memory += estimate_size(tail)
+        segments = self._segments
+        while self._memory > self._max_memory and self._resident < len(segments):
+            segment = segments[self._resident]
+            self._memory -= estimate_size(segment)  # type: ignore
+            segments[self._resident] = self._spill.write(segment)  # type: ignore
+            self._resident += 1
+
+    def close(self) -> None:
+        """Removes the spill file. The cache cannot be replayed after that if anything has been spilled."""
+        with self._lock:
+            self._spill.close()
@@ -0,0 +1,239 @@
+import csv
+from itertools import islice
+from json import JSONEncoder, loads
+from operator import itemgetter
+from os import PathLike, fspath
+from typing import Any, Callable, Dict, Final, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from chained.type_utils.meta import ChainedMeta
+
+# Default size of the read and write buffers of the files
+BUFFER_SIZE: Final = 1 << 20
+
+# Default number of records formatted before a single write call
+WRITE_BATCH: Final = 1024
+
+
+def _project(keys: Sequence[Any]) -> Callable[[Any], Tuple]:
+    """
+    Makes a function selecting the 'keys' of a record into a tuple.
+
+    >>> _project([2, 0])('abc'), _project(['a'])({'a': 1, 'b': 2})
+    (('c', 'a'), (1,))
+    """
+    if len(keys) == 1:
+        key, = keys
+        return lambda record: (record[key],)
+    return itemgetter(*keys)
+
+
+def _convert(converters: Sequence[Callable[[Any], Any]],
+             columns: Optional[Sequence[int]] = None) -> Callable[[Sequence], Tuple]:
+    """
+    Makes a function applying the 'converters' to the fields of a record in a single pass.
+    If 'columns' are specified, only their fields are selected and converted.
+    Otherwise, each record should have exactly one field per converter.
+
+    >>> _convert((int, float))(('1', '2')), _convert((float,), [1])(('1', '2'))
+    ((1, 2.0), (2.0,))
+
+    >>> _convert((int,))(('1', '2'))
+    Traceback (most recent call last):
+    ...
+    ValueError: Expected one field per type. Got: 2 fields, 1 types
+    """
+    if columns is None:
+        count = len(converters)
+
+        def convert_all(record: Sequence) -> Tuple:
+            if len(record) != count:
+                raise ValueError(f'Expected one field per type. Got: {len(record)} fields, {count} types')
+            return tuple([converter(field) for converter, field in zip(converters, record)])
+
+        return convert_all
+    pairs = tuple(zip(columns, converters))
+    if len(pairs) == 1:
+        (position, converter), = pairs
+        return lambda record: (converter(record[position]),)
+    return lambda record: tuple([converter(record[i]) for i, converter in pairs])
+
+
+class CsvRecords(metaclass=ChainedMeta):
+    """Re-iterable stream of the rows of a CSV file."""
+
+    __slots__ = ('_path', '_columns', '_types', '_header', '_encoding', '_buffer_size', '_fmtparams')
+
+    def __init__(self,
+                 path: Union[str, bytes, PathLike],
+                 columns: Optional[Sequence[Union[int, str]]] = None,
+                 types: Optional[Sequence[Callable[[str], Any]]] = None,
+                 header: bool = False,
+                 encoding: str = 'utf-8',
+                 buffer_size: int = BUFFER_SIZE,
+                 **fmtparams: Any) -> None:
+        """
+        Re-iterable stream of the rows of a CSV file.
+        Only one buffered row is kept in memory at a time, whatever the size of the file.
+
+        Args:
+            path:         path to the file
+            columns:      if specified, only these columns are selected: their positions or, if 'header' is set, names
+            types:        functions converting the fields of the selected columns, one per column.
+                          If no columns are selected, each row should have one field per type
+            header:       whether the first row contains column names. It is not yielded
+            encoding:     file encoding
+            buffer_size:  size of the read buffer in bytes
+            **fmtparams:  ``csv.reader`` formatting parameters: 'delimiter', 'quotechar', 'dialect', etc.
+        """
+        if buffer_size < 1:
+            raise ValueError(f'Buffer size should be positive. Got: {buffer_size}')
+        if columns is not None and types is not None and len(columns) != len(types):
+            raise ValueError(f'Expected one type per selected column. Got: {len(types)} types, {len(columns)} columns')
+        if columns is not None and not header and not all(type(column) is int for column in columns):
+            raise ValueError('Columns can be selected by names only if the file has a header')
+        self._path: Final = path
+        self._columns: Final = None if columns is None else tuple(columns)
+        self._types: Final = None if types is None else tuple(types)
+        self._header: Final = header
+        self._encoding: Final = encoding
+        self._buffer_size: Final = buffer_size
+        self._fmtparams: Final[Dict[str, Any]] = fmtparams
+
+    def __iter__(self) -> Iterator[Union[List[str], Tuple]]:
+        with open(fspath(self._path), newline='', encoding=self._encoding, buffering=self._buffer_size) as file:
+            rows: Iterator = csv.reader(file, **self._fmtparams)
+            columns = self._columns
+            if self._header:
+                names = next(rows, [])
+                if columns is not None:
+                    positions = {name: i for i, name in enumerate(names)}
+                    columns = tuple(column if type(column) is int else positions[column] for column in columns)
+            if self._types is not None:
+                rows = map(_convert(self._types, columns), rows)
+            elif columns is not None:
+                rows = map(_project(columns), rows)
+            yield from rows
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._path!r}, {self._columns!r})'
+
+    @property
+    def path(self) -> Union[str, bytes, PathLike]:
+        """Path to the file."""
+        return self._path
+
+
+class JsonLinesRecords(metaclass=ChainedMeta):
+    """Re-iterable stream of the values of a JSON Lines file."""
+
+    __slots__ = ('_path', '_fields', '_encoding', '_buffer_size')
+
+    def __init__(self,
+                 path: Union[str, bytes, PathLike],
+                 fields: Optional[Sequence[str]] = None,
+                 encoding: str = 'utf-8',
+                 buffer_size: int = BUFFER_SIZE) -> None:
+        """
+        Re-iterable stream of the values of a JSON Lines file. Blank lines are skipped.
+        Only one buffered line is kept in memory at a time, whatever the size of the file.
+
+        Args:
+            path:         path to the file
+            fields:       if specified, each value is an object, and only these fields are selected into a tuple
+            encoding:     file encoding
+            buffer_size:  size of the read buffer in bytes
+        """
+        if buffer_size < 1:
+            raise ValueError(f'Buffer size should be positive. Got: {buffer_size}')
+        self._path: Final = path
+        self._fields: Final = None if fields is None else tuple(fields)
+        self._encoding: Final = encoding
+        self._buffer_size: Final = buffer_size
+
+    def __iter__(self) -> Iterator[Any]:
+        with open(fspath(self._path), encoding=self._encoding, buffering=self._buffer_size) as file:
+            # Lines are stripped, filtered and parsed with no Python-level loop
+            values = map(loads, filter(None, map(str.strip, file)))
+            if self._fields is not None:
+                values = map(_project(self._fields), values)
+            yield from values
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._path!r}, {self._fields!r})'
+
+    @property
+    def path(self) -> Union[str, bytes, PathLike]:
+        """Path to the file."""
+        return self._path
+
+
+def write_csv(records: Iterable[Iterable[Any]],
+              path: Union[str, bytes, PathLike],
+              header: Optional[Sequence[str]] = None,
+              encoding: str = 'utf-8',
+              buffer_size: int = BUFFER_SIZE,
+              batch_size: int = WRITE_BATCH,
+              **fmtparams: Any) -> int:
+    """
+    Writes the 'records' to a CSV file as rows, 'batch_size' rows per ``writerows`` call.
+
+    Args:
+        records:      rows to write
+        path:         path to the file
+        header:       if specified, column names to write first
+        encoding:     file encoding
+        buffer_size:  size of the write buffer in bytes
+        batch_size:   number of rows passed to the writer at once
+        **fmtparams:  ``csv.writer`` formatting parameters
+    Returns:
+        number of rows written (excluding the header)
+    """
+    if batch_size < 1:
+        raise ValueError(f'Batch size should be positive. Got: {batch_size}')
+    written = 0
+    iterator = iter(records)
+    with open(fspath(path), 'w', newline='', encoding=encoding, buffering=buffer_size) as file:
+        writer = csv.writer(file, **fmtparams)
+        if header is not None:
+            writer.writerow(header)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return written
+            writer.writerows(batch)
+            written += len(batch)
+
+
+def write_jsonl(records: Iterable[Any],
+                path: Union[str, bytes, PathLike],
+                encoding: str = 'utf-8',
+                buffer_size: int = BUFFER_SIZE,
+                batch_size: int = WRITE_BATCH,
+                **dumps_kwargs: Any) -> int:
+    """
+    Writes the 'records' to a JSON Lines file, joining 'batch_size' encoded lines into a single write call.
+
+    Args:
+        records:         values to write
+        path:            path to the file
+        encoding:        file encoding
+        buffer_size:     size of the write buffer in bytes
+        batch_size:      number of lines joined before a write
+        **dumps_kwargs:  ``json.JSONEncoder`` parameters. Compact separators are used by default
+    Returns:
+        number of lines written
+    """
+    if batch_size < 1:
+        raise ValueError(f'Batch size should be positive. Got: {batch_size}')
+    dumps_kwargs.setdefault('separators', (',', ':'))
+    # One encoder for all the records instead of constructing one per ``json.dumps`` call
+    lines = map(JSONEncoder(**dumps_kwargs).encode, records)
+    written = 0
+    with open(fspath(path), 'w', encoding=encoding, buffering=buffer_size) as file:
+        while True:
+            batch = list(islice(lines, batch_size))
+            if not batch:
+                return written
+            batch.append('')
+            file.write('\n'.join(batch))
+            written += len(batch) - 1
@@ -0,0 +1,257 @@
+from itertools import islice
+from typing import Any, Final, Generator, Iterable, List, Optional, Sequence
+
+from chained.functions.fused import MAP, apply_stages
+from chained.functions.lambded import LambdaExpr, np
+
+_int64_bounds: Final = (-2 ** 63, 2 ** 63 - 1)
+
+# Magnitude below which the integer results are proven to fit into int64, with a margin for the float rounding
+_SAFE_MAGNITUDE: Final = 2.0 ** 62
+
+
+# Magnitude of the integers that are exactly representable by floats
+_EXACT_FLOAT_INTEGER: Final = 2.0 ** 53
+
+
+class _Unprovable(Exception):
+    """The expression may evaluate differently over NumPy arrays and over Python scalars."""
+
+
+class _Magnitude:
+    """
+    Upper bound of the absolute values of an array, propagated through the operators of an expression
+    to prove that NumPy evaluates it as Python would: without the int64 overflow and without boolean arithmetic.
+    The bound of a floating point array is ``None``: its overflow is detected by ``np.errstate`` instead.
+    """
+
+    __slots__ = ('bound', 'boolean')
+    __hash__ = None  # type: ignore
+
+    def __init__(self, bound: Optional[float], boolean: bool = False) -> None:
+        if bound is not None and bound >= _SAFE_MAGNITUDE:
+            raise _Unprovable
+        self.bound: Final = bound
+        self.boolean: Final = boolean
+
+    def __bool__(self) -> bool:
+        raise _Unprovable
+
+    def _combine(self, other: Any, bound: Any, logical: bool = False) -> '_Magnitude':
+        """Applies the 'bound' function to the bounds of the integer operands. 'logical' operators keep booleans."""
+        if not isinstance(other, _Magnitude):
+            if isinstance(other, bool) or not isinstance(other, (int, float)):
+                raise _Unprovable
+            other = _Magnitude(float(abs(other)) if isinstance(other, int) else None)
+        if self.boolean and other.boolean:
+            if not logical:
+                # NumPy adds booleans as the logical "or", Python adds them as integers
+                raise _Unprovable
+            return _Magnitude(1.0, True)
+        if self.bound is None or other.bound is None:
+            return _Magnitude(None)
+        return _Magnitude(bound(self.bound, other.bound))
+
+    def _compare(self, other: Any) -> '_Magnitude':
+        self._combine(other, max)
+        return _Magnitude(1.0, True)
+
+    def _unary(self, bound: float) -> '_Magnitude':
+        if self.boolean:
+            # E.g. ``~`` is the logical "not" of NumPy booleans but the bitwise inversion of Python ones
+            raise _Unprovable
+        return _Magnitude(None if self.bound is None else bound)
+
+    def __add__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: a + b)
+
+    def __sub__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: a + b)
+
+    def __mul__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: a * b)
+
+    def __truediv__(self, other: Any) -> '_Magnitude':
+        # NumPy rounds the integers to floats before the division, Python divides them exactly
+        if (self._combine(other, max).bound or 0.0) > _EXACT_FLOAT_INTEGER:
+            raise _Unprovable
+        return _Magnitude(None)
+
+    def __floordiv__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: max(a, 1.0))
+
+    def __mod__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: b)
+
+    def __pow__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, _power_bound)
+
+    def __lshift__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: a * _power_bound(2.0, b))
+
+    def __rshift__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: a)
+
+    def __and__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: 2 * max(a, b) + 1, True)
+
+    __or__ = __xor__ = __and__
+
+    def __radd__(self, other: Any) -> '_Magnitude':
+        return self.__add__(other)
+
+    def __rsub__(self, other: Any) -> '_Magnitude':
+        return self.__sub__(other)
+
+    def __rmul__(self, other: Any) -> '_Magnitude':
+        return self.__mul__(other)
+
+    def __rtruediv__(self, other: Any) -> '_Magnitude':
+        return self.__truediv__(other)
+
+    def __rfloordiv__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: max(b, 1.0))
+
+    def __rmod__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: a)
+
+    def __rpow__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: _power_bound(b, a))
+
+    def __rlshift__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: b * _power_bound(2.0, a))
+
+    def __rrshift__(self, other: Any) -> '_Magnitude':
+        return self._combine(other, lambda a, b: b)
+
+    __rand__ = __ror__ = __rxor__ = __and__
+
+    def __eq__(self, other: Any) -> '_Magnitude':  # type: ignore
+        return self._compare(other)
+
+    __ne__ = __lt__ = __gt__ = __le__ = __ge__ = __eq__  # type: ignore
+
+    def __pos__(self) -> '_Magnitude':
+        return self._unary(self.bound)  # type: ignore
+
+    __neg__ = __abs__ = __pos__
+
+    def __invert__(self) -> '_Magnitude':
+        return self._unary(self.bound + 1)  # type: ignore
+
+
+def _power_bound(base: float, exponent: float) -> float:
+    try:
+        return max(base, 1.0) ** exponent
+    except OverflowError:
+        return float('inf')
+
+
+def _is_provably_exact(functions: Sequence[LambdaExpr], array: Any) -> bool:
+    """
+    Checks whether NumPy evaluates the 'functions' over the 'array' exactly as Python evaluates them over its elements,
+    evaluating them over the bound of the absolute values of the elements instead of the elements.
+    """
+    if array.dtype.kind == 'i':
+        magnitude = _Magnitude(float(max(abs(int(array.min())), abs(int(array.max())))) if len(array) else 0.0)
+    else:
+        magnitude = _Magnitude(None)
+    try:
+        for func in functions:
+            magnitude = func.eval()(magnitude)
+    except _Unprovable:
+        return False
+    return isinstance(magnitude, _Magnitude)
+
+
+def _evaluate(functions: Sequence[LambdaExpr], vectorized: Sequence[Any], array: Any) -> Optional[List[Any]]:
+    """
+    Evaluates the 'functions' over the 'array' by NumPy if the result is provably the same as the Python one.
+    Floating point errors (overflows, invalid operations, divisions by zero) and NumPy errors are detected
+    during the evaluation.
+
+    Returns:
+        list of the resulting Python scalars or ``None`` if the elements should be evaluated by Python
+    """
+    if not _is_provably_exact(functions, array):
+        return None
+    try:
+        with np.errstate(all='raise'):
+            for func in vectorized:
+                array = func(array)
+    except (ArithmeticError, ValueError, TypeError):
+        return None
+    return array.tolist()
+
+
+def can_vectorize(functions: Sequence[Any]) -> bool:
+    """
+    Checks whether all the 'functions' are single-argument ``LambdaExpr`` instances that NumPy can evaluate at once.
+
+    >>> from chained.functions.lambded import x
+    >>> can_vectorize((x + 1, x * 2)) == (np is not None)
+    True
+
+    >>> can_vectorize((x + 1, str))
+    False
+
+    Args:
+        functions:  functions to check
+    Returns:
+        check result
+    """
+    return np is not None and all(
+        isinstance(func, LambdaExpr) and len(func._get_args()) == 1 and func._is_vectorizable()
+        for func in functions
+    )
+
+
+def vectorized_map(iterable: Iterable, functions: Sequence[LambdaExpr], batch_size: int) -> Generator:
+    """
+    Maps 'functions' over the 'iterable' batch-wise.
+    Batches consisting only of ``int`` or only of ``float`` values are evaluated over NumPy arrays
+    if the result is provably the same as the element-wise one: integer results are proven to fit into int64
+    by propagating the bound of the absolute values of the batch through the operators,
+    and NumPy floating point errors are raised rather than ignored.
+    Otherwise (and for the other batches) the elements are evaluated one by one.
+    A ``range`` is converted to arrays directly.
+
+    >>> from chained.functions.lambded import x
+    >>> list(vectorized_map(range(10 ** 5, 10 ** 5 + 2), (x * x * x * x, x ** -1), 2)) == [
+    ...     (10 ** 5) ** -4, (10 ** 5 + 1) ** -4
+    ... ]
+    True
+
+    Args:
+        iterable:    iterable to transform
+        functions:   vectorizable ``LambdaExpr`` instances, see ``can_vectorize``
+        batch_size:  number of elements evaluated at once
+    Returns:
+        generator over the Python scalars
+    """
+    if batch_size < 1:
+        raise ValueError(f'Batch size should be positive. Got: {batch_size}')
+    vectorized = tuple(func.vectorize() for func in functions)
+    stages = tuple((MAP, func) for func in functions)
+
+    if isinstance(iterable, range) and _int64_bounds[0] <= min(iterable.start, iterable.stop) \
+            and max(iterable.start, iterable.stop) <= _int64_bounds[1]:
+        # No boxed values to convert
+        for i in range(0, len(iterable), batch_size):
+            sub_range = iterable[i:i + batch_size]
+            array = np.arange(sub_range.start, sub_range.stop, sub_range.step, dtype=np.int64)
+            result = _evaluate(functions, vectorized, array)
+            yield from apply_stages(sub_range, stages) if result is None else result
+        return
+
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, batch_size)):
+        types = set(map(type, chunk))
+        if types == {int} or types == {float}:
+            array = np.asarray(chunk)
+            if array.dtype.kind in 'if':
+                result = _evaluate(functions, vectorized, array)
+                if result is not None:
+                    yield from result
+                    continue
+        yield from apply_stages(chunk, stages)
@@ -0,0 +1,94 @@
+from collections import abc
+from typing import Final, Iterator, Sequence, Union, overload
+
+from chained.type_utils.typevar import T_co
+
+
+def compose_ranges(outer: range, inner: range) -> range:
+    """
+    Composes two ranges of indices: the result selects the same elements as indexing by 'outer' after 'inner'.
+
+    >>> compose_ranges(range(10, 20, 2), range(4, 0, -2))
+    range(18, 13, -4)
+
+    Args:
+        outer:  range indexed by the 'inner' one
+        inner:  range of indices inside the 'outer' one
+    Returns:
+        resulting range
+    """
+    if not inner:
+        return range(0)
+    step = outer.step * inner.step
+    last = outer[inner[-1]]
+    return range(outer[inner[0]], last + (1 if step > 0 else -1), step)
+
+
+class SequenceView(abc.Sequence):
+    """Read-only view of a sequence through a ``range`` of its indices. Slicing it does not copy anything."""
+
+    __slots__ = ('_base', '_indices')
+
+    def __init__(self, base: Sequence[T_co], indices: range) -> None:
+        """
+        Read-only view of a sequence through a ``range`` of its indices.
+        The view refers to the elements by their indices, so it reflects the changes of the elements,
+        but it is invalidated by resizing the sequence: after the sequence shrinks, indexing and iterating
+        the view may raise ``IndexError``, and after elements are inserted or removed before the selected ones,
+        the view selects other elements.
+
+        >>> view = SequenceView([0, 10, 20, 30, 40], range(1, 5, 2))
+        >>> view
+        SequenceView([10, 30])
+
+        >>> view[::-1]
+        SequenceView([30, 10])
+
+        Args:
+            base:     viewed sequence
+            indices:  indices of the 'base' the view consists of
+        """
+        if isinstance(base, SequenceView):
+            # Views of views refer directly to the underlying sequence
+            indices = compose_ranges(base._indices, indices)
+            base = base._base
+        self._base: Final[Sequence[T_co]] = base
+        self._indices: Final[range] = indices
+
+    @overload
+    def __getitem__(self, item: int) -> T_co:
+        pass
+
+    @overload
+    def __getitem__(self, item: slice) -> 'SequenceView[T_co]':
+        pass
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[T_co, 'SequenceView[T_co]']:
+        if isinstance(item, slice):
+            view = SequenceView.__new__(SequenceView)
+            view._base = self._base  # type: ignore
+            view._indices = self._indices[item]  # type: ignore
+            return view
+        return self._base[self._indices[item]]
+
+    def __iter__(self) -> Iterator[T_co]:
+        return map(self._base.__getitem__, self._indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({list(self)})'
+
+    def __reversed__(self) -> Iterator[T_co]:
+        return map(self._base.__getitem__, reversed(self._indices))
+
+    @property
+    def base(self) -> Sequence[T_co]:
+        """Viewed sequence."""
+        return self._base
+
+    @property
+    def indices(self) -> range:
+        """Indices of the 'base' the view consists of."""
+        return self._indices
@@ -0,0 +1,249 @@
+from array import array
+from collections import abc, deque
+from itertools import chain, islice
+from math import fsum, sqrt
+from operator import ge, le
+from typing import Any, Final, Generator, Iterable, Iterator, List, Sequence, Tuple
+
+from chained.functions.batches import array_batches
+from chained.functions.lambded import np
+from chained.functions.views import SequenceView
+
+# Aggregates supported by ``rolling``
+ROLLING_AGGREGATES: Final = ('sum', 'mean', 'var', 'std', 'min', 'max')
+
+# Maximal number of window elements handled by NumPy at once
+_WINDOW_ELEMENTS: Final = 1 << 20
+
+# Minimal number of elements read ahead into the buffer of ``sliding_windows``
+_READ_AHEAD: Final = 1024
+
+
+def _check_window(size: int, step: int = 1) -> None:
+    if size < 1:
+        raise ValueError(f'Window size should be positive. Got: {size}')
+    if step < 1:
+        raise ValueError(f'Window step should be positive. Got: {step}')
+
+
+def _check_aggregate(size: int, agg: str, ddof: int) -> None:
+    _check_window(size)
+    if agg not in ROLLING_AGGREGATES:
+        raise ValueError(f'Unknown aggregate: {agg!r}. Supported ones: {ROLLING_AGGREGATES}')
+    if agg in ('var', 'std') and size <= ddof:
+        raise ValueError(f'Window size should exceed ddof. Got: {size} and {ddof}')
+
+
+def _exact_sum(values: Iterable[Any]) -> Any:
+    total = sum(values)
+    return fsum(values) if isinstance(total, float) else total
+
+
+def _buffered_windows(iterable: Iterable[Any], size: int, step: int) -> Generator[Sequence[Any], None, None]:
+    iterator = iter(iterable)
+    capacity = 2 * size + max(step, _READ_AHEAD)
+    buffer: List[Any] = []
+    start = 0
+    while True:
+        if start + size > len(buffer):
+            if start >= len(buffer):
+                # Skips the elements between the windows, if any
+                gap = start - len(buffer)
+                next(islice(iterator, gap, gap), None)
+                buffer, start = [], 0
+            elif start + size > capacity:
+                # The old buffer is left intact for the windows yielded before
+                buffer, start = buffer[start:], 0
+            buffer += islice(iterator, capacity - len(buffer))
+            if start + size > len(buffer):
+                return
+        yield SequenceView(buffer, range(start, start + size))
+        start += step
+
+
+def sliding_windows(iterable: Iterable[Any], size: int, step: int = 1) -> Iterator[Sequence[Any]]:
+    """
+    Iterates over the windows of 'size' consecutive elements of the 'iterable', starting every 'step' elements.
+    Incomplete windows at the end are not yielded. Windows are read-only `SequenceView` instances:
+    those of sequences are views of the sequence itself, those of other iterables are views of a buffer
+    that is only appended to and replaced by a new one when full, so that the windows stay valid
+    and only O(1) elements per window are copied on average.
+
+    >>> [list(window) for window in sliding_windows(iter(range(6)), 3, 2)]
+    [[0, 1, 2], [2, 3, 4]]
+    >>> next(sliding_windows(range(10 ** 12), 4, 10 ** 6))
+    SequenceView([0, 1, 2, 3])
+
+    Args:
+        iterable:  elements to split
+        size:      number of elements in a window
+        step:      distance between the starts of consecutive windows
+    Returns:
+        iterator over the windows
+    """
+    _check_window(size, step)
+    if isinstance(iterable, abc.Sequence):
+        starts = range(0, len(iterable) - size + 1, step)
+        return (SequenceView(iterable, range(start, start + size)) for start in starts)
+    return _buffered_windows(iterable, size, step)
+
+
+def _rolling_extremum(iterable: Iterable[Any], size: int, largest: bool) -> Generator[Any, None, None]:
+    """Keeps the candidates for the extremum in a monotonic deque, so that each element is handled O(1) times."""
+    dominates = ge if largest else le
+    # (position, value) pairs of the elements that may still become the extremum, the extremum first
+    candidates: deque = deque()
+    for position, value in enumerate(iterable):
+        while candidates and dominates(value, candidates[-1][1]):
+            candidates.pop()
+        candidates.append((position, value))
+        if candidates[0][0] <= position - size:
+            candidates.popleft()
+        if position >= size - 1:
+            yield candidates[0][1]
+
+
+def _rolling_moments(iterable: Iterable[Any], size: int, agg: str, ddof: int) -> Generator[Any, None, None]:
+    """
+    Updates the sum (or the mean and the sum of squared deviations) by the entering and the leaving elements.
+    Every 'size' windows the statistics are recomputed exactly from the window to discard the accumulated rounding.
+    """
+    iterator = iter(iterable)
+    window = deque(islice(iterator, size))
+    if len(window) < size:
+        return
+    spread = agg in ('var', 'std')
+
+    def result() -> Any:
+        if agg == 'sum':
+            return total
+        if agg == 'mean':
+            return total / size
+        var = max(m2, 0.0) / (size - ddof)
+        return sqrt(var) if agg == 'std' else var
+
+    def normalized() -> Tuple[Any, float, float]:
+        exact_total = _exact_sum(window)
+        exact_mean = exact_total / size
+        return exact_total, exact_mean, fsum([(value - exact_mean) ** 2 for value in window]) if spread else 0.0
+
+    total, mean, m2 = normalized()
+    yield result()
+    countdown = size
+    for value in iterator:
+        old = window.popleft()
+        window.append(value)
+        countdown -= 1
+        if not countdown:
+            countdown = size
+            total, mean, m2 = normalized()
+        else:
+            delta = value - old
+            total += delta
+            if spread:
+                new_mean = mean + delta / size
+                m2 += delta * (value - new_mean + old - mean)
+                mean = new_mean
+        yield result()
+
+
+def rolling(iterable: Iterable[Any], size: int, agg: str = 'sum', ddof: int = 0) -> Generator[Any, None, None]:
+    """
+    Computes the aggregate of every window of 'size' consecutive elements incrementally, in O(1) per element.
+    Sums, means and variances are updated by the entering and the leaving elements (variances by Welford's formulas)
+    and recomputed exactly every 'size' windows. Minima and maxima are tracked in a monotonic deque.
+
+    >>> list(rolling([1, 3, 2, 5, 4], 3, 'max'))
+    [3, 5, 5]
+    >>> list(rolling([1, 3, 2, 5, 4], 2, 'mean'))
+    [2.0, 2.5, 3.5, 4.5]
+
+    Args:
+        iterable:  real numbers
+        size:      number of elements in a window
+        agg:       aggregate from `ROLLING_AGGREGATES`
+        ddof:      delta degrees of freedom: the variance is divided by ``size - ddof``
+    Returns:
+        generator over the aggregates of the windows
+    """
+    _check_aggregate(size, agg, ddof)
+    if agg in ('min', 'max'):
+        return _rolling_extremum(iterable, size, agg == 'max')
+    return _rolling_moments(iterable, size, agg, ddof)
+
+
+def _rolling_array(data: Any, size: int, agg: str, ddof: int) -> Any:
+    """Vectorized aggregates of the windows of a NumPy array."""
+    if agg in ('min', 'max'):
+        # van Herk / Gil-Werman: prefix and suffix extrema within the blocks of 'size' elements
+        ufunc = np.maximum if agg == 'max' else np.minimum
+        padding = -len(data) % size
+        blocks = np.pad(data, (0, padding), mode='edge').reshape(-1, size)
+        prefix = ufunc.accumulate(blocks, axis=1).ravel()
+        suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+        count = len(data) - size + 1
+        return ufunc(suffix[:count], prefix[size - 1:size - 1 + count])
+    if agg in ('var', 'std'):
+        # Each window is centered on its own mean, the windows are processed in chunks to bound the memory
+        windows = np.lib.stride_tricks.sliding_window_view(data.astype(float, copy=False), size)
+        rows = max(_WINDOW_ELEMENTS // size, 1)
+        var = np.concatenate([windows[i:i + rows].var(axis=1, ddof=ddof) for i in range(0, len(windows), rows)])
+        return np.sqrt(var) if agg == 'std' else var
+    # Sums within the blocks of 'size' elements: a window is the suffix of a block and the prefix of the next one,
+    # so each partial sum covers at most 'size' elements, unlike the prefix sums over the whole batch
+    padding = -len(data) % size
+    blocks = np.pad(data, (0, padding)).reshape(-1, size)
+    prefix = np.cumsum(blocks, axis=1).ravel()
+    suffix = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    count = len(data) - size + 1
+    tails = prefix[size - 1:size - 1 + count].copy()
+    # Windows starting at the block boundaries are whole blocks and have no prefix in the next block
+    tails[::size] = 0
+    sums = suffix[:count] + tails
+    return sums if agg == 'sum' else sums / size
+
+
+def _rolling_numpy(batches: Iterable[Any], size: int, agg: str, ddof: int) -> Generator[Any, None, None]:
+    carry = None
+    for batch in batches:
+        data = np.concatenate((carry, batch)) if carry is not None and len(carry) else batch
+        carry = data[max(len(data) - size + 1, 0):] if size > 1 else None
+        if len(data) >= size:
+            yield _rolling_array(data, size, agg, ddof)
+
+
+def _rolling_batches(batches: Iterable[Any], size: int, agg: str, ddof: int) -> Generator[Any, None, None]:
+    iterator = iter(batches)
+    first = next(iterator, None)
+    if first is None:
+        return
+    iterator = chain((first,), iterator)
+    if np is not None and isinstance(first, np.ndarray):
+        yield from _rolling_numpy(iterator, size, agg, ddof)
+        return
+    typecode = first.typecode if agg in ('min', 'max') and isinstance(first, array) else 'd'
+    yield from array_batches(rolling(chain.from_iterable(iterator), size, agg, ddof), max(len(first), 1), typecode)
+
+
+def rolling_batches(batches: Iterable[Any], size: int, agg: str = 'sum', ddof: int = 0) -> Iterator[Any]:
+    """
+    Computes the aggregates of the windows of the elements of all the 'batches', yielding them in batches.
+    NumPy batches are aggregated by NumPy: the last ``size - 1`` elements of a batch are carried over to the next one.
+    Sums and means are computed from partial sums within blocks of 'size' elements in O(1) per element,
+    so that their rounding errors do not grow with the batch. Variances are computed window by window,
+    each window centered on its own mean, in O(size) per element.
+    Other batches are aggregated by ``rolling`` into ``array.array`` batches of the length of the first batch.
+
+    >>> tuple(rolling_batches((array('l', [1, 2, 3]), array('l', [4, 5])), 2, 'sum'))
+    (array('d', [3.0, 5.0, 7.0]), array('d', [9.0]))
+
+    Args:
+        batches:  ``array.array`` or NumPy arrays of real numbers
+        size:     number of elements in a window
+        agg:      aggregate from `ROLLING_AGGREGATES`
+        ddof:     delta degrees of freedom of the variance
+    Returns:
+        iterator over the batches of the aggregates
+    """
+    _check_aggregate(size, agg, ddof)
+    return _rolling_batches(batches, size, agg, ddof)
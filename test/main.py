@@ -1,9 +1,42 @@
 """
 Defines unit-tests for 'chained/__init__.py' that cannot be implemented inside docstrings.
 """
-from unittest import TestCase
+import gc
+import os
+import pickle
+import struct
+import subprocess
+import sys
+import tempfile
+import weakref
+from collections.abc import Reversible
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from itertools import count, islice, zip_longest
+from operator import itemgetter
+from statistics import pstdev, pvariance
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
 
-from chained import ChainIterable, seq
+from chained import (
+    ChainAsyncIterable,
+    ChainCount,
+    ChainIterable,
+    ChainIterator,
+    ChainLazySequence,
+    ChainMapping,
+    ChainPlan,
+    ChainRange,
+    ChainReversible,
+    ChainSequence,
+    ChainSet,
+    make_chain,
+    seq,
+    set_fusion
+)
+from chained.abc_solver import _resolved_abcs
+from chained.functions import files
+from chained.functions.lambded import LambdaCache, x, lambda_cache, np
 
 
 class ChIterable(TestCase):
@@ -15,6 +48,931 @@ class ChIterable(TestCase):
         )
 
 
+class Dispatch(TestCase):
+    def test_collect(self):
+        self.assertIsInstance(ChainIterable(range(3)).collect(list), ChainSequence)
+        self.assertIsInstance(ChainIterable(range(3)).collect(dict.fromkeys), ChainMapping)
+        self.assertIsInstance(ChainIterable(range(3)).collect(frozenset), ChainSet)
+        self.assertIsInstance(ChainIterable((3,)).collect(lambda it: range(*it)), ChainRange)
+
+    def test_non_iterable(self):
+        self.assertRaisesRegex(TypeError, 'non-iterable class', lambda: make_chain(3))
+        self.assertRaisesRegex(
+            TypeError,
+            'Cannot initialize an instance of `ChainSequence` ',
+            lambda: ChainSequence({1, 2})
+        )
+
+    def test_registration_invalidates_cache(self):
+        class Box:
+            def __init__(self, items):
+                self.items = items
+
+            def __iter__(self):
+                return iter(self.items)
+
+        self.assertIs(type(make_chain(Box([1]))), ChainIterable)
+        Reversible.register(Box)
+        Box.__reversed__ = lambda self: reversed(self.items)
+        self.assertIs(type(make_chain(Box([1]))), ChainReversible)
+
+    def test_builtins_survive_registration(self):
+        class Unrelated(Reversible):
+            pass
+
+        Unrelated.register(type('Virtual', (), {}))
+        self.assertIsNotNone(_resolved_abcs.get(list))
+        self.assertIn(dict, _resolved_abcs._data)
+
+    def test_dynamic_types_are_not_kept_alive(self):
+        cls = type('Temporary', (list,), {})
+        make_chain(cls())
+        ref = weakref.ref(cls)
+        del cls
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_sequence_views(self):
+        data = list(range(100))
+        chain = ChainSequence(data)
+        view = chain.skip(10).step_by(3).reverse().take(4)
+        self.assertEqual(list(view), data[10::3][::-1][:4])
+        self.assertIs(view.core.base, data)
+        self.assertEqual(chain.last_n(0).len(), 0)
+        self.assertIsNone(chain[100])
+        self.assertEqual(chain.nth(99), 99)
+        self.assertRaises(ValueError, lambda: chain.nth(-1))
+
+    def test_split_without_copy(self):
+        pieces = ChainSequence(list(range(7))).split(3, None).collect(list).core
+        self.assertEqual([list(piece) for piece in pieces], [[0, 1, 2], [3, 4], [5, 6]])
+
+    def test_mapping(self):
+        chain = ChainMapping({'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(chain.last_n(2).collect(list).core, ['b', 'c'])
+        self.assertIsNone(ChainMapping({}).last())
+        self.assertIn('a', chain)
+
+
+class RangeAlgebra(TestCase):
+    ranges = (range(0), range(7), range(-5, 20, 3), range(20, -5, -4), range(3, 4))
+
+    def test_reductions(self):
+        for rng in self.ranges:
+            chain = ChainRange(rng)
+            self.assertEqual(chain.sum(), sum(rng))
+            self.assertEqual(chain.min(), min(rng, default=None))
+            self.assertEqual(chain.max(), max(rng, default=None))
+            self.assertEqual(chain.mean(), sum(rng) / len(rng) if rng else None)
+            self.assertEqual(chain.max(key=lambda v: -v), min(rng, default=None))
+
+    def test_range_preserving_transforms(self):
+        for rng in self.ranges:
+            chain = ChainRange(rng)
+            for transformed, expected in (
+                    (chain.take(2), list(rng)[:2]),
+                    (chain.skip(2).step_by(2), list(rng)[2::2]),
+                    (chain.slice(1, 5, 3), list(rng)[1:5:3]),
+                    (chain.reverse(), list(rng)[::-1]),
+                    (chain.map(x * -3 + 2, x + 1), [v * -3 + 3 for v in rng]),
+                    (chain.filter(x % 4 == 1, x % 3 == 0), [v for v in rng if v % 4 == 1 and v % 3 == 0]),
+            ):
+                self.assertIsInstance(transformed, ChainRange)
+                self.assertEqual(list(transformed), expected)
+
+    def test_fallback(self):
+        self.assertEqual(ChainRange(5).map(x * 2, x * x).collect(list).core, [0, 4, 16, 36, 64])
+        self.assertEqual(ChainRange(6).filter(x % 2 == 0, x > 2).collect(list).core, [4])
+        self.assertEqual(ChainRange(6).filter(x % 2 == 7).len(), 0)
+
+
+class InfiniteProgression(TestCase):
+    def test_random_access(self):
+        chain = seq(0, 7, ...)
+        self.assertIsInstance(chain, ChainCount)
+        self.assertEqual(chain[10 ** 9], 7 * 10 ** 9)
+        self.assertIn(7 * 10 ** 9, chain)
+        self.assertNotIn(7 * 10 ** 9 + 1, chain)
+        self.assertNotIn(-7, chain)
+        self.assertEqual(chain.index(70), 10)
+        self.assertRaises(ValueError, lambda: chain.index(3))
+
+    def test_reiteration(self):
+        chain = seq(5, ...)
+        self.assertEqual(list(chain.take(3)), [5, 6, 7])
+        self.assertEqual(next(iter(chain)), 5)
+        self.assertEqual(chain.enumerate().nth(2), (2, 7))
+
+    def test_slicing(self):
+        chain = ChainCount(1, 3)
+        self.assertEqual(list(chain[4:10:2]), list(islice(count(1, 3), 4, 10, 2)))
+        self.assertEqual(list(chain.skip(2).step_by(3).take(2)), [7, 16])
+        self.assertRaises(ValueError, lambda: chain[-1:])
+        self.assertRaises(ValueError, lambda: chain.slice(-1))
+
+    def test_zero_step(self):
+        chain = ChainCount(4, 0)
+        self.assertIn(4, chain)
+        self.assertNotIn(5, chain)
+        self.assertEqual(chain.index(4), 0)
+        self.assertEqual(list(chain[1:4]), [4, 4, 4])
+        self.assertEqual(chain.map(x * 2)[10 ** 6], 8)
+
+    def test_transforms(self):
+        chain = ChainCount(3, 4)
+        self.assertEqual(list(chain.map(x * -1).take(3)), [-3, -7, -11])
+        self.assertEqual(list(chain.filter(x % 5 == 1).take(3)), [11, 31, 51])
+        self.assertEqual(list(chain.filter(x % 2 == 0)), [])
+        self.assertEqual(chain.map(x * x).nth(2), 121)
+
+
+class LazySequences(TestCase):
+    def test_geometric(self):
+        chain = seq(3, 6, 12, ...)
+        self.assertIsInstance(chain, ChainLazySequence)
+        self.assertEqual(chain[200], 3 * 2 ** 200)
+        self.assertEqual(list(chain.skip(2).step_by(2).take(3)), [12, 48, 192])
+        self.assertEqual(list(seq(9, 6, 4, ...).take(4)), [9, 6.0, 4.0, 9 * (2 / 3) ** 3])
+        self.assertEqual(list(seq(1, 10, 100, ..., last=1000)), [1, 10, 100, 1000])
+        self.assertEqual(list(seq(-1, -2, -4, ..., -20)), [-1, -2, -4, -8, -16])
+        self.assertEqual(list(seq(1, 3, 5, ..., 10)), [1, 3, 5, 7, 9])
+
+    def test_unbounded_geometric(self):
+        self.assertRaises(ValueError, lambda: seq(8, 4, 2, ..., -1))
+        self.assertRaises(ValueError, lambda: seq(1, -2, 4, ..., 100))
+
+    def test_recurrence(self):
+        fibonacci = seq(0, 1, ..., rule=lambda a, b: a + b)
+        expected = [0, 1]
+        for _ in range(10_000):
+            expected.append(expected[-1] + expected[-2])
+        self.assertEqual(fibonacci[10_000], expected[10_000])
+        self.assertEqual([fibonacci[i] for i in range(5_000, 5_010)], expected[5_000:5_010])
+        self.assertEqual(list(fibonacci.take(20)), expected[:20])
+        self.assertEqual(list(fibonacci.skip(30).take(3)), expected[30:33])
+        self.assertEqual(list(fibonacci.step_by(3).take(3)), expected[:9:3])
+        self.assertEqual(list(seq(1, ..., rule=lambda a: a * 2).take(4)), [1, 2, 4, 8])
+
+    def test_wrong_rule_signature(self):
+        self.assertRaises(IndexError, lambda: seq(1, 1, ..., 10, rule=max))
+        self.assertRaises(IndexError, lambda: seq(..., rule=max))
+        self.assertRaises(ValueError, lambda: seq(1, 1, rule=max))
+        self.assertRaises(ValueError, lambda: seq(1, 2, last=5))
+
+
+class ChPlan(TestCase):
+    def test_init(self):
+        self.assertRaisesRegex(
+            TypeError,
+            'Cannot initialize an instance of `ChainPlan` ',
+            lambda: ChainPlan(3)
+        )
+
+    def test_pushdown_into_sequence(self):
+        calls = []
+        plan = ChainIterable(list(range(1_000))).lazy().map(lambda x: calls.append(x) or x * 2).skip(500).take(3)
+        self.assertEqual(plan.collect(tuple).core, (1000, 1002, 1004))
+        self.assertEqual(calls, [500, 501, 502])
+
+    def test_no_pushdown_through_filter(self):
+        plan = ChainRange(20).lazy().filter(lambda x: x % 3 == 0).map(str).skip(2).step_by(2)
+        self.assertEqual(plan.collect(tuple).core, ('6', '12', '18'))
+        self.assertEqual(plan.collect(tuple).core, ('6', '12', '18'))
+
+    def test_invalid_slice(self):
+        self.assertRaises(ValueError, lambda: ChainRange(10).lazy().skip(-1))
+
+
+class Fusion(TestCase):
+    def tearDown(self):
+        set_fusion(True)
+
+    def test_fused_equals_unfused(self):
+        fused = ChainRange(-10, 10).lazy().map(x * 3, abs).filter(x % 2 == 1, None).skip(2).map(str).collect(list)
+        set_fusion(False)
+        unfused = ChainRange(-10, 10).lazy().map(x * 3, abs).filter(x % 2 == 1, None).skip(2).map(str).collect(list)
+        self.assertEqual(fused.core, unfused.core)
+
+    def test_inlined_lambda_expr_raises(self):
+        self.assertRaises(ZeroDivisionError, lambda: ChainRange(3).map(x ** -1).run())
+        self.assertEqual(ChainRange(3).filter_map(x ** -1, ZeroDivisionError).collect(tuple).core, (1.0, 0.5))
+
+
+class LambdaCompilationCache(TestCase):
+    def tearDown(self):
+        lambda_cache.resize(1024)
+
+    def test_equal_sources_are_compiled_once(self):
+        lambda_cache.clear()
+        functions = [(x * 2 + 1).eval() for _ in range(10)]
+        self.assertTrue(all(func is functions[0] for func in functions))
+        info = lambda_cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (9, 1, 1))
+
+    def test_disabled(self):
+        lambda_cache.resize(0)
+        self.assertEqual((x - 7).eval()(10), 3)
+        self.assertEqual(len(lambda_cache), 0)
+        self.assertRaises(ValueError, lambda: lambda_cache.resize(-1))
+        self.assertRaises(ValueError, lambda: LambdaCache(-1))
+
+    def test_fusion_does_not_touch_the_cache(self):
+        lambda_cache.clear()
+        ChainRange(5).lazy().map(x * 5 + 4).filter(x % 3 == 0).run()
+        self.assertEqual(lambda_cache.info(), (0, 0, 1024, 0))
+
+
+@skipUnless(np is not None, 'NumPy is not installed')
+class Vectorization(TestCase):
+    def test_vectorize(self):
+        self.assertEqual((abs(x * 2 - 5) >= 3).vectorize()(np.arange(6)).tolist(), [True, True, False, False, True, True])
+        self.assertEqual(x._if(x > 1)._else(-x).vectorize()(np.arange(3)).tolist(), [0, -1, 2])
+
+    def test_batched_map(self):
+        data = [1, 2.5, 3, 4, 5, 6, 7.25, 8, 'a']
+        expected = ChainIterable(data[:-1]).map(x * 2 + 1, x // 2).collect(list).core
+        self.assertEqual(ChainIterable(data[:-1]).map(x * 2 + 1, x // 2, batch_size=2).collect(list).core, expected)
+        self.assertEqual(
+            [type(value) for value in ChainRange(5).map(x * 2.0, batch_size=2)],
+            [float] * 5
+        )
+        self.assertRaises(TypeError, lambda: ChainIterable(data).map(x * 2 + 1, batch_size=4).run())
+
+    def test_python_semantics(self):
+        for func in (x * x * x * x, x ** -1, (x > 1) + (x > 2), ~(x > 1), x / 3, (x << 40) % 7, -x * 2.5):
+            sources = ChainRange(10 ** 5, 10 ** 5 + 3), ChainSequence([2 ** 60, 3, -7]), ChainSequence([0.5, 1e308])
+            for source in sources:
+                try:
+                    expected = source.map(func).collect(list).core
+                except TypeError:
+                    self.assertRaises(TypeError, source.map(func, batch_size=2).run)
+                    continue
+                self.assertEqual(source.map(func, batch_size=2).collect(list).core, expected)
+        self.assertRaises(ZeroDivisionError, lambda: ChainRange(3).map(x // (x * 0), batch_size=2).run())
+
+
+class Batches(TestCase):
+    def test_array_backend(self):
+        batches = ChainIterable(x for x in range(10)).batches(4, 'l')
+        result = batches.filter_batches(lambda v: v % 2).map_batches(lambda b: b[::-1]).unbatch().collect(list)
+        self.assertEqual(result.core, [3, 1, 7, 5, 9])
+
+    def test_reductions(self):
+        values = [3.5, -2.0, 7.25, 0.0, 1.0]
+        for size in (1, 2, 10):
+            self.assertEqual(ChainIterable(values).batches(size).sum(), sum(values))
+            self.assertEqual(ChainIterable(values).batches(size).min(), min(values))
+            self.assertEqual(ChainIterable(values).batches(size).max(), max(values))
+            self.assertEqual(ChainIterable(values).batches(size).mean(), sum(values) / len(values))
+        self.assertEqual(ChainIterable(()).batches(3).sum(), 0)
+        self.assertEqual(ChainIterable(()).batches(3).max(default=-1), -1)
+
+    def test_wrong_arguments(self):
+        self.assertRaises(ValueError, lambda: ChainIterable(range(3)).batches(0).collect(list))
+        self.assertRaises(ValueError, lambda: ChainIterable(range(3)).batches(2, backend='arrow'))
+
+    @skipUnless(np is not None, 'NumPy is not installed')
+    def test_numpy_backend(self):
+        for source in (range(10), list(range(10)), iter(range(10)), np.arange(10)):
+            batches = ChainIterable(source).batches(4, 'int64', backend='numpy').collect(list).core
+            self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+            self.assertTrue(all(batch.dtype == np.int64 for batch in batches))
+        chain = ChainIterable(range(10)).batches(3, backend='numpy')
+        self.assertEqual(chain.filter_batches(x > 4).map_batches(x * 2).sum(), 70.0)
+
+
+class MemoryMappedFile(TestCase):
+    def setUp(self):
+        with tempfile.NamedTemporaryFile('wb', delete=False) as file:
+            file.write(b''.join(b'line %d\n' % i for i in range(300_000)))
+        self.path = file.name
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_records(self):
+        chain = ChainIterable.from_mmap(self.path)
+        self.assertEqual(chain.len_eval(), 300_000)
+        self.assertEqual(chain.nth(123_456), b'line 123456')
+        self.assertEqual(chain.skip(250_000).take(2).collect(list).core, [b'line 250000', b'line 250001'])
+        self.assertEqual(chain.skip(299_999).skip(5).len_eval(), 0)
+        self.assertIsNone(chain.nth(300_000))
+
+    def test_decode_and_separator(self):
+        with open(self.path, 'wb') as file:
+            file.write('α||β||||γ'.encode())
+        chain = ChainIterable.from_mmap(self.path, b'||', 'utf-8')
+        self.assertEqual(chain.collect(list).core, ['α', 'β', '', 'γ'])
+        self.assertEqual(chain.slice(1, 4, 2).collect(list).core, ['β', 'γ'])
+
+    def test_long_records(self):
+        records = [b'a' * 3_000_000, b'', b'b' * 1_500_000, b'c']
+        with open(self.path, 'wb') as file:
+            file.write(b'\n'.join(records))
+        self.assertEqual(ChainIterable.from_mmap(self.path).collect(list).core, records)
+        self.assertEqual(ChainIterable.from_mmap(self.path).skip(1).take(2).collect(list).core, records[1:3])
+
+    def test_empty_file(self):
+        open(self.path, 'wb').close()
+        self.assertEqual(ChainIterable.from_mmap(self.path).collect(list).core, [])
+
+    def test_early_termination(self):
+        mappings, original = [], files.map_file
+
+        def map_file(path):
+            mappings.append(original(path))
+            return mappings[-1]
+
+        with patch.object(files, 'map_file', map_file):
+            self.assertEqual(ChainIterable.from_mmap(self.path).first(), b'line 0')
+            self.assertEqual(ChainIterable.from_mmap(self.path).nth(10), b'line 10')
+        self.assertEqual(len(mappings), 2)
+        self.assertTrue(all(mapping.closed for mapping in mappings))
+
+
+class StructFile(TestCase):
+    def setUp(self):
+        with tempfile.NamedTemporaryFile('wb', delete=False) as file:
+            for i in range(10_000):
+                file.write(struct.pack('<qdH', i, i / 4, i % 7))
+        self.path = file.name
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_random_access(self):
+        chain = ChainIterable.from_struct(self.path, '<qdH')
+        self.assertEqual(chain.len(), 10_000)
+        self.assertEqual(chain.nth(7_777), (7_777, 7_777 / 4, 7_777 % 7))
+        self.assertEqual(chain[-1], (9_999, 9_999 / 4, 9_999 % 7))
+        self.assertEqual(chain.skip(9_998).collect(list).core, [(i, i / 4, i % 7) for i in range(9_998, 10_000)])
+        self.assertEqual(chain.slice(10, 40, 10).map(itemgetter(0)).collect(list).core, [10, 20, 30])
+        self.assertEqual(chain.reverse().first(), (9_999, 9_999 / 4, 9_999 % 7))
+
+    def test_columns(self):
+        batches = ChainIterable.from_struct(self.path, '<qdH', batch=4_096).collect(list).core
+        self.assertEqual([len(ids) for ids, _, _ in batches], [4_096, 4_096, 1_808])
+        self.assertEqual(sum(sum(ids) for ids, _, _ in batches), sum(range(10_000)))
+
+    @skipUnless(np is not None, 'NumPy is not installed')
+    def test_numpy_columns(self):
+        chain = ChainIterable.from_struct(self.path, '<qdH', batch=3_000, backend='numpy')
+        ids, quarters, remainders = chain.nth(3)
+        self.assertEqual(ids.tolist(), list(range(9_000, 10_000)))
+        self.assertEqual(quarters[0], 2_250.0)
+        self.assertEqual(remainders.dtype, np.uint16)
+        self.assertRaises(ValueError, lambda: ChainIterable.from_struct(self.path, 'qdH', 10, backend='numpy').first())
+
+    def test_wrong_size(self):
+        self.assertRaises(ValueError, lambda: ChainIterable.from_struct(b'12345', '<i'))
+        self.assertEqual(ChainIterable.from_struct(b'', '<i').len(), 0)
+
+    def test_close(self):
+        with ChainIterable.from_struct(self.path, '<qdH') as chain:
+            mapping = weakref.ref(chain.core.buffer.obj)
+            tail = chain.skip(9_999)
+        self.assertRaises(ValueError, chain.len)
+        chain.close()
+        self.assertEqual(tail.first(), (9_999, 9_999 / 4, 9_999 % 7))
+        self.assertFalse(mapping().closed)
+        del tail
+        self.assertIsNone(mapping())
+
+        with ChainIterable.from_struct(self.path, '<qdH') as chain:
+            mapping = chain.core.buffer.obj
+        self.assertTrue(mapping.closed)
+
+    @skipUnless(np is not None, 'NumPy is not installed')
+    def test_close_with_numpy_columns(self):
+        with ChainIterable.from_struct(self.path, '<qdH') as chain:
+            ids, _, _ = chain.columns(10_000, backend='numpy').first()
+        self.assertEqual(int(ids[-1]), 9_999)
+
+    def test_close_buffer(self):
+        buffer = bytearray(8)
+        with ChainIterable.from_struct(buffer, '<i'):
+            pass
+        buffer.append(0)
+
+
+class TextFiles(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.csv = os.path.join(self.directory, 'table.csv')
+        self.jsonl = os.path.join(self.directory, 'table.jsonl')
+
+    def tearDown(self):
+        for path in (self.csv, self.jsonl):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(self.directory)
+
+    def test_csv_round_trip(self):
+        rows = ChainIterable(range(5_000)).map(lambda i: (i, f'name {i}', i / 2))
+        self.assertEqual(rows.to_csv(self.csv, ['id', 'name', 'half'], batch_size=7), 5_000)
+        chain = ChainIterable.read_csv(self.csv, header=True, buffer_size=4096)
+        self.assertEqual(chain.first(), ['0', 'name 0', '0.0'])
+        self.assertEqual(chain.len_eval(), 5_000)
+        projected = ChainIterable.read_csv(self.csv, ['half', 0], [float, int], header=True)
+        self.assertEqual(projected.last(), (2_499.5, 4_999))
+        self.assertEqual(ChainIterable.read_csv(self.csv, [1]).take(2).collect(list).core, [('name',), ('name 0',)])
+        converted = ChainIterable.read_csv(self.csv, types=[int, str, float], header=True)
+        self.assertEqual(converted.nth(3), (3, 'name 3', 1.5))
+        self.assertRaises(ValueError, lambda: ChainIterable.read_csv(self.csv, types=[int], header=True).first())
+
+    def test_csv_dialect(self):
+        ChainIterable([('a;b', 1), ('c', 2)]).to_csv(self.csv, delimiter=';')
+        self.assertEqual(ChainIterable.read_csv(self.csv, delimiter=';').collect(list).core, [['a;b', '1'], ['c', '2']])
+        self.assertRaises(ValueError, lambda: ChainIterable.read_csv(self.csv, ['a']))
+        self.assertRaises(ValueError, lambda: ChainIterable(()).to_csv(self.csv, batch_size=0))
+
+    def test_jsonl_round_trip(self):
+        values = ChainIterable(range(3_000)).map(lambda i: {'id': i, 'tags': ['t'] * (i % 3)})
+        self.assertEqual(values.to_jsonl(self.jsonl, batch_size=100), 3_000)
+        chain = ChainIterable.read_jsonl(self.jsonl)
+        self.assertEqual(chain.nth(2_999), {'id': 2_999, 'tags': ['t', 't']})
+        self.assertEqual(ChainIterable.read_jsonl(self.jsonl, ['tags', 'id']).nth(4), (['t'], 4))
+        self.assertEqual(ChainIterable(['é']).to_jsonl(self.jsonl, ensure_ascii=False), 1)
+        with open(self.jsonl, encoding='utf-8') as file:
+            self.assertEqual(file.read(), '"é"\n')
+
+
+class ReplayableCache(TestCase):
+    def test_replay(self):
+        consumed = []
+        cached = ChainIterable(range(5_000)).inspect(consumed.append).cache()
+        self.assertEqual(cached.len_eval(), 5_000)
+        self.assertEqual(cached.map(x * 2).sum(), 5_000 * 4_999)
+        self.assertEqual(cached.nth(4_321), 4_321)
+        self.assertEqual(consumed, list(range(5_000)))
+
+    def test_interleaved_readers(self):
+        cached = ChainIterable(iter(range(3_000))).cache()
+        first, second = iter(cached), iter(cached)
+        self.assertEqual(list(islice(first, 2_000)), list(range(2_000)))
+        self.assertEqual(list(zip(second, first)), list(zip(range(1_000), range(2_000, 3_000))))
+        self.assertEqual(list(second), list(range(1_001, 3_000)))
+
+    def test_spill(self):
+        directory = tempfile.mkdtemp()
+        cached = ChainIterable(range(10_000)).map(lambda i: f'value {i}').cache(max_memory=50_000, spill_dir=directory)
+        self.assertEqual(cached.collect(list).core, [f'value {i}' for i in range(10_000)])
+        self.assertGreater(cached.core.spilled, 0)
+        self.assertEqual(cached.core.recorded, 10_000)
+        self.assertEqual(cached.skip(9_998).collect(list).core, ['value 9998', 'value 9999'])
+        cached.core.close()
+        os.rmdir(directory)
+
+    def test_failing_source(self):
+        def source():
+            yield from range(1_500)
+            raise KeyError('source')
+
+        cached = ChainIterable(source()).cache()
+        self.assertRaises(KeyError, lambda: cached.collect(list))
+        self.assertEqual(cached.core.recorded, 1_500)
+        self.assertEqual(cached.collect(list).core, list(range(1_500)))
+
+    def test_read_ahead(self):
+        consumed = []
+        cached = ChainIterable(count()).inspect(consumed.append).cache()
+        self.assertEqual(cached.first(), 0)
+        self.assertEqual(consumed, [0])
+        batched = ChainIterable(range(3_000)).inspect(consumed.append).cache(read_ahead=100)
+        self.assertEqual(batched.nth(150), 150)
+        self.assertEqual(len(consumed), 201)
+        self.assertEqual(batched.collect(list).core, list(range(3_000)))
+        self.assertRaises(ValueError, lambda: ChainIterable(()).cache(read_ahead=0))
+
+    def test_concurrent_readers(self):
+        cached = ChainIterable(range(20_000)).cache(max_memory=100_000, read_ahead=300)
+        with ThreadPoolExecutor(4) as pool:
+            sums = list(pool.map(lambda _: sum(cached), range(8)))
+        self.assertEqual(sums, [sum(range(20_000))] * 8)
+
+
+class ExternalSort(TestCase):
+    def test_in_memory(self):
+        self.assertEqual(ChainIterable(iter([3, 1, 2])).sort().core, [1, 2, 3])
+        self.assertEqual(ChainIterable(range(10)).sort(key=lambda i: i % 3, memory_limit=1 << 20).core,
+                         [0, 3, 6, 9, 1, 4, 7, 2, 5, 8])
+
+    def test_spilled(self):
+        directory = tempfile.mkdtemp()
+        values = [(i * 7_919) % 50_000 for i in range(50_000)]
+        chain = ChainIterable(values).map(lambda v: (v % 100, v)).sort(memory_limit=200_000, spill_dir=directory)
+        self.assertIsInstance(chain, ChainIterator)
+        self.assertEqual(chain.collect(list).core, sorted((v % 100, v) for v in values))
+        self.assertEqual(os.listdir(directory), [])
+        os.rmdir(directory)
+
+    def test_stable_reverse(self):
+        pairs = [(i % 5, i) for i in range(20_000)]
+        result = ChainIterable(pairs).sort(key=itemgetter(0), reverse=True, memory_limit=50_000).collect(list).core
+        self.assertEqual(result, sorted(pairs, key=itemgetter(0), reverse=True))
+
+
+class SinglePassAggregate(TestCase):
+    def test_single_pass(self):
+        consumed = []
+        stats = ChainIterable(range(10_000)).inspect(consumed.append).aggregate(count=True, sum=True, min=True, max=True)
+        self.assertEqual(stats, {'count': 10_000, 'sum': 49_995_000, 'min': 0, 'max': 9_999})
+        self.assertEqual(len(consumed), 10_000)
+
+    def test_stability(self):
+        values = [1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16] * 5_000
+        stats = ChainIterable(values).aggregate(mean=True, var=True, std=True, ddof=1)
+        self.assertAlmostEqual(stats['mean'], 1e9 + 10)
+        self.assertAlmostEqual(stats['var'], 22.5 * 20_000 / 19_999)
+        self.assertAlmostEqual(stats['std'] ** 2, stats['var'])
+        self.assertEqual(ChainIterable([0.1] * 10).aggregate(sum=True), {'sum': 1.0})
+
+    def test_all_and_empty(self):
+        self.assertEqual(tuple(ChainIterable([2, 4]).aggregate()), ('count', 'sum', 'mean', 'var', 'std', 'min', 'max'))
+        self.assertEqual(ChainIterable([5]).aggregate(var=True, ddof=1), {'var': None})
+        self.assertEqual(ChainIterable(()).aggregate(min=True, sum=True), {'sum': 0, 'min': None})
+
+    def test_batches(self):
+        stats = ChainIterable(range(1, 1_001)).batches(64).aggregate(mean=True, var=True, max=True)
+        self.assertEqual(stats, {'mean': 500.5, 'var': 83_333.25, 'max': 1_000.0})
+
+    @skipUnless(np is not None, 'NumPy is not installed')
+    def test_numpy_batches(self):
+        stats = ChainIterable(range(1, 1_001)).batches(100, backend='numpy').aggregate(sum=True, var=True, min=True)
+        self.assertEqual(stats, {'sum': 500_500.0, 'var': 83_333.25, 'min': 1.0})
+
+
+class TopK(TestCase):
+    def test_heap_selection(self):
+        scores = [(i * 7_919) % 10_007 for i in range(50_000)]
+        self.assertEqual(ChainIterable(scores).top_k(100).core, sorted(scores, reverse=True)[:100])
+        self.assertEqual(ChainIterable(iter(scores)).bottom_k(10).core, sorted(scores)[:10])
+        self.assertEqual(ChainIterable(range(5)).top_k(10).core, [4, 3, 2, 1, 0])
+        self.assertEqual(ChainIterable(range(5)).top_k(0).core, [])
+
+    def test_by_key(self):
+        players = [('ann', 5), ('bob', 9), ('cid', 9), ('dan', 1)]
+        self.assertEqual(ChainIterable(players).top_k(2, key=itemgetter(1)).core, [('bob', 9), ('cid', 9)])
+        self.assertEqual(ChainIterable(players).max_by(itemgetter(1)), ('bob', 9))
+        self.assertEqual(ChainIterable(players).min_by(itemgetter(1)), ('dan', 1))
+        self.assertEqual(ChainIterable(()).max_by(itemgetter(1), default=0), 0)
+
+    def test_running(self):
+        updates = ChainIterable((5, 3, 5, 8, 1, 6)).running_top_k(3).collect(list).core
+        self.assertEqual(updates, [[5], [5, 3], [5, 5, 3], [8, 5, 5], [8, 6, 5]])
+        pairs = [('a', 1), ('b', 1), ('c', 2)]
+        self.assertEqual(ChainIterable(pairs).running_top_k(1, key=itemgetter(1)).collect(list).core,
+                         [[('a', 1)], [('c', 2)]])
+
+    def test_batches(self):
+        values = [(i * 31) % 1_009 for i in range(5_000)]
+        batches = ChainIterable(values).batches(256, 'l')
+        self.assertEqual(batches.top_k(5).core, sorted(values, reverse=True)[:5])
+        self.assertEqual(ChainIterable(values).batches(256).bottom_k(3, key=lambda v: -v).core, [1_008.0] * 3)
+
+    @skipUnless(np is not None, 'NumPy is not installed')
+    def test_numpy_batches(self):
+        values = [(i * 31) % 1_009 for i in range(5_000)]
+        self.assertEqual(ChainIterable(values).batches(300, 'l', backend='numpy').top_k(7).core,
+                         sorted(values, reverse=True)[:7])
+        self.assertEqual(ChainIterable(values).batches(300, backend='numpy').bottom_k(6).core, [0.0] * 5 + [1.0])
+        self.assertEqual(ChainIterable(range(3)).batches(2, backend='numpy').top_k(5).core, [2.0, 1.0, 0.0])
+
+
+class Sketches(TestCase):
+    def test_approx_distinct(self):
+        estimate = ChainIterable(range(300_000)).map(lambda i: f'user-{i % 120_000}').approx_distinct()
+        self.assertLess(abs(estimate - 120_000), 120_000 * 0.03)
+        self.assertEqual(ChainIterable(()).approx_distinct(4), 0)
+        self.assertRaises(ValueError, lambda: ChainIterable(()).approx_distinct(3))
+
+    def test_equal_values(self):
+        self.assertEqual(ChainIterable([1, 1.0, True, Fraction(1), (1, 'a'), (1.0, 'a')]).approx_distinct(), 2)
+        code = "from chained.functions.sketches import stable_hash; print(stable_hash((frozenset('abcde'), 0.5, 'x')))"
+        environment = {**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}
+        hashes = {
+            subprocess.run([sys.executable, '-c', code], env={**environment, 'PYTHONHASHSEED': seed},
+                           capture_output=True, check=True, text=True).stdout
+            for seed in ('1', '2')
+        }
+        self.assertEqual(len(hashes), 1)
+
+    def test_distinct_shards(self):
+        shards = [ChainIterable(range(i * 40_000, i * 40_000 + 60_000)).approx_distinct(12, sketch=True)
+                  for i in range(3)]
+        merged = pickle.loads(pickle.dumps(shards[0]))
+        for shard in shards[1:]:
+            merged.merge(pickle.loads(pickle.dumps(shard)))
+        self.assertLess(abs(merged.estimate() - 140_000), 140_000 * 0.05)
+        self.assertRaises(ValueError, lambda: merged.merge(ChainIterable(()).approx_distinct(10, sketch=True)))
+
+    def test_heavy_hitters(self):
+        # Element 'i' occurs 20_000 // (i + 1) times
+        stream = [i for i in range(2_000) for _ in range(20_000 // (i + 1))]
+        shuffled = ChainIterable(range(len(stream))).map(lambda j: stream[j * 7_919 % len(stream)])
+        top = shuffled.heavy_hitters(5, epsilon=0.001).core
+        self.assertEqual([item for item, _ in top], [0, 1, 2, 3, 4])
+        for item, estimate in top:
+            self.assertGreaterEqual(estimate, 20_000 // (item + 1))
+            self.assertLessEqual(estimate, 20_000 // (item + 1) + 0.001 * len(stream))
+
+    def test_heavy_hitter_shards(self):
+        left = ChainIterable('aaaabbbcd' * 100).heavy_hitters(2, epsilon=0.34, sketch=True)
+        right = pickle.loads(pickle.dumps(ChainIterable('ccccccbd' * 100).heavy_hitters(2, epsilon=0.34, sketch=True)))
+        left.merge(right)
+        self.assertEqual(left.total, 1_700)
+        self.assertEqual([item for item, _ in left.top(2)], ['c', 'a'])
+        self.assertLessEqual(left.top(1)[0][1] - 700, left.error('c'))
+
+
+class Quantiles(TestCase):
+    def setUp(self):
+        # Pseudo-random permutation of 0..99_999
+        self.values = [i * 7_919 % 100_000 for i in range(100_000)]
+
+    def test_tdigest(self):
+        estimates = ChainIterable(self.values).quantiles((0, 0.5, 0.95, 0.99, 0.999, 1)).core
+        self.assertEqual((estimates[0], estimates[-1]), (0, 99_999))
+        for q, estimate in zip((0.5, 0.95, 0.99, 0.999), estimates[1:-1]):
+            self.assertLess(abs(estimate - q * 100_000), 100)
+
+    def test_kll(self):
+        estimates = ChainIterable(self.values).quantiles((0.5, 0.9), 'kll', size=400).core
+        for q, estimate in zip((0.5, 0.9), estimates):
+            self.assertLess(abs(estimate - q * 100_000), 1_000)
+
+    def test_merge_shards(self):
+        for method in ('tdigest', 'kll'):
+            shards = [ChainIterable(self.values[i::4]).quantiles((), method, sketch=True) for i in range(4)]
+            merged = pickle.loads(pickle.dumps(shards[0]))
+            for shard in shards[1:]:
+                merged.merge(pickle.loads(pickle.dumps(shard)))
+            self.assertEqual(merged.count, 100_000)
+            self.assertLess(abs(merged.quantile(0.75) - 75_000), 1_000)
+
+    def test_edge_cases(self):
+        self.assertEqual(ChainIterable(()).quantiles((0.5,)).core, [None])
+        self.assertEqual(ChainIterable([7]).quantiles((0.1, 0.9), 'kll').core, [7, 7])
+        self.assertRaises(ValueError, lambda: ChainIterable([1]).quantiles((1.5,)))
+        self.assertRaises(ValueError, lambda: ChainIterable([1]).quantiles((0.5,), 'exact'))
+
+    @skipUnless(np is not None, 'NumPy is not installed')
+    def test_numpy_batches(self):
+        estimates = ChainIterable(self.values).batches(4_096, backend='numpy').quantiles((0.25,)).core
+        self.assertLess(abs(estimates[0] - 25_000), 100)
+
+
+class Sampling(TestCase):
+    def test_uniform(self):
+        counts = [0] * 20
+        for seed in range(3_000):
+            sample = ChainIterable(iter(range(20))).sample(4, seed=seed).core
+            self.assertEqual(sample, sorted(sample))
+            for value in sample:
+                counts[value] += 1
+        # Each value is expected 600 times
+        self.assertLess(max(counts) - min(counts), 150)
+
+    def test_sequences(self):
+        sample = ChainRange(10 ** 15).sample(5, seed=1).core
+        self.assertEqual(len(set(sample)), 5)
+        self.assertEqual(ChainRange(10 ** 15).sample(5, seed=1).core, sample)
+        self.assertEqual(ChainSequence('abc').sample(10).core, ['a', 'b', 'c'])
+        self.assertEqual(ChainIterable(iter(range(10))).sample(0).core, [])
+        self.assertRaises(ValueError, lambda: ChainIterable(range(10)).sample(-1))
+
+    def test_weighted(self):
+        counts = {1: 0, 3: 0}
+        for seed in range(4_000):
+            for value in ChainIterable((1, 3, 0)).sample_weighted(1, lambda v: v, seed=seed):
+                counts[value] += 1
+        self.assertLess(abs(counts[3] - 3_000), 150)
+        self.assertEqual(ChainIterable(range(5)).sample_weighted(10, lambda v: v).core, [1, 2, 3, 4])
+        self.assertRaises(ValueError, lambda: ChainIterable((1, -1)).sample_weighted(1, lambda v: v))
+
+    def test_sample_by(self):
+        strata = ChainIterable(range(10_000)).sample_by(lambda v: v % 3, 10, seed=0).collect(dict).core
+        self.assertEqual(list(strata), [0, 1, 2])
+        for key, sample in strata.items():
+            self.assertEqual(len(sample), 10)
+            self.assertEqual(sample, sorted(sample))
+            self.assertTrue(all(value % 3 == key for value in sample))
+
+
+class Windows(TestCase):
+    def test_windows(self):
+        for source in (list(range(3_000)), lambda: iter(range(3_000))):
+            for size, step in ((1, 1), (5, 1), (5, 7), (2_000, 3), (4, 4)):
+                windows = ChainIterable(source() if callable(source) else source).windows(size, step).collect(list)
+                expected = [list(range(i, i + size)) for i in range(0, 3_001 - size, step)]
+                self.assertEqual([list(window) for window in windows], expected)
+        self.assertEqual(ChainIterable(iter(range(3))).windows(4).collect(list).core, [])
+        self.assertRaises(ValueError, lambda: ChainIterable(range(3)).windows(2, 0))
+
+    def test_rolling(self):
+        values = [(i * 7_919 % 1_000) / 7 + 1e6 for i in range(3_000)]
+        references = {'sum': sum, 'mean': lambda w: sum(w) / len(w), 'var': pvariance, 'std': pstdev,
+                      'min': min, 'max': max}
+        for agg, reference in references.items():
+            for size in (1, 4, 100):
+                expected = [reference(values[i:i + size]) for i in range(len(values) - size + 1)]
+                rolled = ChainIterable(iter(values)).rolling(size, agg).core
+                for estimate, exact in zip_longest(rolled, expected):
+                    self.assertAlmostEqual(estimate, exact, delta=1e-6 * max(abs(exact), 1))
+        self.assertEqual(ChainIterable((1, 2, 3, 4)).rolling(3, 'var', ddof=1).collect(list).core, [1.0, 1.0])
+        self.assertRaises(ValueError, lambda: ChainIterable(range(3)).rolling(2, 'median'))
+        self.assertRaises(ValueError, lambda: ChainIterable(range(3)).rolling(1, 'std', ddof=1))
+
+    @skipUnless(np is not None, 'NumPy is not installed')
+    def test_numpy_batches(self):
+        values = np.arange(1_000, dtype='d') % 37
+        for agg in ('sum', 'mean', 'var', 'std', 'min', 'max'):
+            for size in (1, 10, 300):
+                rolled = ChainIterable(values).batches(128, backend='numpy').rolling(size, agg).collect(list).core
+                expected = list(ChainIterable(values.tolist()).rolling(size, agg))
+                np.testing.assert_allclose(np.concatenate(rolled), expected, atol=1e-7)
+
+    @skipUnless(np is not None, 'NumPy is not installed')
+    def test_numpy_trend(self):
+        # Large-magnitude trend with the batches much longer than the windows
+        values = 1_000 * np.arange(200_000) + np.random.default_rng(0).standard_normal(200_000)
+        for agg, size in (('std', 2), ('var', 10), ('sum', 3), ('mean', 50)):
+            batches = ChainIterable(values).batches(100_000, backend='numpy')
+            rolled = np.concatenate(batches.rolling(size, agg).collect(list).core)
+            expected = list(ChainIterable(values.tolist()).rolling(size, agg))
+            np.testing.assert_allclose(rolled, expected, rtol=1e-7)
+
+
+class HashGrouping(TestCase):
+    def test_in_memory(self):
+        words = ('apple', 'bob', 'cat', 'apple', 'dog', 'bob', 'apple')
+        self.assertEqual(ChainIterable(words).count_by().collect(dict).core, {'apple': 3, 'bob': 2, 'cat': 1, 'dog': 1})
+        self.assertEqual(ChainIterable(words).group_by(len).collect(dict).core,
+                         {5: ['apple', 'apple', 'apple'], 3: ['bob', 'cat', 'dog', 'bob']})
+        self.assertEqual(ChainIterable(words).reduce_by_key(len, lambda a, b: a + b[0]).collect(dict).core,
+                         {5: 'appleaa', 3: 'bobcdb'})
+
+    def test_lazy(self):
+        consumed = []
+        grouped = ChainIterable(range(5)).inspect(consumed.append).group_by(lambda x: x % 2)
+        self.assertEqual(consumed, [])
+        self.assertEqual(grouped.first(), (0, [0, 2, 4]))
+
+    def test_spilled(self):
+        directory = tempfile.mkdtemp()
+        events = ChainIterable(range(60_000)).map(lambda i: (i * 7 % 5_000, i % 10)).cache()
+        expected_counts = events.count_by(itemgetter(0)).collect(dict).core
+        counts = events.count_by(itemgetter(0), max_keys=100, spill_dir=directory).collect(dict).core
+        self.assertEqual(counts, expected_counts)
+        add = lambda total, event: total + event[1]
+        totals = events.reduce_by_key(itemgetter(0), add, 0, max_keys=300, spill_dir=directory).collect(dict).core
+        self.assertEqual(totals, events.reduce_by_key(itemgetter(0), add, 0).collect(dict).core)
+        groups = events.group_by(itemgetter(1), max_keys=3, spill_dir=directory).collect(dict).core
+        self.assertEqual({key: len(group) for key, group in groups.items()}, {key: 6_000 for key in range(10)})
+        self.assertEqual(groups[7][:2], [(7 * 7 % 5_000, 7), (17 * 7 % 5_000, 7)])
+        self.assertEqual(os.listdir(directory), [])
+        os.rmdir(directory)
+        self.assertRaises(ValueError, lambda: events.count_by(max_keys=0))
+        self.assertRaises(ValueError, lambda: events.group_by(itemgetter(0), max_keys=0))
+        self.assertRaises(ValueError, lambda: events.reduce_by_key(itemgetter(0), add, max_keys=-1))
+
+
+class ProcessParallel(TestCase):
+    def test_unordered(self):
+        result = ChainRange(1_000).par_map(abs, workers=2, chunk_size=7, ordered=False).collect(sorted)
+        self.assertEqual(result.core, list(range(1_000)))
+
+    def test_exception(self):
+        self.assertRaises(
+            ValueError,
+            lambda: ChainIterable(('1', '2', 'x', '4')).par_map(int, workers=2, chunk_size=1).run()
+        )
+        self.assertRaises(ValueError, lambda: ChainRange(3).par_map(abs, chunk_size=0))
+        self.assertRaises(ValueError, lambda: ChainRange(3).par_map(abs, max_in_flight=0))
+        self.assertRaisesRegex(ValueError, 'Number of workers', lambda: ChainRange(3).par_map(abs, workers=0))
+        self.assertRaisesRegex(
+            ValueError,
+            'Number of workers',
+            lambda: ChainRange(3).par_filter(bool, workers=-1, max_in_flight=2)
+        )
+
+    def test_results_preceding_exception(self):
+        results = []
+        with self.assertRaises(ValueError):
+            for value in ChainIterable(('1', '2', 'x', '4')).par_map(int, workers=2, chunk_size=1):
+                results.append(value)
+        self.assertEqual(results, [1, 2])
+
+    def test_early_stop(self):
+        self.assertEqual(ChainRange(10 ** 9).par_map(str, workers=2).take(3).collect(tuple).core, ('0', '1', '2'))
+
+
+class ThreadParallel(TestCase):
+    def test_overlapping_calls(self):
+        from threading import Barrier
+        barrier = Barrier(8, timeout=5)
+
+        def blocking(value):
+            barrier.wait()
+            return value
+
+        self.assertEqual(ChainRange(16).thread_map(blocking, workers=8).collect(tuple).core, tuple(range(16)))
+
+    def test_first_exception_is_propagated(self):
+        from time import sleep
+
+        def failing(value):
+            if value == 3:
+                raise KeyError(value)
+            sleep(0.01)
+            return value
+
+        self.assertRaises(KeyError, lambda: ChainRange(1_000).thread_map(failing, workers=4).run())
+        self.assertRaises(KeyError, lambda: ChainRange(1_000).thread_foreach(failing, workers=4))
+        self.assertRaises(ValueError, lambda: ChainRange(3).thread_map(abs, prefetch=0))
+        self.assertRaisesRegex(ValueError, 'Number of workers', lambda: ChainRange(3).thread_map(abs, workers=0))
+        self.assertRaisesRegex(
+            ValueError,
+            'Number of workers',
+            lambda: ChainRange(3).thread_foreach(abs, workers=-1, prefetch=2)
+        )
+
+    def test_exception_is_not_delayed_by_slow_calls(self):
+        from threading import Event
+        from time import monotonic
+        release = Event()
+
+        def failing(value):
+            if not value:
+                release.wait(5)
+            elif value == 1:
+                raise KeyError(value)
+            return value
+
+        start = monotonic()
+        self.assertRaises(KeyError, lambda: ChainRange(4).thread_map(failing, workers=2).run())
+        elapsed = monotonic() - start
+        release.set()
+        self.assertLess(elapsed, 2)
+
+
+class AsyncChain(TestCase):
+    def test_init(self):
+        self.assertRaisesRegex(
+            TypeError,
+            'Cannot initialize an instance of `ChainAsyncIterable` ',
+            lambda: ChainAsyncIterable(3)
+        )
+        self.assertRaises(ValueError, lambda: ChainAsyncIterable(range(3)).map(abs, concurrency=0))
+
+    def test_concurrency_limit(self):
+        import asyncio
+        running = 0
+        max_running = 0
+
+        async def job(value):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return value
+
+        result = asyncio.run(ChainAsyncIterable(range(50)).map(job, concurrency=5).collect(list))
+        self.assertEqual(result.core, list(range(50)))
+        self.assertEqual(max_running, 5)
+
+    def test_exception(self):
+        import asyncio
+
+        async def job(value):
+            await asyncio.sleep(0.001 * value)
+            return 1 // (value - 3)
+
+        self.assertRaises(
+            ZeroDivisionError,
+            lambda: asyncio.run(ChainAsyncIterable(range(10)).map(job, concurrency=4, ordered=False).collect(list))
+        )
+
+    def test_early_stop_cancels_tasks(self):
+        import asyncio
+
+        async def job(value):
+            await asyncio.sleep(0.001 if value < 2 else 10)
+            return value
+
+        async def main():
+            chain = ChainAsyncIterable(range(10))
+            first = await chain.map(job, concurrency=5).first()
+            taken = await chain.map(job, concurrency=5).take(2).collect(list)
+            # Lets the cancelled tasks handle the cancellation
+            await asyncio.sleep(0)
+            self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()})
+            return first, taken.core
+
+        self.assertEqual(asyncio.run(main()), (0, [0, 1]))
+
+
 class Seq(TestCase):
     def test_wrong_ellipsis_position(self):
         self.assertRaisesRegex(